@@ -0,0 +1,432 @@
+import asyncio
+import itertools
+import json
+import logging
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from contextlib import asynccontextmanager
+
+from browser import build_chrome_options
+from driver_cache import CHROME_VERSION_COMMANDS
+from experimental_file import (HASHTAG_MISSING_XPATH, HOME_FEED_XPATH, POSTS_PER_PROFILE,
+                               PROFILE_UNAVAILABLE_XPATH)
+from extractors import (EXPLORE_FIELDS, EXTRACT_SCRIPT, GRID_FIELDS, GRID_POST_XPATH, HASHTAG_FIELDS, POST_FIELDS,
+                        POST_USERNAME_XPATH, PROFILE_FIELDS, build_profile_metrics, finish_post_record,
+                        post_fields_from_dom)
+from page_json import EMBEDDED_DATA_SCRIPT, load_json, post_from_embedded, profile_from_embedded
+from post_cache import PostCache, canonical_post_url, shortcode_from_url
+from scoring import EarlyExitReport, Thresholds, qualifies, score_profile
+from session_store import SESSION_COOKIE, SessionStore
+from waits import READY, SLEEP, LatencyReport, PacingPolicy
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+logger = logging.getLogger(__name__)
+
+# Returns true when an XPath matches anything in the page
+EXISTS_SCRIPT = """
+return document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;
+"""
+
+# Like EXISTS_SCRIPT, but only once the document marked stale before navigating has been replaced
+READY_SCRIPT = "if (window.__finderStale) { return false; }" + EXISTS_SCRIPT
+
+
+class CDPError(Exception):
+    """A DevTools command returned an error or a script threw"""
+
+
+class CDPConnection:
+    """One DevTools websocket to the browser; tab sessions are multiplexed over it (flatten mode)"""
+
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.ids = itertools.count(1)
+        self.pending = {}
+        self.reader = asyncio.ensure_future(self._read())
+
+    @classmethod
+    async def connect(cls, ws_url):
+        if websockets is None:
+            raise ImportError("websockets is required for the async finder (pip install websockets)")
+        # Embedded page JSON can run to several MB, so don't cap message size
+        return cls(await websockets.connect(ws_url, max_size=None))
+
+    async def send(self, method, params=None, session_id=None, timeout=30):
+        """Send a command and return its result"""
+        message_id = next(self.ids)
+        message = {'id': message_id, 'method': method, 'params': params or {}}
+        if session_id:
+            message['sessionId'] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self.pending[message_id] = future
+        await self.websocket.send(json.dumps(message))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self.pending.pop(message_id, None)
+
+    async def _read(self):
+        try:
+            async for raw in self.websocket:
+                message = load_json(raw)
+                # Events are ignored; readiness is polled instead
+                future = self.pending.get(message.get('id'))
+                if future is None or future.done():
+                    continue
+                if 'error' in message:
+                    future.set_exception(CDPError(message['error'].get('message', str(message['error']))))
+                else:
+                    future.set_result(message.get('result', {}))
+        except Exception as e:
+            logger.error(f"DevTools connection closed: {str(e)}")
+        finally:
+            for future in list(self.pending.values()):
+                if not future.done():
+                    future.set_exception(ConnectionError("DevTools connection closed"))
+
+    async def close(self):
+        await self.websocket.close()
+        self.reader.cancel()
+
+
+class CDPTab:
+    """A browser tab driven over a shared CDPConnection"""
+
+    def __init__(self, connection, target_id, session_id):
+        self.connection = connection
+        self.target_id = target_id
+        self.session_id = session_id
+        self.navigations = 0
+
+    @classmethod
+    async def open(cls, connection):
+        target = await connection.send("Target.createTarget", {'url': "about:blank"})
+        attached = await connection.send("Target.attachToTarget", {'targetId': target['targetId'], 'flatten': True})
+        tab = cls(connection, target['targetId'], attached['sessionId'])
+        await tab.send("Page.enable")
+        return tab
+
+    async def send(self, method, params=None, timeout=30):
+        return await self.connection.send(method, params, session_id=self.session_id, timeout=timeout)
+
+    async def run_script(self, script, *args):
+        """Run a Selenium-style script body (uses arguments[i], ends with return) and return its JSON value"""
+        expression = f"(function() {{{script}}}).apply(null, {json.dumps(list(args))})"
+        result = await self.send("Runtime.evaluate", {'expression': expression, 'returnByValue': True,
+                                                       'awaitPromise': True})
+        if 'exceptionDetails' in result:
+            raise CDPError(result['exceptionDetails'].get('text', "script error"))
+        return result['result'].get('value')
+
+    async def load(self, url, ready_xpath, timeout=15, poll_frequency=0.1):
+        """Navigate without blocking the event loop and return True once ready_xpath matches on the new page"""
+        await self.run_script("window.__finderStale = true;")
+        await self.send("Page.navigate", {'url': url})
+        self.navigations += 1
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            try:
+                if await self.run_script(READY_SCRIPT, ready_xpath):
+                    return True
+            except CDPError:
+                # The execution context is swapped out mid-navigation
+                pass
+            await asyncio.sleep(poll_frequency)
+        return False
+
+    async def close(self):
+        await self.connection.send("Target.closeTarget", {'targetId': self.target_id})
+
+
+def _chrome_binary():
+    platform = 'linux' if sys.platform.startswith('linux') else sys.platform
+    for command in CHROME_VERSION_COMMANDS.get(platform, []):
+        if command[0] != "reg" and (shutil.which(command[0]) or command[0].startswith("/")):
+            return shutil.which(command[0]) or command[0]
+    raise FileNotFoundError("Could not find a Chrome binary; pass chrome_binary explicitly")
+
+
+def _debugger_url(port, timeout=20):
+    deadline = time.time() + timeout
+    while True:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/json/version", timeout=2) as response:
+                return json.load(response)['webSocketDebuggerUrl']
+        except OSError:
+            if time.time() > deadline:
+                raise
+            time.sleep(0.2)
+
+
+def _to_cdp_cookie(cookie):
+    """Convert a Selenium cookie dict to a Network.CookieParam"""
+    converted = {k: cookie[k] for k in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly') if k in cookie}
+    if 'expiry' in cookie:
+        converted['expires'] = cookie['expiry']
+    if cookie.get('sameSite') in ('Strict', 'Lax', 'None'):
+        converted['sameSite'] = cookie['sameSite']
+    return converted
+
+
+class AsyncInstagramFinder:
+    """Asyncio version of the finder's discovery and analysis pipeline over one browser
+
+    Every page load runs in its own tab on a single DevTools connection; a semaphore caps how many
+    tabs are in flight. Extraction reuses the embedded-JSON and XPath extractors of the sync finder,
+    and the session is restored from the sync finder's cookie jar (run its login() once to create it).
+    """
+
+    def __init__(self, connection, process=None, max_tabs=8, pacing=None, session_path="instagram_session.json",
+                 cache_path="post_cache.sqlite", cache_ttl=6 * 3600, cache_max_entries=5000):
+        self.connection = connection
+        self.process = process
+        self.semaphore = asyncio.Semaphore(max_tabs)
+        self.idle_tabs = []
+        self.tabs = []
+        self.latency = LatencyReport()
+        self.pacing = pacing or PacingPolicy()
+        self.session_store = SessionStore(session_path) if session_path else None
+        self.post_cache = PostCache(cache_path, ttl=cache_ttl, max_entries=cache_max_entries) if cache_path else None
+        self.known_posts = {}
+        self.thresholds = Thresholds()
+        self.early_exits = EarlyExitReport()
+
+    @classmethod
+    async def launch(cls, headless=True, user_data_dir=None, port=9222, chrome_binary=None, **kwargs):
+        """Start Chrome with remote debugging and connect to it"""
+        arguments = [chrome_binary or _chrome_binary(), f"--remote-debugging-port={port}"]
+        arguments += build_chrome_options(headless, user_data_dir or tempfile.mkdtemp(prefix="finder-")).arguments
+        process = subprocess.Popen(arguments, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        ws_url = await asyncio.get_running_loop().run_in_executor(None, _debugger_url, port)
+        return cls(await CDPConnection.connect(ws_url), process, **kwargs)
+
+    @classmethod
+    async def connect(cls, ws_url, **kwargs):
+        """Attach to an already running browser's DevTools websocket"""
+        return cls(await CDPConnection.connect(ws_url), **kwargs)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @asynccontextmanager
+    async def tab(self):
+        """Borrow a tab, opening one if none is idle; waits while max_tabs are busy"""
+        async with self.semaphore:
+            tab = self.idle_tabs.pop() if self.idle_tabs else await self._new_tab()
+            try:
+                yield tab
+            finally:
+                self.idle_tabs.append(tab)
+
+    async def _new_tab(self):
+        tab = await CDPTab.open(self.connection)
+        self.tabs.append(tab)
+        return tab
+
+    async def _pause(self, low, high, label):
+        seconds = random.uniform(low, high) * self.pacing.scale
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+            self.latency.add(SLEEP, label, seconds)
+
+    async def _open(self, tab, url, ready_xpath, label):
+        start = time.time()
+        ready = await tab.load(url, ready_xpath)
+        self.latency.add(READY, label, time.time() - start)
+        if not ready:
+            logger.warning(f"Timed out waiting for {label} to become ready")
+        await self._pause(*self.pacing.after_load, label)
+        return ready
+
+    async def restore_session(self):
+        """Install the saved session cookies and check that the home feed loads"""
+        cookies = self.session_store.load() if self.session_store else None
+        if not cookies:
+            logger.warning("No saved session; run EnhancedInstagramFinder.login() once to create one")
+            return False
+        await self.connection.send("Storage.setCookies", {'cookies': [_to_cdp_cookie(c) for c in cookies]})
+        async with self.tab() as tab:
+            await self._open(tab, "https://www.instagram.com/", f"{HOME_FEED_XPATH} | //input[@name='password']",
+                             "session_check")
+            logged_out = await tab.run_script(EXISTS_SCRIPT, "//input[@name='password']")
+        if logged_out:
+            logger.info(f"Saved session ({SESSION_COOKIE}) is no longer valid")
+            return False
+        return True
+
+    async def _post_urls(self, url, ready_xpath, fields, label, scrolls):
+        async with self.tab() as tab:
+            if not await self._open(tab, url, ready_xpath, label):
+                return []
+            if await tab.run_script(EXISTS_SCRIPT, HASHTAG_MISSING_XPATH):
+                logger.warning(f"No posts on {url}")
+                return []
+            for _ in range(scrolls):
+                await tab.run_script("window.scrollBy(0, window.innerHeight);")
+                await self._pause(1, 2, "scroll")
+            urls = await tab.run_script(EXTRACT_SCRIPT, fields)
+        return list(dict.fromkeys(url for url in urls['post_urls'] if url and '/p/' in url))
+
+    async def explore_page(self):
+        """Return trending post URLs from the explore page"""
+        post_urls = await self._post_urls("https://www.instagram.com/explore/", "//a[contains(@href, '/p/')]",
+                                          EXPLORE_FIELDS, "explore", 5)
+        logger.info(f"Found {len(post_urls)} posts on explore page")
+        return post_urls
+
+    async def search_hashtag(self, hashtag):
+        """Return a hashtag's recent post URLs"""
+        post_urls = await self._post_urls(f"https://www.instagram.com/explore/tags/{hashtag}/",
+                                          f"{GRID_POST_XPATH} | {HASHTAG_MISSING_XPATH}", HASHTAG_FIELDS, "hashtag", 3)
+        logger.info(f"Found {len(post_urls)} posts for hashtag #{hashtag}")
+        return post_urls
+
+    def _known_post(self, post_url):
+        shortcode = shortcode_from_url(post_url)
+        if not shortcode:
+            return None
+        known = self.known_posts.get(shortcode)
+        if known is None and self.post_cache is not None:
+            known = self.post_cache.get(shortcode)
+            if known:
+                self.known_posts[shortcode] = known
+        return dict(known, post_url=post_url) if known else None
+
+    async def extract_post_data(self, post_url):
+        """Extract a post's engagement data, embedded JSON first and XPath for anything missing"""
+        known = self._known_post(post_url)
+        if known:
+            return known
+        shortcode = shortcode_from_url(post_url)
+        try:
+            async with self.tab() as tab:
+                if not await self._open(tab, post_url, POST_USERNAME_XPATH, "post"):
+                    logger.error(f"Post did not load: {post_url}")
+                    return None
+                start = time.time()
+                fields, tier = post_from_embedded(await tab.run_script(EMBEDDED_DATA_SCRIPT), shortcode)
+                if tier is None:
+                    raw = await tab.run_script(EXTRACT_SCRIPT, POST_FIELDS)
+                    for key, value in post_fields_from_dom(raw).items():
+                        fields.setdefault(key, value)
+                self.latency.add("extract", "post", time.time() - start)
+            post_data = finish_post_record(fields, post_url)
+            if shortcode:
+                self.known_posts[shortcode] = post_data
+                if self.post_cache is not None:
+                    self.post_cache.set(shortcode, post_data)
+            return post_data
+        except Exception as e:
+            logger.error(f"Error extracting post data: {str(e)}")
+            return None
+
+    async def analyze_creator_profile(self, username, thresholds=None):
+        """Analyze a profile's header and recent posts, loading the posts concurrently"""
+        try:
+            async with self.tab() as tab:
+                await self._open(tab, f"https://www.instagram.com/{username}/",
+                                 f"//header | {PROFILE_UNAVAILABLE_XPATH}", "profile")
+                if await tab.run_script(EXISTS_SCRIPT, PROFILE_UNAVAILABLE_XPATH):
+                    logger.warning(f"Account @{username} doesn't exist or is private")
+                    return None
+
+                metrics, tier = profile_from_embedded(await tab.run_script(EMBEDDED_DATA_SCRIPT), username)
+                if tier is None:
+                    raw = await tab.run_script(EXTRACT_SCRIPT, PROFILE_FIELDS)
+                    for key, value in build_profile_metrics(raw, username).items():
+                        metrics.setdefault(key, value)
+
+                post_urls = []
+                if thresholds and metrics.get('followers', 0) < thresholds.min_followers:
+                    self.early_exits.record('followers', POSTS_PER_PROFILE)
+                else:
+                    post_urls = (await tab.run_script(EXTRACT_SCRIPT, GRID_FIELDS))['post_urls']
+
+            # The profile tab is released first so post loads can use it
+            recent_urls = list(dict.fromkeys(url for url in post_urls if url))[:POSTS_PER_PROFILE]
+            results = await asyncio.gather(*(self.extract_post_data(url) for url in recent_urls))
+            post_data = [data for data in results if data]
+
+            profile_data = {
+                'username': username,
+                'name': metrics.get('name', ''),
+                'bio': metrics.get('bio', ''),
+                'category': metrics.get('category', ''),
+                'is_creator_account': metrics.get('is_creator_account', False),
+                'followers': metrics.get('followers', 0)
+            }
+            profile_data.update(score_profile(post_data, self.thresholds))
+            profile_data['recent_posts'] = post_data
+            return profile_data
+        except Exception as e:
+            logger.error(f"Error analyzing profile: {str(e)}")
+            return None
+
+    async def iter_viral_creators(self, industry_tags=None, min_followers=1000, min_engagement=5.0):
+        """Yield qualified creator profiles as their analyses finish
+
+        Discovery covers hashtags and the explore page; keyword and suggested-account discovery
+        need UI interaction and stay with the sync finder.
+        """
+        if industry_tags is None:
+            industry_tags = ["viral", "trending", "creator", "contentcreator"]
+        self.thresholds = Thresholds(min_followers=min_followers, min_engagement=min_engagement)
+        self.known_posts = {}
+        self.early_exits = EarlyExitReport()
+        self.latency.reset()
+
+        url_lists = await asyncio.gather(self.explore_page(), *(self.search_hashtag(tag) for tag in industry_tags))
+        post_urls = {}
+        for url in itertools.chain.from_iterable(url_lists):
+            shortcode = shortcode_from_url(url)
+            if shortcode:
+                post_urls.setdefault(shortcode, canonical_post_url(url))
+        logger.info(f"Fetching {len(post_urls)} unique discovered posts")
+
+        posts = await asyncio.gather(*(self.extract_post_data(url) for url in post_urls.values()))
+        usernames = list(dict.fromkeys(post['username'] for post in posts if post))
+        logger.info(f"Found {len(usernames)} potential creators. Analyzing profiles...")
+
+        analyses = [asyncio.ensure_future(self.analyze_creator_profile(username, self.thresholds))
+                    for username in usernames]
+        try:
+            for analysis in asyncio.as_completed(analyses):
+                profile_data = await analysis
+                if profile_data and qualifies(profile_data, self.thresholds):
+                    logger.info(f"✅ Qualified viral creator: @{profile_data['username']}")
+                    yield profile_data
+        finally:
+            for analysis in analyses:
+                analysis.cancel()
+            self.early_exits.log(self.latency)
+            self.latency.log()
+
+    async def find_viral_creators(self, industry_tags=None, min_followers=1000, min_engagement=5.0):
+        """Return every qualified creator profile (see iter_viral_creators)"""
+        return [profile_data async for profile_data in
+                self.iter_viral_creators(industry_tags, min_followers, min_engagement)]
+
+    async def close(self):
+        """Close every tab, the DevTools connection and a browser started by launch()"""
+        for tab in self.tabs:
+            try:
+                await tab.close()
+            except Exception as e:
+                logger.error(f"Error closing tab: {e}")
+        await self.connection.close()
+        if self.process:
+            self.process.terminate()
+        if self.post_cache is not None:
+            self.post_cache.close()
@@ -0,0 +1,128 @@
+"""Offline benchmark of the finder's extractors against a recorded page corpus
+
+Record a corpus during a normal run with EnhancedInstagramFinder(..., record_dir="corpus"), then:
+
+    python bench_extractors.py corpus --output bench.json
+    python bench_extractors.py corpus --baseline bench.json --tolerance 0.25
+
+With --baseline the script exits non-zero when pages/sec or per-field extraction time regress by
+more than the tolerance, so it can gate CI without network access.
+"""
+import argparse
+import json
+import logging
+import sys
+import time
+from collections import defaultdict
+
+from browser import create_driver
+from experimental_file import EnhancedInstagramFinder
+from extractors import GRID_FIELDS, POST_FIELDS, PROFILE_FIELDS, run_extraction
+from replay import ReplayDriver, ReplayServer
+from waits import PacingPolicy
+
+logger = logging.getLogger(__name__)
+
+
+def _time_fields(driver, fields, timings, prefix):
+    """Time each field of a spec on its own so regressions can be traced to one selector chain"""
+    for name, spec in fields.items():
+        start = time.perf_counter()
+        run_extraction(driver, {name: spec})
+        timings[f"{prefix}.{name}"].append(time.perf_counter() - start)
+
+
+def run_benchmark(corpus_dir, repeat=1):
+    """Replay every recorded page through the finder and return throughput and per-field timings"""
+    server = ReplayServer(corpus_dir).start()
+    driver = ReplayDriver(create_driver(headless=True), server)
+    # No caches or persisted stats, so every pass loads its pages and the user's own files are left alone
+    finder = EnhancedInstagramFinder(None, None, cache_path=None, pacing=PacingPolicy(scale=0), driver=driver,
+                                     selector_stats_path=None, creator_cache_path=None)
+
+    pages = defaultdict(lambda: {'pages': 0, 'seconds': 0.0})
+    fields = defaultdict(list)
+
+    def timed(page_type, func):
+        start = time.perf_counter()
+        result = func()
+        pages[page_type]['pages'] += 1
+        pages[page_type]['seconds'] += time.perf_counter() - start
+        return result
+
+    try:
+        for _ in range(repeat):
+            # Posts remembered from the previous pass would be answered without loading their page
+            finder.known_posts = {}
+            for url in server.pages("post"):
+                timed("post", lambda: finder.extract_post_data(url))
+                _time_fields(driver, POST_FIELDS, fields, "post")
+
+            for url in server.pages("profile"):
+                timed("profile", lambda: finder._open(url, "//header", "profile"))
+                _time_fields(driver, PROFILE_FIELDS, fields, "profile")
+                _time_fields(driver, GRID_FIELDS, fields, "profile")
+
+            for url in server.pages("hashtag"):
+                tag = url.rstrip("/").split("/")[-1]
+                timed("hashtag", lambda: finder.search_hashtag(tag))
+
+            if server.pages("explore"):
+                timed("explore", finder.explore_page)
+    finally:
+        finder.close()
+
+    return {
+        'pages': {
+            page_type: {
+                'pages': entry['pages'],
+                'seconds': round(entry['seconds'], 4),
+                'pages_per_sec': round(entry['pages'] / entry['seconds'], 2) if entry['seconds'] else 0.0
+            }
+            for page_type, entry in pages.items()
+        },
+        'fields_ms': {name: round(sum(samples) / len(samples) * 1000, 3) for name, samples in sorted(fields.items())}
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of regressions beyond tolerance relative to a baseline result"""
+    regressions = []
+    for page_type, entry in baseline.get('pages', {}).items():
+        current = results['pages'].get(page_type)
+        if current and current['pages_per_sec'] < entry['pages_per_sec'] * (1 - tolerance):
+            regressions.append(f"{page_type}: {current['pages_per_sec']} pages/sec "
+                               f"(baseline {entry['pages_per_sec']})")
+    for name, baseline_ms in baseline.get('fields_ms', {}).items():
+        current_ms = results['fields_ms'].get(name)
+        if current_ms is not None and current_ms > baseline_ms * (1 + tolerance):
+            regressions.append(f"{name}: {current_ms} ms (baseline {baseline_ms} ms)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark EnhancedInstagramFinder extractors offline")
+    parser.add_argument("corpus", help="Directory written by PageRecorder")
+    parser.add_argument("--repeat", type=int, default=1, help="Passes over the corpus")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--baseline", help="Fail when results regress against this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed regression fraction")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.corpus, repeat=args.repeat)
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            logger.error(f"Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+
+from driver_cache import DriverCache
+
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36")
+
+
+def build_chrome_options(headless=False, user_data_dir=None, performance_log=False):
+    """Build the Chrome options shared by every browser session the finder starts
+
+    user_data_dir points Chrome at a persistent profile so cookies survive between runs.
+    performance_log enables the DevTools network event log used to count bytes per page.
+    """
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless")
+    if user_data_dir:
+        chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-notifications")
+    chrome_options.add_argument("--disable-infobars")
+    chrome_options.add_argument("--lang=en-US")
+    chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+
+    # Add experimental flags to handle cookie consent popups
+    chrome_options.add_experimental_option("prefs", {
+        "profile.default_content_setting_values.notifications": 2,
+        "profile.managed_default_content_settings.images": 1
+    })
+    if performance_log:
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return chrome_options
+
+
+def create_driver(headless=False, user_data_dir=None, report=None, performance_log=False):
+    """Start a maximized Chrome session with the shared options
+
+    chromedriver resolution and browser launch are timed separately into report (a LatencyReport)
+    under the 'startup' category.
+    """
+    start = time.time()
+    driver_path = DriverCache().resolve()
+    resolved = time.time()
+    driver = webdriver.Chrome(service=Service(driver_path), options=build_chrome_options(headless, user_data_dir, performance_log))
+    driver.maximize_window()
+    if report:
+        report.add("startup", "driver_resolve", resolved - start)
+        report.add("startup", "browser_launch", time.time() - resolved)
+    return driver
@@ -0,0 +1,171 @@
+import argparse
+import random
+import re
+import time
+from decimal import Decimal
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Compact-number suffixes Instagram renders across the locales we scrape, lowercased without dots
+SUFFIXES = {
+    'k': 10 ** 3, 'tsd': 10 ** 3, 'mil': 10 ** 3, 'tys': 10 ** 3, 'thousand': 10 ** 3, 'rb': 10 ** 3,
+    'm': 10 ** 6, 'mn': 10 ** 6, 'mio': 10 ** 6, 'mln': 10 ** 6, 'jt': 10 ** 6, 'million': 10 ** 6,
+    'millions': 10 ** 6, 'millones': 10 ** 6, 'milhões': 10 ** 6, 'millionen': 10 ** 6,
+    'b': 10 ** 9, 'bn': 10 ** 9, 'mrd': 10 ** 9, 'md': 10 ** 9, 'billion': 10 ** 9, 'billions': 10 ** 9
+}
+
+# Locales whose decimal separator is a comma ('1.234' is a thousand, '1,2 Mio.' is 1.2 million)
+DECIMAL_COMMA_LOCALES = {'de', 'fr', 'es', 'it', 'pt', 'nl', 'ru', 'tr', 'id', 'pl', 'sv', 'da', 'nb', 'fi', 'cs'}
+
+# A number (not glued to a preceding word, so 'user99' doesn't count) with separators and an optional suffix.
+# Thousands groups may be split by commas, dots, apostrophes or (no-break) spaces.
+COUNT_PATTERN = re.compile(
+    r"(?<![\w.,])(\d{1,3}(?:[,.'\u2019\u00a0\u202f ]\d{3})+|\d+)(?:[.,](\d+))?"
+    r"\s*(" + "|".join(sorted((re.escape(s) for s in SUFFIXES), key=len, reverse=True)) + r")?\.?(?![^\W\d_])",
+    re.IGNORECASE)
+
+
+def _comma_decimal(locale):
+    return locale.replace('_', '-').split('-')[0].lower() in DECIMAL_COMMA_LOCALES
+
+
+@lru_cache(maxsize=65536)
+def _parse(text, locale):
+    match = COUNT_PATTERN.search(text)
+    if not match:
+        raise ValueError(f"No count in {text!r}")
+    number, fraction, suffix = match.groups()
+
+    # '1,234' and '1.234' are thousands groups, except that a compact count such as '1,234K' in a locale
+    # whose decimal point is that separator reads as a decimal
+    separators = set(re.sub(r"\d", "", number))
+    if fraction is None and suffix and locale and len(separators) == 1 and number.count(number[-4]) == 1:
+        if number[-4] == (',' if _comma_decimal(locale) else '.'):
+            number, fraction = number[:-4], number[-3:]
+
+    value = Decimal(re.sub(r"\D", "", number))
+    if fraction:
+        value += Decimal(f"0.{fraction}")
+    if suffix:
+        value *= SUFFIXES[suffix.lower()]
+    return int(value)
+
+
+def parse_count(text, locale=None):
+    """Parse a displayed count such as '1,234', '12.5K', '1.2M views', '1,2 Mio.' or '3B' into an int
+
+    locale (e.g. 'de' or 'en-US') settles whether a lone ',' or '.' is a decimal point; without it a
+    separator followed by exactly three digits is read as a thousands separator. Raises ValueError
+    when text contains no count.
+    """
+    if text is None:
+        raise ValueError("No count in None")
+    return _parse(str(text).strip(), locale)
+
+
+def parse_counts(values, locale=None):
+    """Parse a pandas Series, NumPy array or list of count texts in bulk
+
+    Each distinct text is parsed once. Returns float64 values (NaN where a text has no count), as a
+    Series with the same index for Series input and as an ndarray otherwise.
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(np.asarray(values, dtype=object))
+    parsed = {}
+    for text in pd.unique(series.dropna()):
+        try:
+            parsed[text] = float(parse_count(text, locale))
+        except ValueError:
+            parsed[text] = np.nan
+    result = series.map(parsed).astype("float64")
+    return result if isinstance(values, pd.Series) else result.to_numpy()
+
+
+def generate_corpus(size=10000, seed=0):
+    """Return (text, locale, expected) triples covering the formats Instagram renders counts in"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        style = rng.choice(['plain', 'grouped', 'compact', 'compact_locale', 'grouped_locale', 'labelled'])
+        if style in ('compact', 'compact_locale'):
+            tenths = rng.randint(10, 9999)
+            suffix, multiplier = rng.choice([('K', 10 ** 3), ('M', 10 ** 6), ('B', 10 ** 9)])
+            mantissa = f"{tenths // 10}.{tenths % 10}" if tenths % 10 else str(tenths // 10)
+            expected = tenths * multiplier // 10
+            if style == 'compact':
+                corpus.append((f"{mantissa}{suffix}", None, expected))
+            else:
+                german = {'K': ' Tsd.', 'M': ' Mio.', 'B': ' Mrd.'}[suffix]
+                corpus.append((mantissa.replace('.', ',') + german, 'de', expected))
+            continue
+
+        number = rng.randint(0, 10 ** rng.randint(1, 10))
+        if style == 'plain':
+            corpus.append((str(number), None, number))
+        elif style == 'grouped':
+            corpus.append((f"{number:,}", None, number))
+        elif style == 'grouped_locale':
+            separator, locale = rng.choice([('.', 'de'), ('\u202f', 'fr'), ('\u00a0', 'ru'), ("'", None)])
+            corpus.append((f"{number:,}".replace(',', separator), locale, number))
+        else:
+            label = rng.choice(['{} likes', '{} views', 'View all {} comments', '{} followers', 'Liked by user99 and {} others'])
+            corpus.append((label.format(f"{number:,}"), None, number))
+    return corpus
+
+
+def check_corpus(corpus):
+    """Return the corpus entries parse_count gets wrong"""
+    failures = []
+    for text, locale, expected in corpus:
+        try:
+            actual = parse_count(text, locale)
+        except ValueError:
+            actual = None
+        if actual != expected:
+            failures.append((text, locale, expected, actual))
+    return failures
+
+
+def benchmark(size=100000, unique=5000, seed=0):
+    """Time scalar parsing of unique texts and batch re-parsing of a column with repeated texts"""
+    corpus = [(text, expected) for text, locale, expected in generate_corpus(unique, seed) if locale is None]
+    texts = [text for text, _ in corpus]
+
+    _parse.cache_clear()
+    start = time.perf_counter()
+    for text in texts:
+        parse_count(text)
+    scalar = time.perf_counter() - start
+
+    column = pd.Series(np.random.default_rng(seed).choice(np.asarray(texts, dtype=object), size))
+    _parse.cache_clear()
+    start = time.perf_counter()
+    parse_counts(column)
+    batch = time.perf_counter() - start
+    return {
+        'unique_texts': len(texts),
+        'scalar_us_per_text': round(scalar / len(texts) * 1e6, 2),
+        'batch_rows': size,
+        'batch_seconds': round(batch, 4),
+        'batch_rows_per_second': round(size / batch)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check parse_count against a generated corpus and benchmark it")
+    parser.add_argument("--size", type=int, default=10000, help="corpus size")
+    parser.add_argument("--rows", type=int, default=100000, help="rows in the batch benchmark column")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    failures = check_corpus(generate_corpus(args.size, args.seed))
+    for text, locale, expected, actual in failures[:20]:
+        print(f"FAIL {text!r} ({locale}): expected {expected}, got {actual}")
+    print(f"{args.size - len(failures)}/{args.size} corpus entries parsed correctly")
+    print(benchmark(args.rows, args.size, args.seed))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
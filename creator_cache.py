@@ -0,0 +1,177 @@
+import json
+import logging
+import time
+
+from sqlite_store import LockedSQLite
+
+logger = logging.getLogger(__name__)
+
+# Snapshot tiers and the profile fields each one holds; each tier has its own refresh time and TTL
+TIERS = {
+    'slow': ['name', 'bio', 'category', 'is_creator_account'],
+    'followers': ['followers'],
+    'posts': ['recent_posts']
+}
+
+# Tiers read from the profile header rather than the grid
+HEADER_TIERS = ('slow', 'followers')
+
+
+class CreatorCache(LockedSQLite):
+    """SQLite-backed snapshots of analyzed creator profiles with per-tier freshness
+
+    Slow-changing fields (name, bio, category) expire after slow_ttl; followers and recent posts after
+    fast_ttl. lookup() returns the snapshot with the tiers that need refreshing, so a profile analysis
+    can re-read only those, e.g. the follower count without reloading posts.
+
+    Every extracted grid post is also kept in a per-creator post history (up to history_limit posts)
+    along with the newest shortcode seen on the grid, so a grid re-read only needs the posts that
+    are new since the last one.
+    """
+
+    def __init__(self, path="creator_cache.sqlite", slow_ttl=7 * 24 * 3600, fast_ttl=6 * 3600, history_limit=50):
+        self.slow_ttl = slow_ttl
+        self.fast_ttl = fast_ttl
+        self.history_limit = history_limit
+        self.reset_stats()
+        super().__init__(path, [
+            "CREATE TABLE IF NOT EXISTS snapshots ("
+            " username TEXT NOT NULL,"
+            " tier TEXT NOT NULL,"
+            " data TEXT NOT NULL,"
+            " refreshed_at REAL NOT NULL,"
+            " PRIMARY KEY (username, tier))",
+            "CREATE TABLE IF NOT EXISTS post_history ("
+            " username TEXT NOT NULL,"
+            " shortcode TEXT NOT NULL,"
+            " data TEXT NOT NULL,"
+            " seen_at REAL NOT NULL,"
+            " grid_rank INTEGER NOT NULL,"
+            " PRIMARY KEY (username, shortcode))",
+            "CREATE TABLE IF NOT EXISTS grids ("
+            " username TEXT PRIMARY KEY,"
+            " newest_shortcode TEXT NOT NULL,"
+            " checked_at REAL NOT NULL)"])
+
+    def ttl(self, tier):
+        return self.slow_ttl if tier == 'slow' else self.fast_ttl
+
+    def reset_stats(self):
+        """Zero the hit/miss counters, e.g. at the start of a run"""
+        self.hits = {tier: 0 for tier in TIERS}
+        self.misses = {tier: 0 for tier in TIERS}
+        self.profiles = {'fresh': 0, 'partial': 0, 'miss': 0}
+        self.grids = {'unchanged': 0, 'changed': 0, 'new': 0}
+        self.posts = {'new': 0, 'reused': 0}
+
+    def lookup(self, username):
+        """Return (snapshot, stale) for a creator
+
+        snapshot holds the cached fields of every tier, fresh or not; stale is the set of tiers that are
+        missing or past their TTL.
+        """
+        now = time.time()
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT tier, data, refreshed_at FROM snapshots WHERE username = ?", (username,)).fetchall()
+            snapshot = {}
+            fresh = set()
+            for tier, data, refreshed_at in rows:
+                snapshot.update(json.loads(data))
+                if now - refreshed_at < self.ttl(tier):
+                    fresh.add(tier)
+
+            stale = set(TIERS) - fresh
+            for tier in TIERS:
+                if tier in stale:
+                    self.misses[tier] += 1
+                else:
+                    self.hits[tier] += 1
+            self.profiles['miss' if not fresh else 'partial' if stale else 'fresh'] += 1
+        return snapshot, stale
+
+    def update(self, username, values, tiers):
+        """Store the given tiers of a creator's snapshot from values (profile fields), marking them fresh"""
+        now = time.time()
+        with self.lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO snapshots (username, tier, data, refreshed_at) VALUES (?, ?, ?, ?)",
+                [(username, tier, json.dumps({field: values[field] for field in TIERS[tier] if field in values}), now)
+                 for tier in tiers])
+
+    def newest_shortcode(self, username):
+        """Return the newest shortcode seen on a creator's grid, or None"""
+        with self.lock:
+            row = self.conn.execute("SELECT newest_shortcode FROM grids WHERE username = ?", (username,)).fetchone()
+        return row[0] if row else None
+
+    def history(self, username, shortcodes=None):
+        """Return {shortcode: post data} from a creator's post history, optionally only for shortcodes"""
+        with self.lock:
+            rows = self.conn.execute("SELECT shortcode, data FROM post_history WHERE username = ?", (username,))
+            return {shortcode: json.loads(data) for shortcode, data in rows
+                    if shortcodes is None or shortcode in shortcodes}
+
+    def delta(self, username, shortcodes):
+        """Compare a grid (shortcodes, newest first) against the history
+
+        Returns (new shortcodes, {shortcode: post data} for the ones already in the history).
+        """
+        known = self.history(username, set(shortcodes))
+        new = [shortcode for shortcode in shortcodes if shortcode not in known]
+        newest = self.newest_shortcode(username)
+        with self.lock:
+            if newest is None:
+                self.grids['new'] += 1
+            else:
+                self.grids['unchanged' if not new and shortcodes[:1] == [newest] else 'changed'] += 1
+            self.posts['new'] += len(new)
+            self.posts['reused'] += len(known)
+        return new, known
+
+    def merge_posts(self, username, shortcodes, posts):
+        """Record a grid read: its newest shortcode and the newly extracted posts ({shortcode: post data})
+
+        The history keeps the history_limit most recently seen posts per creator.
+        """
+        now = time.time()
+        ranks = {shortcode: rank for rank, shortcode in enumerate(shortcodes)}
+        with self.lock:
+            if shortcodes:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO grids (username, newest_shortcode, checked_at) VALUES (?, ?, ?)",
+                    (username, shortcodes[0], now))
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO post_history (username, shortcode, data, seen_at, grid_rank)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [(username, shortcode, json.dumps(data), now, ranks.get(shortcode, len(shortcodes)))
+                 for shortcode, data in posts.items()])
+            self.conn.execute(
+                "DELETE FROM post_history WHERE username = ? AND shortcode NOT IN ("
+                " SELECT shortcode FROM post_history WHERE username = ?"
+                " ORDER BY seen_at DESC, grid_rank ASC LIMIT ?)",
+                (username, username, self.history_limit))
+
+    def forget(self, username):
+        """Drop a creator's snapshot and post history, e.g. once the account is gone or private"""
+        with self.lock:
+            self.conn.execute("DELETE FROM snapshots WHERE username = ?", (username,))
+            self.conn.execute("DELETE FROM post_history WHERE username = ?", (username,))
+            self.conn.execute("DELETE FROM grids WHERE username = ?", (username,))
+
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(DISTINCT username) FROM snapshots").fetchone()[0]
+
+    def stats(self):
+        """Return hit/miss counters per tier and per profile since the last reset"""
+        tiers = {}
+        for tier in TIERS:
+            lookups = self.hits[tier] + self.misses[tier]
+            tiers[tier] = {
+                'hits': self.hits[tier],
+                'misses': self.misses[tier],
+                'hit_rate': self.hits[tier] / lookups if lookups else 0.0
+            }
+        return {'profiles': dict(self.profiles), 'tiers': tiers, 'grids': dict(self.grids),
+                'posts': dict(self.posts), 'entries': len(self)}
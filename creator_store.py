@@ -0,0 +1,211 @@
+import csv
+import sys
+import threading
+from array import array
+
+import numpy as np
+import pandas as pd
+
+from post_cache import shortcode_from_url
+
+# (column, array typecode) - None marks a string column kept in a list
+CREATOR_COLUMNS = [
+    ('username', None), ('name', None), ('bio', None), ('category', None), ('is_creator_account', 'b'),
+    ('followers', 'q'), ('posts_analyzed', 'q'), ('avg_engagement_rate', 'd'), ('latest_post_engagement', 'd'),
+    ('on_hot_streak', 'b'), ('has_viral_video', 'b'), ('video_post_count', 'q'), ('image_post_count', 'q'),
+    ('viral_score', 'd')
+]
+POST_COLUMNS = [
+    ('shortcode', None), ('username', None), ('post_rank', 'q'), ('post_url', None), ('is_video', 'b'),
+    ('views', 'q'), ('likes', 'q'), ('comments', 'q'), ('has_million_views', 'b'), ('engagement_rate', 'd'),
+    ('timestamp', None), ('caption', None)
+]
+
+# Columns whose values repeat across rows and are worth interning
+INTERNED = {'username', 'category'}
+
+DTYPES = {'b': np.bool_, 'q': np.int64, 'd': np.float64}
+
+
+class CreatorRecord:
+    """One creators-table row in flight"""
+    __slots__ = [name for name, _ in CREATOR_COLUMNS]
+
+    def __init__(self, **values):
+        for name, typecode in CREATOR_COLUMNS:
+            setattr(self, name, values.get(name, "" if typecode is None else 0))
+
+    @classmethod
+    def from_profile(cls, profile_data):
+        return cls(**{name: profile_data[name] for name, _ in CREATOR_COLUMNS if name in profile_data})
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class PostRecord:
+    """One posts-table row in flight; post_rank is the post's position in the creator's grid (0 = newest)"""
+    __slots__ = [name for name, _ in POST_COLUMNS]
+
+    def __init__(self, **values):
+        for name, typecode in POST_COLUMNS:
+            setattr(self, name, values.get(name, "" if typecode is None else 0))
+
+    @classmethod
+    def from_post(cls, post_data, username=None, post_rank=0):
+        record = cls(**{name: post_data[name] for name, _ in POST_COLUMNS if name in post_data})
+        record.shortcode = shortcode_from_url(post_data['post_url']) or post_data['post_url']
+        record.username = username or post_data['username']
+        record.post_rank = post_rank
+        return record
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class ColumnTable:
+    """Append-only columns (typed arrays for numbers, lists for strings) with a unique key
+
+    key is a column name, or a tuple of column names for a composite key. Writing a row whose key
+    already exists overwrites that row in place.
+    """
+
+    def __init__(self, columns, key):
+        self.schema = columns
+        self.key = key
+        self.columns = {name: [] if typecode is None else array(typecode) for name, typecode in columns}
+        self.rows = {}
+
+    def __len__(self):
+        return len(self.columns[self.schema[0][0]])
+
+    def key_of(self, record):
+        """Return a record's key value (a tuple for a composite key)"""
+        if isinstance(self.key, tuple):
+            return tuple(getattr(record, name) for name in self.key)
+        return getattr(record, self.key)
+
+    def __contains__(self, key):
+        return key in self.rows
+
+    def write(self, record):
+        """Store a record, returning its row number"""
+        key = self.key_of(record)
+        row = self.rows.get(key)
+        for name, typecode in self.schema:
+            value = getattr(record, name)
+            if typecode is None:
+                value = sys.intern(value or "") if name in INTERNED else (value or "")
+            elif typecode == 'd':
+                value = float(value or 0)
+            else:
+                value = int(value or 0)
+            if row is None:
+                self.columns[name].append(value)
+            else:
+                self.columns[name][row] = value
+        if row is None:
+            row = self.rows[key] = len(self) - 1
+        return row
+
+    def row(self, row):
+        """Return one row as a dict with bools restored"""
+        return {name: bool(self.columns[name][row]) if typecode == 'b' else self.columns[name][row]
+                for name, typecode in self.schema}
+
+    def column(self, name):
+        """Return a column as a NumPy array (numeric columns) or object array (strings)"""
+        typecode = dict(self.schema)[name]
+        if typecode is None:
+            return np.asarray(self.columns[name], dtype=object)
+        return np.array(self.columns[name], dtype=DTYPES[typecode])
+
+    def to_frame(self, columns=None):
+        """Build a DataFrame straight from the columns, optionally only some of them"""
+        names = columns or [name for name, _ in self.schema]
+        return pd.DataFrame({name: self.column(name) for name in names})
+
+    def write_csv(self, path, chunk_size=10000):
+        """Stream the table to CSV in row chunks without materializing it"""
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow([name for name, _ in self.schema])
+            for start in range(0, len(self), chunk_size):
+                stop = min(start + chunk_size, len(self))
+                writer.writerows(zip(*(map(bool, self.columns[name][start:stop]) if typecode == 'b'
+                                       else self.columns[name][start:stop] for name, typecode in self.schema)))
+
+    def clear(self):
+        for name, typecode in self.schema:
+            self.columns[name] = [] if typecode is None else array(typecode)
+        self.rows = {}
+
+
+class CreatorStore:
+    """Columnar creators and posts tables, keyed by username and by (username, shortcode)
+
+    A collab post on several creators' grids gets a row per creator.
+
+    Profiles go in as the dicts analyze_creator_profile returns and come back out in the same shape,
+    so the store can stand in for a list of profile dicts (len, iteration, indexing).
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.creators = ColumnTable(CREATOR_COLUMNS, 'username')
+        self.posts = ColumnTable(POST_COLUMNS, ('username', 'shortcode'))
+        self.posts_by_creator = {}
+
+    def add_profile(self, profile_data):
+        """Store a profile dict and its recent_posts"""
+        with self.lock:
+            username = profile_data['username']
+            self.creators.write(CreatorRecord.from_profile(profile_data))
+            rows = array('q')
+            for rank, post_data in enumerate(profile_data.get('recent_posts') or []):
+                rows.append(self.posts.write(PostRecord.from_post(post_data, username, rank)))
+            self.posts_by_creator[username] = rows
+
+    def profile(self, username):
+        """Return a stored profile in analyze_creator_profile's dict shape"""
+        with self.lock:
+            profile_data = self.creators.row(self.creators.rows[username])
+            recent_posts = [self.posts.row(row) for row in self.posts_by_creator.get(username, [])]
+        for post_data in recent_posts:
+            del post_data['shortcode'], post_data['post_rank']
+        profile_data['recent_posts'] = recent_posts
+        return profile_data
+
+    def __len__(self):
+        return len(self.creators)
+
+    def __contains__(self, username):
+        return username in self.creators
+
+    def __iter__(self):
+        for username in list(self.creators.columns['username']):
+            yield self.profile(username)
+
+    def __getitem__(self, index):
+        usernames = self.creators.columns['username']
+        if isinstance(index, slice):
+            return [self.profile(username) for username in usernames[index]]
+        return self.profile(usernames[index])
+
+    def to_frames(self, creator_columns=None, post_columns=None):
+        """Return (creators, posts) DataFrames built from the columns"""
+        with self.lock:
+            return self.creators.to_frame(creator_columns), self.posts.to_frame(post_columns)
+
+    def export_csv(self, creators_path, posts_path=None):
+        """Stream the creators table (and the posts table when posts_path is given) to CSV"""
+        with self.lock:
+            self.creators.write_csv(creators_path)
+            if posts_path:
+                self.posts.write_csv(posts_path)
+
+    def clear(self):
+        with self.lock:
+            self.creators.clear()
+            self.posts.clear()
+            self.posts_by_creator = {}
@@ -0,0 +1,99 @@
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+logger = logging.getLogger(__name__)
+
+VERSION_PATTERN = re.compile(r"(\d+)\.\d+\.\d+(?:\.\d+)?")
+
+CHROME_VERSION_COMMANDS = {
+    'win32': [["reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version"],
+              ["reg", "query", r"HKEY_LOCAL_MACHINE\Software\Google\Chrome\BLBeacon", "/v", "version"]],
+    'darwin': [["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"]],
+    'linux': [["google-chrome", "--version"], ["google-chrome-stable", "--version"],
+              ["chromium", "--version"], ["chromium-browser", "--version"]]
+}
+
+_lock = threading.Lock()
+_resolved = {}
+
+
+def detect_chrome_version():
+    """Return the installed Chrome version from the local install (no network), or None"""
+    platform = 'linux' if sys.platform.startswith('linux') else sys.platform
+    for command in CHROME_VERSION_COMMANDS.get(platform, []):
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = VERSION_PATTERN.search(output)
+        if match:
+            return match.group(0)
+    return None
+
+
+def _major(version):
+    return version.split('.')[0] if version else None
+
+
+class DriverCache:
+    """Caches the resolved chromedriver path so ChromeDriverManager only runs when Chrome changes
+
+    chromedriver compatibility follows Chrome's major version, so the cached driver is reused until
+    the installed Chrome's major version differs from the one it was resolved for. If resolution
+    fails (e.g. offline) a previously cached driver is used anyway.
+    """
+
+    def __init__(self, path="chromedriver_cache.json"):
+        self.path = path
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except ValueError:
+            return None
+
+    def _save(self, entry):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def resolve(self):
+        """Return a chromedriver path for the installed Chrome, downloading only when needed"""
+        with _lock:
+            if self.path in _resolved:
+                return _resolved[self.path]
+
+            chrome_version = detect_chrome_version()
+            cached = self._load()
+            usable = cached and os.path.exists(cached['driver_path'])
+            if usable and (chrome_version is None or _major(chrome_version) == _major(cached['chrome_version'])):
+                logger.info(f"Using cached chromedriver {cached['driver_path']}")
+                _resolved[self.path] = cached['driver_path']
+                return cached['driver_path']
+
+            logger.info(f"Resolving chromedriver for Chrome {chrome_version or 'unknown version'}")
+            try:
+                driver_path = ChromeDriverManager().install()
+            except Exception as e:
+                if not usable:
+                    raise
+                logger.warning(f"chromedriver resolution failed ({e}); falling back to cached driver")
+                driver_path = cached['driver_path']
+            else:
+                self._save({'chrome_version': chrome_version, 'driver_path': driver_path,
+                            'resolved_at': time.time()})
+
+            _resolved[self.path] = driver_path
+            return driver_path
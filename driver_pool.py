@@ -0,0 +1,103 @@
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from browser import create_driver
+from session_store import install_cookies
+
+logger = logging.getLogger(__name__)
+
+
+class DriverPool:
+    """A fixed set of Chrome sessions that work through a shared queue of items"""
+
+    def __init__(self, size, headless=False, max_concurrency=None, **driver_options):
+        self.size = size
+        self.headless = headless
+        self.driver_options = driver_options
+        self.max_concurrency = max_concurrency or size
+        self.drivers = []
+
+    def start(self):
+        """Launch the Chrome sessions in parallel, no more than the concurrency cap lets work at once
+
+        If any launch fails, the sessions that did start are quit before the error is re-raised.
+        """
+        count = min(self.size, self.max_concurrency)
+        logger.info(f"Starting driver pool with {count} sessions")
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            futures = [executor.submit(create_driver, self.headless, **self.driver_options) for _ in range(count)]
+        self.drivers = [future.result() for future in futures if future.exception() is None]
+        errors = [future.exception() for future in futures if future.exception() is not None]
+        if errors:
+            logger.error(f"Could not start {len(errors)} of {count} pooled sessions: {str(errors[0])}")
+            self.close()
+            raise errors[0]
+        return self
+
+    def share_session(self, cookies, base_url="https://www.instagram.com/"):
+        """Copy an authenticated session's cookies into every pooled driver"""
+        for driver in self.drivers:
+            install_cookies(driver, cookies, base_url)
+            driver.refresh()
+
+    def run(self, items, func):
+        """Call func(driver, item) for every item, one worker thread per driver up to the concurrency cap
+
+        Returns a list of (item, result) pairs in completion order. Items whose call raises get a None result.
+        """
+        return list(self.iter_run(items, func))
+
+    def iter_run(self, items, func):
+        """Like run, but yield each (item, result) pair as soon as it completes"""
+        work = queue.Queue()
+        for item in items:
+            work.put(item)
+        total = work.qsize()
+        done = queue.Queue()
+
+        def worker(driver):
+            while True:
+                try:
+                    item = work.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    result = func(driver, item)
+                except Exception as e:
+                    logger.error(f"Error processing {item} in driver pool: {str(e)}")
+                    result = None
+                done.put((item, result))
+
+        workers = min(len(self.drivers), self.max_concurrency)
+        threads = [threading.Thread(target=worker, args=(driver,), daemon=True) for driver in self.drivers[:workers]]
+        for thread in threads:
+            thread.start()
+        try:
+            for _ in range(total if threads else 0):
+                yield done.get()
+        finally:
+            # If the consumer stops early, drop the queued items so workers finish their current one and exit
+            while not work.empty():
+                try:
+                    work.get_nowait()
+                except queue.Empty:
+                    break
+            for thread in threads:
+                thread.join()
+
+    def close(self):
+        """Quit every pooled Chrome session"""
+        for driver in self.drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.error(f"Error closing pooled driver: {e}")
+        self.drivers = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,767 +1,199 @@
-<<<<<<< HEAD
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 import time
-import pandas as pd
-import re
 import logging
-import random
-from webdriver_manager.chrome import ChromeDriverManager
-import json
+import copy
+
+from browser import create_driver
+from creator_cache import HEADER_TIERS, TIERS as CACHE_TIERS, CreatorCache
+from creator_store import CreatorStore
+from driver_pool import DriverPool
+from lean_fetch import LeanFetch
+from extractors import (EXPLORE_FIELDS, GRID_FIELDS, GRID_POST_XPATH, HASHTAG_FIELDS, KEYWORD_FIELDS,
+                        POST_FIELD_SOURCES, POST_FIELDS, POST_USERNAME_XPATH, PROFILE_FIELD_SOURCES, PROFILE_FIELDS,
+                        SUGGESTED_FIELDS, build_profile_metrics, fields_for, finish_post_record, first_visible,
+                        post_fields_from_dom, run_extraction)
+from page_json import POST_KEYS, post_from_embedded, profile_from_embedded, read_embedded_data
+from post_cache import PostCache, canonical_post_url, shortcode_from_url
+from replay import PageRecorder
+import results_archive
+from run_journal import RunJournal
+from scheduler import CreatorScheduler
+from scoring import EarlyExitReport, Thresholds, qualifies, score_profile
+from selector_registry import SelectorRegistry
+from session_store import SESSION_COOKIE, SessionStore, install_cookies
+from tab_pool import TabPool
+from waits import LatencyReport, PacingPolicy, PageWaiter
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+COOKIE_BUTTON_XPATH = "//button[contains(text(), 'Accept') or contains(text(), 'Allow')]"
+PROFILE_UNAVAILABLE_XPATH = "//h2[contains(text(), 'Sorry, this page') or contains(text(), 'isn't available')]"
+HOME_FEED_XPATH = ("//div[@class='x9f619 xjbqb8w x78zum5 x168nmei x13lgxp2 x5pf9jr xo71vjh x1uhb9sk x1plvlek xryxfnj "
+                   "x1c4vz4f x2lah0s xdt5ytf xqjyukv x1qjc9v5 x1oa3qoh x1nhvcw1'] | //a[contains(@href, '/direct/inbox')]")
+HASHTAG_MISSING_XPATH = "//h2[contains(text(), 'This hashtag does not exist')]"
+
+# Most recent posts analyzed per profile
+POSTS_PER_PROFILE = 5
+
+# Extraction tiers in the order they are tried; hit rates are kept in the selector registry
+EXTRACTION_TIERS = ['json', 'meta', 'xpath']
+
 
 class EnhancedInstagramFinder:
-    def __init__(self, username, password, headless=False):
+    def __init__(self, username, password, headless=False, cache_path="post_cache.sqlite",
+                 cache_ttl=6 * 3600, cache_max_entries=5000, pacing=None, driver=None, record_dir=None,
+                 selector_stats_path="selector_stats.json", session_path="instagram_session.json",
+                 user_data_dir=None, lean_fetch=False, fetch_stats=False, creator_cache_path="creator_cache.sqlite",
+                 creator_slow_ttl=7 * 24 * 3600, creator_fast_ttl=6 * 3600):
         self.username = username
         self.password = password
+        self.headless = headless
+        self.user_data_dir = user_data_dir
 
-        # Configure Chrome options
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-infobars")
-        chrome_options.add_argument("--lang=en-US")
-        chrome_options.add_argument(
-            "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36")
-
-        # Add experimental flags to handle cookie consent popups
-        chrome_options.add_experimental_option("prefs", {
-            "profile.default_content_setting_values.notifications": 2,
-            "profile.managed_default_content_settings.images": 1
-        })
-
-        # Initialize the Chrome driver
-        self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-        self.driver.maximize_window()
-        self.wait = WebDriverWait(self.driver, 15)
-        self.short_wait = WebDriverWait(self.driver, 5)
-        self.creators_data = []
+        # Saved cookies let login() skip the credential flow while the session is still valid
+        self.session_store = SessionStore(session_path) if session_path else None
 
-    def login(self):
-        """Login to Instagram with improved error handling"""
-        try:
-            logger.info("Logging in to Instagram...")
-            self.driver.get("https://www.instagram.com/")
-            time.sleep(3)  # Wait for initial page load
+        # Disk-backed post cache so a post is only loaded once across discovery, profile analysis and runs
+        self.post_cache = PostCache(cache_path, ttl=cache_ttl, max_entries=cache_max_entries) if cache_path else None
 
-            # Handle cookie consent if it appears
-            try:
-                cookie_buttons = self.short_wait.until(
-                    EC.presence_of_all_elements_located(
-                        (By.XPATH, "//button[contains(text(), 'Accept') or contains(text(), 'Allow')]"))
-                )
-                for button in cookie_buttons:
-                    if button.is_displayed():
-                        button.click()
-                        logger.info("Accepted cookies")
-                        time.sleep(1)
-                        break
-            except TimeoutException:
-                logger.info("No cookie consent dialog found")
+        # Last profile snapshot per creator, so only its stale parts are re-read
+        self.creator_cache = (CreatorCache(creator_cache_path, slow_ttl=creator_slow_ttl, fast_ttl=creator_fast_ttl)
+                              if creator_cache_path else None)
 
-            # Wait for the login page to load and enter credentials
-            username_input = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "input[name='username']")))
-            password_input = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "input[name='password']")))
+        # Post records extracted during the current run, by shortcode, so profile analysis reuses discovery's posts
+        self.known_posts = {}
 
-            # Clear and enter credentials with human-like typing
-            username_input.clear()
-            self._type_like_human(username_input, self.username)
-            password_input.clear()
-            self._type_like_human(password_input, self.password)
+        # Readiness waits and pacing sleeps are tracked separately so each run reports where time went
+        self.latency = LatencyReport()
+        self.pacing = pacing or PacingPolicy()
+        if self.pacing.report is None:
+            self.pacing.report = self.latency
 
-            # Click login button
-            login_button = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit']")))
-            login_button.click()
+        # Fallback selector chains are tried in historical hit-rate order, persisted across runs
+        self.selectors = SelectorRegistry(selector_stats_path)
 
-            # Wait for login to complete
-            time.sleep(5)
+        # Optionally save every rendered post/profile/hashtag/explore page for offline replay
+        self.recorder = PageRecorder(record_dir) if record_dir else None
 
-            # Handle "Save Your Login Info?" dialog - multiple possible texts
-            self._dismiss_dialog_if_present([
-                "//button[contains(text(), 'Not Now')]",
-                "//button[contains(text(), 'Not now')]",
-                "//button[contains(text(), 'Skip')]",
-                "//button[contains(text(), 'Cancel')]"
-            ], "Save login info prompt")
+        # Lean fetch blocks images, media, fonts and trackers per page type; fetch stats report bytes per page
+        self.fetch = LeanFetch(block=lean_fetch) if lean_fetch or fetch_stats else None
 
-            # Handle notifications dialog
-            self._dismiss_dialog_if_present([
-                "//button[contains(text(), 'Not Now')]",
-                "//button[contains(text(), 'Not now')]",
-                "//button[contains(text(), 'Cancel')]"
-            ], "Notifications prompt")
+        # Initialize the Chrome driver, unless one is supplied (e.g. a ReplayDriver for benchmarks)
+        self._bind_driver(driver or create_driver(headless, user_data_dir, report=self.latency,
+                                                  performance_log=self.fetch is not None))
 
-            # Verify login success
-            try:
-                self.short_wait.until(EC.presence_of_element_located((By.XPATH,
-                                                                      "//div[@class='x9f619 xjbqb8w x78zum5 x168nmei x13lgxp2 x5pf9jr xo71vjh x1uhb9sk x1plvlek xryxfnj x1c4vz4f x2lah0s xdt5ytf xqjyukv x1qjc9v5 x1oa3qoh x1nhvcw1']")))
-                logger.info("Successfully logged into Instagram")
-                return True
-            except TimeoutException:
-                logger.error("Login verification failed - could not find home feed")
-                return False
+        # Qualified creators and their posts, kept column-wise rather than as nested dicts
+        self.store = CreatorStore()
+        self.thresholds = Thresholds()
+        self.early_exits = EarlyExitReport()
 
-        except Exception as e:
-            logger.error(f"Login failed: {str(e)}")
-            # Take screenshot of login failure
-            self.driver.save_screenshot("login_error.png")
-            logger.info("Screenshot saved as login_error.png")
-            return False
+    @property
+    def creators_data(self):
+        """The last run's qualified creators, as a sequence of profile dicts backed by the store"""
+        return self.store
 
-    def _type_like_human(self, element, text):
-        """Type text with random delays between keystrokes to simulate human typing"""
-        for char in text:
-            element.send_keys(char)
-            time.sleep(random.uniform(0.05, 0.2))
+    @creators_data.setter
+    def creators_data(self, profiles):
+        self.store = CreatorStore()
+        for profile_data in profiles:
+            self.store.add_profile(profile_data)
 
-    def _dismiss_dialog_if_present(self, xpath_list, dialog_name):
-        """Try multiple XPaths to dismiss a dialog that might appear"""
-        for xpath in xpath_list:
-            try:
-                button = self.short_wait.until(EC.element_to_be_clickable((By.XPATH, xpath)))
-                button.click()
-                logger.info(f"Dismissed {dialog_name}")
-                time.sleep(2)
-                return True
-            except TimeoutException:
+    def _bind_driver(self, driver):
+        """Attach a Chrome session and its waits to this finder"""
+        self.driver = driver
+        self.wait = WebDriverWait(self.driver, 15)
+        self.short_wait = WebDriverWait(self.driver, 5)
+        self.waiter = PageWaiter(self.driver, report=self.latency)
+
+    def _open(self, url, ready_xpath, label):
+        """Navigate to url, return as soon as ready_xpath matches, then apply the pacing policy"""
+        if self.fetch:
+            self.fetch.before_load(self.driver, label)
+        start = time.time()
+        element = self.waiter.load(url, ready_xpath, label=label)
+        if self.fetch:
+            self.fetch.after_load(self.driver, label, time.time() - start)
+        if self.recorder and element is not None:
+            self.recorder.record(self.driver, label, url)
+        self.pacing.settle(label)
+        return element
+
+    def _record_matches(self, fields, raw, matches):
+        """Record a hit or miss for every selector of the multi-selector fields in an extraction
+
+        The page evaluates every selector of such a field in one call, so their order saves nothing;
+        they keep their declared order and the registry only tracks how often each one parses.
+        """
+        for name, hits in matches.items():
+            if name not in fields:
                 continue
-        logger.info(f"No {dialog_name} appeared")
-        return False
-
-    def _retry_stale_element(self, find_func, max_retries=3):
-        """Retry function when StaleElementReferenceException occurs"""
-        for attempt in range(max_retries):
-            try:
-                return find_func()
-            except StaleElementReferenceException:
-                if attempt == max_retries - 1:
-                    raise
-                time.sleep(1)
-
-    def explore_page(self):
-        """Explore the Instagram explore page to find trending content"""
-        try:
-            logger.info("Navigating to explore page...")
-            self.driver.get("https://www.instagram.com/explore/")
-            time.sleep(5)
-
-            # Scroll down to load more content
-            self._scroll_page(5)
-
-            # Get all post links
-            posts = self.wait.until(EC.presence_of_all_elements_located(
-                (By.XPATH, "//a[contains(@href, '/p/')]")))
-
-            post_urls = []
-            for post in posts[:30]:  # Get up to 30 posts
-                try:
-                    href = post.get_attribute('href')
-                    if href and '/p/' in href and href not in post_urls:
-                        post_urls.append(href)
-                except Exception as e:
-                    logger.error(f"Error getting post URL: {e}")
-
-            logger.info(f"Found {len(post_urls)} posts on explore page")
-            return post_urls
-        except Exception as e:
-            logger.error(f"Error exploring trending page: {str(e)}")
-            return []
-
-    def _scroll_page(self, num_scrolls):
-        """Scroll the page to load more content"""
-        for _ in range(num_scrolls):
-            self.driver.execute_script("window.scrollBy(0, window.innerHeight);")
-            time.sleep(random.uniform(1, 2))
-
-    def search_hashtag(self, hashtag):
-        """Search for posts by hashtag with improved reliability"""
-        try:
-            logger.info(f"Searching hashtag: #{hashtag}")
-            self.driver.get(f"https://www.instagram.com/explore/tags/{hashtag}/")
-
-            # Wait for page to load
-            time.sleep(5)
-
-            # Check if hashtag exists
-            try:
-                self.short_wait.until(
-                    EC.presence_of_element_located((By.XPATH, "//h2[contains(text(), 'This hashtag does not exist')]")))
-                logger.warning(f"Hashtag #{hashtag} does not exist")
-                return []
-            except TimeoutException:
-                pass  # Hashtag exists, continue
-
-            # Wait for the posts to load and scroll to load more
-            try:
-                self.wait.until(EC.presence_of_element_located((By.XPATH, "//article//a[contains(@href, '/p/')]")))
-                self._scroll_page(3)
-            except TimeoutException:
-                logger.warning(f"No posts found for hashtag #{hashtag}")
-                return []
-
-            # Get recent posts
-            post_links = self.driver.find_elements(By.XPATH, "//article//a[contains(@href, '/p/')]")
-            post_urls = []
-
-            for link in post_links[:20]:  # Get first 20 posts
-                try:
-                    url = link.get_attribute('href')
-                    if url and url not in post_urls:
-                        post_urls.append(url)
-                except Exception as e:
-                    logger.error(f"Error getting post URL: {e}")
-
-            logger.info(f"Found {len(post_urls)} posts for hashtag #{hashtag}")
-            return post_urls
-        except Exception as e:
-            logger.error(f"Error searching hashtag: {str(e)}")
-            return []
-
-    def search_keyword(self, keyword):
-        """Search Instagram for keywords/accounts"""
-        try:
-            logger.info(f"Searching keyword: {keyword}")
-            self.driver.get("https://www.instagram.com/")
-            time.sleep(3)
-
-            # Click on search icon (magnifying glass)
-            search_icon = self.wait.until(EC.element_to_be_clickable(
-                (By.XPATH, "//span[contains(@aria-label, 'Search')]/..")))
-            search_icon.click()
-            time.sleep(2)
-
-            # Type in search box
-            search_input = self.wait.until(EC.element_to_be_clickable(
-                (By.XPATH, "//input[@placeholder='Search']")))
-            self._type_like_human(search_input, keyword)
-            time.sleep(3)
-
-            # Wait for search results and get accounts
-            accounts = self.wait.until(EC.presence_of_all_elements_located(
-                (By.XPATH, "//div[@role='none']//a[contains(@href, '/')]")))
-
-            account_usernames = []
-            for account in accounts[:10]:  # First 10 accounts
-                try:
-                    username = account.get_attribute('href').split('/')[-2]
-                    if username and username not in account_usernames:
-                        account_usernames.append(username)
-                except Exception as e:
-                    logger.error(f"Error getting account username: {e}")
-
-            logger.info(f"Found {len(account_usernames)} accounts for keyword '{keyword}'")
-            return account_usernames
-        except Exception as e:
-            logger.error(f"Error searching keyword: {str(e)}")
-            return []
-
-    def extract_post_data(self, post_url):
-        """Extract engagement data from a post with improved metrics extraction"""
-        try:
-            logger.info(f"Analyzing post: {post_url}")
-            self.driver.get(post_url)
-            time.sleep(random.uniform(3, 5))
-
-            # Extract username with better selector
-            username_element = self.wait.until(EC.presence_of_element_located(
-                (By.XPATH, "//a[contains(@class, 'x1i10hfl') and not(contains(@href, 'tagged'))]")))
-            username = username_element.get_attribute('href').split('/')[-2]
-
-            # Check if it's a video by looking for view count
-            is_video = False
-            views = 0
-            try:
-                views_element = self.short_wait.until(EC.presence_of_element_located(
-                    (By.XPATH, "//span[contains(text(), 'views') or contains(text(), 'Views')]/..")))
-                views_text = views_element.text
-                # Extract numbers from text like "1,234,567 views"
-                views = int(''.join(filter(str.isdigit, views_text)))
-                is_video = True
-                has_million_views = views >= 1000000
-                logger.info(f"Post has {views} views")
-            except TimeoutException:
-                is_video = False
-                has_million_views = False
-
-            # Extract likes - try multiple possible selectors
-            likes = 0
-            like_selectors = [
-                "//section//span/span[contains(@class, 'x193iq5w')]",
-                "//section//a[contains(@href, 'liked_by')]/span",
-                "//span[contains(@class, '_aap6')]",
-                "//article//span[contains(@class, 'x193iq5w')]"
-            ]
-
-            for selector in like_selectors:
-                try:
-                    likes_element = self.driver.find_element(By.XPATH, selector)
-                    likes_text = likes_element.text
-                    likes = int(''.join(filter(str.isdigit, likes_text)))
-                    logger.info(f"Post has {likes} likes")
-                    break
-                except (NoSuchElementException, ValueError):
-                    continue
-
-            # Extract comments count
-            comments = 0
-            try:
-                comments_element = self.driver.find_element(
-                    By.XPATH, "//span[contains(text(), 'comment') or contains(text(), 'Comment')]")
-                comments_text = comments_element.text
-                comments = int(''.join(filter(str.isdigit, comments_text)))
-            except (NoSuchElementException, ValueError):
-                # Try alternative method - count comment elements
-                try:
-                    comment_elements = self.driver.find_elements(By.XPATH, "//ul//li[contains(@class, 'gLFyf')]")
-                    comments = len(comment_elements)
-                except Exception:
-                    pass
-
-            # Get post timestamp
-            timestamp = ""
-            try:
-                time_element = self.driver.find_element(By.XPATH, "//time")
-                timestamp = time_element.get_attribute('datetime')
-            except NoSuchElementException:
-                pass
-
-            # Try to extract caption
-            caption = ""
-            try:
-                caption_element = self.driver.find_element(
-                    By.XPATH, "//div[contains(@class, '_a9zs')]/span")
-                caption = caption_element.text
-            except NoSuchElementException:
-                pass
-
-            # Calculate engagement - if video use views, otherwise use estimated follower count
-            engagement_denominator = views if is_video and views > 0 else 1
-            engagement_rate = (likes + comments) / engagement_denominator * 100 if engagement_denominator > 1 else 0
-
-            # Return comprehensive post data
-            return {
-                'username': username,
-                'post_url': post_url,
-                'is_video': is_video,
-                'views': views,
-                'likes': likes,
-                'comments': comments,
-                'has_million_views': has_million_views,
-                'engagement_rate': engagement_rate,
-                'timestamp': timestamp,
-                'caption': caption
-            }
-        except Exception as e:
-            logger.error(f"Error extracting post data: {str(e)}")
-            return None
-
-    def analyze_creator_profile(self, username):
-        """Analyze a creator's profile with improved metrics collection"""
-        try:
-            logger.info(f"Analyzing profile: {username}")
-            self.driver.get(f"https://www.instagram.com/{username}/")
-            time.sleep(random.uniform(3, 5))
-
-            # Check if account exists and is public
-            try:
-                self.short_wait.until(EC.presence_of_element_located(
-                    (By.XPATH, "//h2[contains(text(), 'Sorry, this page') or contains(text(), 'isn't available')]")))
-                logger.warning(f"Account @{username} doesn't exist or is private")
-                return None
-            except TimeoutException:
-                pass  # Account exists and is public
-
-            # Extract account metrics
-            metrics = {}
-
-            # Get profile name
-            try:
-                name_element = self.driver.find_element(By.XPATH, "//h1")
-                metrics['name'] = name_element.text
-            except NoSuchElementException:
-                metrics['name'] = username
-
-            # Get bio
-            try:
-                bio_element = self.driver.find_element(
-                    By.XPATH, "//div[contains(@class, '_aa_c')]")
-                metrics['bio'] = bio_element.text
-            except NoSuchElementException:
-                metrics['bio'] = ""
-
-            # Get follower count with multiple possible selectors
-            followers = 0
-            follower_selectors = [
-                "//a[contains(@href, 'followers')]/span",
-                "//a[contains(@href, 'followers')]//span[contains(@class, '_ac2a')]",
-                "//div[contains(@class, '_aa_i')]//span",
-                "//div[contains(@class, '_ab8w')]//span[contains(@class, '_ac2a')]"
-            ]
-
-            for selector in follower_selectors:
-                try:
-                    followers_element = self.driver.find_element(By.XPATH, selector)
-                    followers_text = followers_element.text
-                    if 'k' in followers_text.lower():
-                        followers = float(followers_text.lower().replace('k', '')) * 1000
-                    elif 'm' in followers_text.lower():
-                        followers = float(followers_text.lower().replace('m', '')) * 1000000
-                    else:
-                        followers = int(''.join(filter(str.isdigit, followers_text)))
-                    metrics['followers'] = int(followers)
-                    break
-                except (NoSuchElementException, ValueError):
-                    continue
-
-            if 'followers' not in metrics:
-                metrics['followers'] = 0
-                logger.warning(f"Could not extract follower count for @{username}")
-
-            # Check account type (creator/business account)
-            try:
-                category_element = self.driver.find_element(
-                    By.XPATH, "//div[contains(@class, '_aa_c')]//div[contains(@class, '_ab8w')]")
-                metrics['category'] = category_element.text
-                metrics['is_creator_account'] = True
-            except NoSuchElementException:
-                metrics['category'] = ""
-                metrics['is_creator_account'] = False
-
-            # Get recent posts (works for both grid view and list view)
-            post_urls = []
-            try:
-                post_elements = self.wait.until(EC.presence_of_all_elements_located(
-                    (By.XPATH, "//article//a[contains(@href, '/p/')]")))
-
-                for element in post_elements[:9]:  # Get the most recent 9 posts
-                    try:
-                        url = element.get_attribute('href')
-                        if url and url not in post_urls:
-                            post_urls.append(url)
-                    except Exception as e:
-                        logger.error(f"Error getting post URL: {e}")
-
-                logger.info(f"Found {len(post_urls)} recent posts for @{username}")
-            except TimeoutException:
-                logger.warning(f"No posts found for @{username}")
-
-            # Analyze recent posts to determine engagement trends
-            post_data = []
-            for url in post_urls[:5]:  # Analyze top 5 most recent posts
-                data = self.extract_post_data(url)
-                if data:
-                    post_data.append(data)
-                time.sleep(random.uniform(2, 4))
-
-            # Calculate engagement metrics
-            if post_data:
-                # Overall engagement metrics
-                video_posts = [p for p in post_data if p['is_video']]
-                image_posts = [p for p in post_data if not p['is_video']]
-
-                # Average engagement calculation
-                total_eng_rates = sum(p['engagement_rate'] for p in post_data)
-                avg_engagement_rate = total_eng_rates / len(post_data) if post_data else 0
-
-                # Calculate if on a hot streak (most recent post exceeds avg by 15%+)
-                most_recent_eng = post_data[0]['engagement_rate'] if post_data else 0
-                on_hot_streak = most_recent_eng >= avg_engagement_rate * 1.15
-
-                # Check for any viral content (1M+ views)
-                has_viral_video = any(p['has_million_views'] for p in post_data)
-
-                # Return comprehensive creator profile
-                return {
-                    'username': username,
-                    'name': metrics.get('name', ''),
-                    'bio': metrics.get('bio', ''),
-                    'category': metrics.get('category', ''),
-                    'is_creator_account': metrics.get('is_creator_account', False),
-                    'followers': metrics.get('followers', 0),
-                    'posts_analyzed': len(post_data),
-                    'avg_engagement_rate': avg_engagement_rate,
-                    'latest_post_engagement': most_recent_eng,
-                    'on_hot_streak': on_hot_streak,
-                    'has_viral_video': has_viral_video,
-                    'video_post_count': len(video_posts),
-                    'image_post_count': len(image_posts),
-                    'recent_posts': post_data
-                }
-            else:
-                logger.warning(f"Could not analyze any posts for @{username}")
-                return {
-                    'username': username,
-                    'name': metrics.get('name', ''),
-                    'bio': metrics.get('bio', ''),
-                    'category': metrics.get('category', ''),
-                    'is_creator_account': metrics.get('is_creator_account', False),
-                    'followers': metrics.get('followers', 0),
-                    'posts_analyzed': 0,
-                    'avg_engagement_rate': 0,
-                    'latest_post_engagement': 0,
-                    'on_hot_streak': False,
-                    'has_viral_video': False,
-                    'video_post_count': 0,
-                    'image_post_count': 0,
-                    'recent_posts': []
-                }
-        except Exception as e:
-            logger.error(f"Error analyzing profile: {str(e)}")
-            self.driver.save_screenshot(f"profile_error_{username}.png")
-            return None
-
-    def find_suggested_accounts(self, seed_account):
-        """Use Instagram's suggestion algorithm to find similar creators"""
-        try:
-            logger.info(f"Finding accounts similar to: {seed_account}")
-            self.driver.get(f"https://www.instagram.com/{seed_account}/")
-            time.sleep(3)
-
-            # Click on followers to open the list
-            followers_link = self.wait.until(EC.element_to_be_clickable(
-                (By.XPATH, "//a[contains(@href, 'followers')]")))
-            followers_link.click()
-            time.sleep(3)
-
-            # Get accounts from the followers list
-            suggested_accounts = []
-            try:
-                account_elements = self.wait.until(EC.presence_of_all_elements_located(
-                    (By.XPATH, "//div[@role='dialog']//a[contains(@class, 'notranslate')]")))
-
-                for element in account_elements[:20]:  # Get up to 20 suggested accounts
-                    try:
-                        username = element.text
-                        if username and username != seed_account and username not in suggested_accounts:
-                            suggested_accounts.append(username)
-                    except Exception as e:
-                        logger.error(f"Error getting suggested account: {e}")
-
-                logger.info(f"Found {len(suggested_accounts)} accounts similar to @{seed_account}")
-            except TimeoutException:
-                logger.warning(f"Could not find suggested accounts for @{seed_account}")
-
-            # Close the dialog
-            try:
-                close_button = self.driver.find_element(By.XPATH,
-                                                        "//div[@role='dialog']//button[contains(@aria-label, 'Close')]")
-                close_button.click()
-                time.sleep(1)
-            except NoSuchElementException:
-                pass
-
-            return suggested_accounts
-        except Exception as e:
-            logger.error(f"Error finding suggested accounts: {str(e)}")
-            return []
-
-    def find_viral_creators(self, industry_tags=None, min_followers=1000, min_engagement=5.0):
-        """Find creators with viral potential using multiple discovery methods"""
-        if industry_tags is None:
-            industry_tags = ["viral", "trending", "creator", "contentcreator"]
-
-        all_creators = set()
-        viral_creators = []
-
-        # Method 1: Search popular hashtags in the industry
-        logger.info("DISCOVERY METHOD 1: Hashtag search")
-        for tag in industry_tags:
-            posts = self.search_hashtag(tag)
-            for post_url in posts:
-                try:
-                    post_data = self.extract_post_data(post_url)
-                    if post_data and post_data['username'] not in all_creators:
-                        all_creators.add(post_data['username'])
-                        # Quick filter: only analyze profiles with high engagement or viral indicators
-                        if post_data['has_million_views'] or post_data['engagement_rate'] > min_engagement:
-                            logger.info(f"Found potential creator @{post_data['username']} from hashtag #{tag}")
-                except Exception as e:
-                    logger.error(f"Error processing post {post_url}: {str(e)}")
-                time.sleep(random.uniform(1, 2))
-
-        # Method 2: Explore page for trending content
-        logger.info("DISCOVERY METHOD 2: Explore page")
-        trending_posts = self.explore_page()
-        for post_url in trending_posts:
-            try:
-                post_data = self.extract_post_data(post_url)
-                if post_data and post_data['username'] not in all_creators:
-                    all_creators.add(post_data['username'])
-                    if post_data['has_million_views'] or post_data['engagement_rate'] > min_engagement:
-                        logger.info(f"Found potential creator @{post_data['username']} from explore page")
-            except Exception as e:
-                logger.error(f"Error processing explore post {post_url}: {str(e)}")
-            time.sleep(random.uniform(1, 2))
-
-        # Method 3: Search for industry keywords to find creator accounts
-        logger.info("DISCOVERY METHOD 3: Keyword search")
-        keywords = ["content creator", "viral creator", "trending"]
-        for keyword in keywords:
-            accounts = self.search_keyword(keyword)
-            for username in accounts:
-                if username not in all_creators:
-                    all_creators.add(username)
-                    logger.info(f"Found potential creator @{username} from keyword '{keyword}'")
-            time.sleep(random.uniform(2, 3))
-
-        # Method 4: Use seed accounts to find similar creators
-        logger.info("DISCOVERY METHOD 4: Similar account discovery")
-        seed_accounts = list(all_creators)[:3] if all_creators else ["instagram"]
-        for seed in seed_accounts:
-            similar_accounts = self.find_suggested_accounts(seed)
-            for username in similar_accounts:
-                if username not in all_creators:
-                    all_creators.add(username)
-                    logger.info(f"Found potential creator @{username} similar to @{seed}")
-            time.sleep(random.uniform(2, 3))
-
-        # Analyze each discovered creator in depth
-        logger.info(f"Found {len(all_creators)} potential creators. Analyzing profiles...")
-        for username in all_creators:
-            profile_data = self.analyze_creator_profile(username)
-
-            if profile_data and profile_data['followers'] >= min_followers:
-                # Check for viral indicators:
-                # 1. Has a video with 1M+ views
-                # 2. Currently on a hot streak (15%+ above average engagement)
-                # 3. Consistently high engagement rate
-                if (profile_data['has_viral_video'] or
-                        profile_data['on_hot_streak'] or
-                        profile_data['avg_engagement_rate'] > min_engagement):
-                    viral_creators.append(profile_data)
-                    logger.info(f"✅ Qualified viral creator: @{username}")
-                    logger.info(f"   Followers: {profile_data['followers']:,}")
-                    logger.info(f"   Viral video: {'Yes' if profile_data['has_viral_video'] else 'No'}")
-                    logger.info(f"   Hot streak: {'Yes' if profile_data['on_hot_streak'] else 'No'}")
-                    logger.info(f"   Avg engagement: {profile_data['avg_engagement_rate']:.2f}%")
-
-            time.sleep(random.uniform(3, 5))
-
-        self.creators_data = viral_creators
-        logger.info(f"Found {len(viral_creators)} qualified viral creators")
-        return viral_creators
-
-    def send_message(self, username, message_template):
-        """Send a DM to a creator with improved reliability"""
-        try:
-            logger.info(f"Attempting to message: {username}")
-            self.driver.get(f"https://www.instagram.com/{username}/")
-            time.sleep(random.uniform(2, 4))
-
-            # Try multiple selectors for the message button
-            message_selectors = [
-                "//div[text()='Message']",
-                "//button[contains(text(), 'Message')]",
-                "//a[contains(@href, '/direct/')]"
-            ]
-
-            clicked = False
-            for selector in message_selectors:
-                try:
-                    message_btn = self.wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
-                    message_btn.click()
-                    clicked = True
-                    break
-                except TimeoutException:
-                    continue
-
-            if not clicked:
-                logger.error(f"Could not find message button for @{username}")
+            self.selectors.record_each(name, fields[name]['xpaths'], hits,
+                                       [ms / 1000 for ms in raw['_timings'].get(name, [])])
+
+    def _record_tier(self, page_type, tier):
+        """Record which extraction tier completed a page's fields"""
+        self.selectors.record_chain(f"{page_type}_tier", EXTRACTION_TIERS, EXTRACTION_TIERS.index(tier))
+
+    def _worker(self, driver):
+        """Return a copy of this finder that drives a pooled Chrome session but shares caches and settings"""
+        worker = copy.copy(self)
+        worker._bind_driver(driver)
+        return worker
+
+    def restore_session(self):
+        """Reuse a saved session (cookie jar or persistent Chrome profile) if it is still logged in"""
+        started = time.time()
+        if self.session_store and not self.user_data_dir:
+            cookies = self.session_store.load()
+            if not cookies:
                 return False
+            install_cookies(self.driver, cookies)
+            if self.driver.get_cookie(SESSION_COOKIE) is None:
+                return False
+        elif not self.user_data_dir:
+            return False
 
-            time.sleep(random.uniform(2, 4))
-
-            # Type message - try multiple selectors for the input field
-            input_selectors = [
-                "//textarea[@placeholder='Message...']",
-                "//div[@role='textbox']",
-                "//div[contains(@aria-label, 'Message')]"
-            ]
-
-            typed = False
-=======
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
-import time
-import pandas as pd
-import re
-import logging
-import random
-from webdriver_manager.chrome import ChromeDriverManager
-import json
-
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
-
+        # One page load tells us whether the session is accepted: feed vs. login form. A persistent
+        # profile's cookies are only readable once an instagram.com page is open, so they're checked after it
+        self.waiter.load("https://www.instagram.com/", f"{HOME_FEED_XPATH} | //input[@name='password']",
+                         label="session_check")
+        if self.driver.get_cookie(SESSION_COOKIE) is None:
+            logger.info("Chrome profile has no Instagram session")
+            return False
+        if self.driver.find_elements(By.CSS_SELECTOR, "input[name='password']"):
+            logger.info("Saved session is no longer valid")
+            self.driver.delete_all_cookies()
+            return False
 
-class EnhancedInstagramFinder:
-    def __init__(self, username, password, headless=False):
-        self.username = username
-        self.password = password
+        restore_seconds = time.time() - started
+        self.latency.add("login", "session_restore", restore_seconds)
+        logger.info(f"Reused saved Instagram session (ready in {restore_seconds:.1f}s)")
+        return True
 
-        # Configure Chrome options
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-infobars")
-        chrome_options.add_argument("--lang=en-US")
-        chrome_options.add_argument(
-            "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36")
-
-        # Add experimental flags to handle cookie consent popups
-        chrome_options.add_experimental_option("prefs", {
-            "profile.default_content_setting_values.notifications": 2,
-            "profile.managed_default_content_settings.images": 1
-        })
-
-        # Initialize the Chrome driver
-        self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-        self.driver.maximize_window()
-        self.wait = WebDriverWait(self.driver, 15)
-        self.short_wait = WebDriverWait(self.driver, 5)
-        self.creators_data = []
+    def login(self, reuse_session=True):
+        """Login to Instagram with improved error handling, reusing a saved session when possible"""
+        if reuse_session and self.restore_session():
+            return True
 
-    def login(self):
-        """Login to Instagram with improved error handling"""
+        login_started = time.time()
         try:
             logger.info("Logging in to Instagram...")
-            self.driver.get("https://www.instagram.com/")
-            time.sleep(3)  # Wait for initial page load
+            self._open("https://www.instagram.com/", f"//input[@name='username'] | {COOKIE_BUTTON_XPATH}", "login")
 
             # Handle cookie consent if it appears
-            try:
-                cookie_buttons = self.short_wait.until(
-                    EC.presence_of_all_elements_located(
-                        (By.XPATH, "//button[contains(text(), 'Accept') or contains(text(), 'Allow')]"))
-                )
-                for button in cookie_buttons:
-                    if button.is_displayed():
-                        button.click()
-                        logger.info("Accepted cookies")
-                        time.sleep(1)
-                        break
-            except TimeoutException:
+            cookie_buttons = self.driver.find_elements(By.XPATH, COOKIE_BUTTON_XPATH)
+            for button in cookie_buttons:
+                if button.is_displayed():
+                    button.click()
+                    logger.info("Accepted cookies")
+                    self.pacing.pause(1, 1, "cookie_consent")
+                    break
+            else:
                 logger.info("No cookie consent dialog found")
 
             # Wait for the login page to load and enter credentials
@@ -778,8 +210,9 @@ class EnhancedInstagramFinder:
             login_button = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit']")))
             login_button.click()
 
-            # Wait for login to complete
-            time.sleep(5)
+            # Wait for login to complete - the login form goes away once the session is accepted
+            self.waiter.until(lambda d: not d.find_elements(By.CSS_SELECTOR, "input[name='password']"),
+                              "login_submit")
 
             # Handle "Save Your Login Info?" dialog - multiple possible texts
             self._dismiss_dialog_if_present([
@@ -798,9 +231,12 @@ class EnhancedInstagramFinder:
 
             # Verify login success
             try:
-                self.short_wait.until(EC.presence_of_element_located((By.XPATH,
-                                                                      "//div[@class='x9f619 xjbqb8w x78zum5 x168nmei x13lgxp2 x5pf9jr xo71vjh x1uhb9sk x1plvlek xryxfnj x1c4vz4f x2lah0s xdt5ytf xqjyukv x1qjc9v5 x1oa3qoh x1nhvcw1']")))
-                logger.info("Successfully logged into Instagram")
+                self.short_wait.until(EC.presence_of_element_located((By.XPATH, HOME_FEED_XPATH)))
+                login_seconds = time.time() - login_started
+                self.latency.add("login", "login_to_ready", login_seconds)
+                logger.info(f"Successfully logged into Instagram (ready in {login_seconds:.1f}s)")
+                if self.session_store:
+                    self.session_store.save(self.driver)
                 return True
             except TimeoutException:
                 logger.error("Login verification failed - could not find home feed")
@@ -817,21 +253,34 @@ class EnhancedInstagramFinder:
         """Type text with random delays between keystrokes to simulate human typing"""
         for char in text:
             element.send_keys(char)
-            time.sleep(random.uniform(0.05, 0.2))
+            self.pacing.pause(0.05, 0.2, "typing")
 
-    def _dismiss_dialog_if_present(self, xpath_list, dialog_name):
-        """Try multiple XPaths to dismiss a dialog that might appear"""
-        for xpath in xpath_list:
-            try:
-                button = self.short_wait.until(EC.element_to_be_clickable((By.XPATH, xpath)))
-                button.click()
-                logger.info(f"Dismissed {dialog_name}")
-                time.sleep(2)
-                return True
-            except TimeoutException:
-                continue
-        logger.info(f"No {dialog_name} appeared")
-        return False
+    def _dismiss_dialog_if_present(self, xpath_list, dialog_name, poll_window=2.0):
+        """Dismiss a dialog that might appear by probing all of its XPaths at once
+
+        Every candidate XPath is checked in a single script call, re-polled for up to poll_window
+        seconds, and the first visible match in declared order is clicked.
+        """
+        start = time.time()
+        try:
+            match = WebDriverWait(self.driver, poll_window, poll_frequency=0.25).until(
+                lambda d: first_visible(d, xpath_list))
+        except TimeoutException:
+            match = None
+        elapsed = time.time() - start
+        self.latency.add("ready", f"dialog.{dialog_name}", elapsed)
+
+        if match is None:
+            self.selectors.record_chain(dialog_name, xpath_list, None)
+            logger.info(f"No {dialog_name} appeared")
+            return False
+
+        index, button = match
+        self.selectors.record_chain(dialog_name, xpath_list, index, [0.0] * index + [elapsed])
+        button.click()
+        logger.info(f"Dismissed {dialog_name}")
+        self.pacing.pause(2, 2, "dialog_dismiss")
+        return True
 
     def _retry_stale_element(self, find_func, max_retries=3):
         """Retry function when StaleElementReferenceException occurs"""
@@ -845,513 +294,699 @@ class EnhancedInstagramFinder:
 
     def explore_page(self):
         """Explore the Instagram explore page to find trending content"""
+        return list(self.iter_explore_posts())
+
+    def iter_explore_posts(self):
+        """Yield trending post URLs from the explore page
+
+        Every URL is read from the page before the first one is yielded, so the consumer may use
+        this finder (and navigate away) between items.
+        """
+        post_urls = []
         try:
             logger.info("Navigating to explore page...")
-            self.driver.get("https://www.instagram.com/explore/")
-            time.sleep(5)
+            self._open("https://www.instagram.com/explore/", "//a[contains(@href, '/p/')]", "explore")
 
             # Scroll down to load more content
             self._scroll_page(5)
 
-            # Get all post links
-            posts = self.wait.until(EC.presence_of_all_elements_located(
-                (By.XPATH, "//a[contains(@href, '/p/')]")))
-
-            post_urls = []
-            for post in posts[:30]:  # Get up to 30 posts
-                try:
-                    href = post.get_attribute('href')
-                    if href and '/p/' in href and href not in post_urls:
-                        post_urls.append(href)
-                except Exception as e:
-                    logger.error(f"Error getting post URL: {e}")
+            # Get up to 30 post links in one round-trip
+            self.wait.until(EC.presence_of_element_located((By.XPATH, "//a[contains(@href, '/p/')]")))
+            for href in run_extraction(self.driver, EXPLORE_FIELDS)['post_urls']:
+                if href and '/p/' in href and href not in post_urls:
+                    post_urls.append(href)
 
             logger.info(f"Found {len(post_urls)} posts on explore page")
-            return post_urls
         except Exception as e:
             logger.error(f"Error exploring trending page: {str(e)}")
-            return []
+        yield from post_urls
 
     def _scroll_page(self, num_scrolls):
         """Scroll the page to load more content"""
         for _ in range(num_scrolls):
             self.driver.execute_script("window.scrollBy(0, window.innerHeight);")
-            time.sleep(random.uniform(1, 2))
+            self.pacing.pause(1, 2, "scroll")
 
     def search_hashtag(self, hashtag):
         """Search for posts by hashtag with improved reliability"""
+        return list(self.iter_hashtag_posts(hashtag))
+
+    def iter_hashtag_posts(self, hashtag):
+        """Yield a hashtag's recent post URLs, all read from the page before the first is yielded"""
+        post_urls = []
         try:
             logger.info(f"Searching hashtag: #{hashtag}")
-            self.driver.get(f"https://www.instagram.com/explore/tags/{hashtag}/")
-
-            # Wait for page to load
-            time.sleep(5)
+            # Wait until either the post grid or the missing-hashtag notice is rendered
+            self._open(f"https://www.instagram.com/explore/tags/{hashtag}/",
+                       f"{GRID_POST_XPATH} | {HASHTAG_MISSING_XPATH}", "hashtag")
 
             # Check if hashtag exists
-            try:
-                self.short_wait.until(
-                    EC.presence_of_element_located((By.XPATH, "//h2[contains(text(), 'This hashtag does not exist')]")))
+            if self.driver.find_elements(By.XPATH, HASHTAG_MISSING_XPATH):
                 logger.warning(f"Hashtag #{hashtag} does not exist")
-                return []
-            except TimeoutException:
-                pass  # Hashtag exists, continue
+                return
 
             # Wait for the posts to load and scroll to load more
             try:
-                self.wait.until(EC.presence_of_element_located((By.XPATH, "//article//a[contains(@href, '/p/')]")))
+                self.wait.until(EC.presence_of_element_located((By.XPATH, GRID_POST_XPATH)))
                 self._scroll_page(3)
             except TimeoutException:
                 logger.warning(f"No posts found for hashtag #{hashtag}")
-                return []
+                return
 
-            # Get recent posts
-            post_links = self.driver.find_elements(By.XPATH, "//article//a[contains(@href, '/p/')]")
-            post_urls = []
-
-            for link in post_links[:20]:  # Get first 20 posts
-                try:
-                    url = link.get_attribute('href')
-                    if url and url not in post_urls:
-                        post_urls.append(url)
-                except Exception as e:
-                    logger.error(f"Error getting post URL: {e}")
+            # Get the first 20 recent posts in one round-trip
+            for url in run_extraction(self.driver, HASHTAG_FIELDS)['post_urls']:
+                if url and url not in post_urls:
+                    post_urls.append(url)
 
             logger.info(f"Found {len(post_urls)} posts for hashtag #{hashtag}")
-            return post_urls
         except Exception as e:
             logger.error(f"Error searching hashtag: {str(e)}")
-            return []
+        yield from post_urls
 
     def search_keyword(self, keyword):
         """Search Instagram for keywords/accounts"""
+        return list(self.iter_keyword_accounts(keyword))
+
+    def iter_keyword_accounts(self, keyword):
+        """Yield usernames from a keyword search, all read from the page before the first is yielded"""
+        account_usernames = []
         try:
             logger.info(f"Searching keyword: {keyword}")
-            self.driver.get("https://www.instagram.com/")
-            time.sleep(3)
+            self._open("https://www.instagram.com/", "//span[contains(@aria-label, 'Search')]", "keyword_search")
 
             # Click on search icon (magnifying glass)
             search_icon = self.wait.until(EC.element_to_be_clickable(
                 (By.XPATH, "//span[contains(@aria-label, 'Search')]/..")))
             search_icon.click()
-            time.sleep(2)
 
             # Type in search box
             search_input = self.wait.until(EC.element_to_be_clickable(
                 (By.XPATH, "//input[@placeholder='Search']")))
             self._type_like_human(search_input, keyword)
-            time.sleep(3)
+            self.pacing.pause(3, 3, "search_results")
 
-            # Wait for search results and get accounts
-            accounts = self.wait.until(EC.presence_of_all_elements_located(
+            # Wait for search results and get the first 10 accounts
+            self.wait.until(EC.presence_of_element_located(
                 (By.XPATH, "//div[@role='none']//a[contains(@href, '/')]")))
-
-            account_usernames = []
-            for account in accounts[:10]:  # First 10 accounts
-                try:
-                    username = account.get_attribute('href').split('/')[-2]
-                    if username and username not in account_usernames:
-                        account_usernames.append(username)
-                except Exception as e:
-                    logger.error(f"Error getting account username: {e}")
+            for href in run_extraction(self.driver, KEYWORD_FIELDS)['account_urls']:
+                username = href.split('/')[-2] if href and href.count('/') >= 2 else None
+                if username and username not in account_usernames:
+                    account_usernames.append(username)
 
             logger.info(f"Found {len(account_usernames)} accounts for keyword '{keyword}'")
-            return account_usernames
         except Exception as e:
             logger.error(f"Error searching keyword: {str(e)}")
-            return []
+        yield from account_usernames
+
+    def _known_post(self, post_url):
+        """Return post data already extracted this run or held in the post cache, without loading the page"""
+        shortcode = shortcode_from_url(post_url)
+        if not shortcode:
+            return None
+        known = self.known_posts.get(shortcode)
+        if known:
+            logger.info(f"Reusing post data from this run: {post_url}")
+            return dict(known, post_url=post_url)
+        if self.post_cache is not None:
+            cached = self.post_cache.get(shortcode)
+            if cached:
+                logger.info(f"Using cached data for post: {post_url}")
+                self.known_posts[shortcode] = cached
+                return dict(cached, post_url=post_url)
+        return None
 
     def extract_post_data(self, post_url):
         """Extract engagement data from a post with improved metrics extraction"""
+        return self._known_post(post_url) or self._fetch_post(post_url)
+
+    def _fetch_post(self, post_url):
+        """Load and extract a post that isn't known from this run or the post cache"""
         try:
             logger.info(f"Analyzing post: {post_url}")
-            self.driver.get(post_url)
-            time.sleep(random.uniform(3, 5))
-
-            # Extract username with better selector
-            username_element = self.wait.until(EC.presence_of_element_located(
-                (By.XPATH, "//a[contains(@class, 'x1i10hfl') and not(contains(@href, 'tagged'))]")))
-            username = username_element.get_attribute('href').split('/')[-2]
-
-            # Check if it's a video by looking for view count
-            is_video = False
-            views = 0
-            try:
-                views_element = self.short_wait.until(EC.presence_of_element_located(
-                    (By.XPATH, "//span[contains(text(), 'views') or contains(text(), 'Views')]/..")))
-                views_text = views_element.text
-                # Extract numbers from text like "1,234,567 views"
-                views = int(''.join(filter(str.isdigit, views_text)))
-                is_video = True
-                has_million_views = views >= 1000000
-                logger.info(f"Post has {views} views")
-            except TimeoutException:
-                is_video = False
-                has_million_views = False
-
-            # Extract likes - try multiple possible selectors
-            likes = 0
-            like_selectors = [
-                "//section//span/span[contains(@class, 'x193iq5w')]",
-                "//section//a[contains(@href, 'liked_by')]/span",
-                "//span[contains(@class, '_aap6')]",
-                "//article//span[contains(@class, 'x193iq5w')]"
-            ]
-
-            for selector in like_selectors:
-                try:
-                    likes_element = self.driver.find_element(By.XPATH, selector)
-                    likes_text = likes_element.text
-                    likes = int(''.join(filter(str.isdigit, likes_text)))
-                    logger.info(f"Post has {likes} likes")
-                    break
-                except (NoSuchElementException, ValueError):
-                    continue
-
-            # Extract comments count
-            comments = 0
-            try:
-                comments_element = self.driver.find_element(
-                    By.XPATH, "//span[contains(text(), 'comment') or contains(text(), 'Comment')]")
-                comments_text = comments_element.text
-                comments = int(''.join(filter(str.isdigit, comments_text)))
-            except (NoSuchElementException, ValueError):
-                # Try alternative method - count comment elements
-                try:
-                    comment_elements = self.driver.find_elements(By.XPATH, "//ul//li[contains(@class, 'gLFyf')]")
-                    comments = len(comment_elements)
-                except Exception:
-                    pass
-
-            # Get post timestamp
-            timestamp = ""
-            try:
-                time_element = self.driver.find_element(By.XPATH, "//time")
-                timestamp = time_element.get_attribute('datetime')
-            except NoSuchElementException:
-                pass
 
-            # Try to extract caption
-            caption = ""
-            try:
-                caption_element = self.driver.find_element(
-                    By.XPATH, "//div[contains(@class, '_a9zs')]/span")
-                caption = caption_element.text
-            except NoSuchElementException:
-                pass
-
-            # Calculate engagement - if video use views, otherwise use estimated follower count
-            engagement_denominator = views if is_video and views > 0 else 1
-            engagement_rate = (likes + comments) / engagement_denominator * 100 if engagement_denominator > 1 else 0
-
-            # Return comprehensive post data
-            return {
-                'username': username,
-                'post_url': post_url,
-                'is_video': is_video,
-                'views': views,
-                'likes': likes,
-                'comments': comments,
-                'has_million_views': has_million_views,
-                'engagement_rate': engagement_rate,
-                'timestamp': timestamp,
-                'caption': caption
-            }
+            # The username link marks the post as rendered
+            if self._open(post_url, POST_USERNAME_XPATH, "post") is None:
+                logger.error(f"Post did not load: {post_url}")
+                return None
+            return self._read_post(post_url)
         except Exception as e:
             logger.error(f"Error extracting post data: {str(e)}")
             return None
 
-    def analyze_creator_profile(self, username):
-        """Analyze a creator's profile with improved metrics collection"""
+    def _read_post(self, post_url):
+        """Read the post open in the current window and remember it for this run and the post cache"""
+        shortcode = shortcode_from_url(post_url)
+
+        # Embedded JSON and meta tags first; the XPath chains only run for the fields they didn't supply
+        with self.latency.measure("extract", "post"):
+            fields, tier = post_from_embedded(read_embedded_data(self.driver), shortcode)
+            if tier is None:
+                missing = [key for key in POST_KEYS if key not in fields]
+                spec = fields_for(POST_FIELDS, POST_FIELD_SOURCES, missing)
+                matches = {}
+                raw = run_extraction(self.driver, spec)
+                for key, value in post_fields_from_dom(raw, matches).items():
+                    fields.setdefault(key, value)
+                self._record_matches(spec, raw, matches)
+                tier = 'xpath'
+            post_data = finish_post_record(fields, post_url)
+        self._record_tier("post", tier)
+        if shortcode:
+            self.known_posts[shortcode] = post_data
+            if self.post_cache is not None:
+                self.post_cache.set(shortcode, post_data)
+        return post_data
+
+    def analyze_creator_profile(self, username, thresholds=None):
+        """Analyze a creator's profile with improved metrics collection
+
+        With thresholds (a scoring.Thresholds), posts are skipped once the outcome is decided: all of
+        them when the follower count can't qualify, the rest after the first viral video. With the
+        creator cache only the stale parts of the last snapshot are re-read, and only grid posts new
+        since the last read are extracted.
+        """
         try:
             logger.info(f"Analyzing profile: {username}")
-            self.driver.get(f"https://www.instagram.com/{username}/")
-            time.sleep(random.uniform(3, 5))
-
-            # Check if account exists and is public
-            try:
-                self.short_wait.until(EC.presence_of_element_located(
-                    (By.XPATH, "//h2[contains(text(), 'Sorry, this page') or contains(text(), 'isn't available')]")))
-                logger.warning(f"Account @{username} doesn't exist or is private")
+            cached, stale = self._cached_profile(username)
+            if not stale:
+                logger.info(f"Using cached profile for @{username}")
+                return self._build_profile(username, cached, cached.get('recent_posts', []))
+
+            self._open(f"https://www.instagram.com/{username}/",
+                       f"//header | {PROFILE_UNAVAILABLE_XPATH}", "profile")
+            header = self._read_profile(username, thresholds, cached, stale)
+            if header is None:
+                if self.creator_cache is not None:
+                    self.creator_cache.forget(username)
                 return None
-            except TimeoutException:
-                pass  # Account exists and is public
-
-            # Extract account metrics
-            metrics = {}
-
-            # Get profile name
-            try:
-                name_element = self.driver.find_element(By.XPATH, "//h1")
-                metrics['name'] = name_element.text
-            except NoSuchElementException:
-                metrics['name'] = username
-
-            # Get bio
-            try:
-                bio_element = self.driver.find_element(
-                    By.XPATH, "//div[contains(@class, '_aa_c')]")
-                metrics['bio'] = bio_element.text
-            except NoSuchElementException:
-                metrics['bio'] = ""
-
-            # Get follower count with multiple possible selectors
-            followers = 0
-            follower_selectors = [
-                "//a[contains(@href, 'followers')]/span",
-                "//a[contains(@href, 'followers')]//span[contains(@class, '_ac2a')]",
-                "//div[contains(@class, '_aa_i')]//span",
-                "//div[contains(@class, '_ab8w')]//span[contains(@class, '_ac2a')]"
-            ]
-
-            for selector in follower_selectors:
-                try:
-                    followers_element = self.driver.find_element(By.XPATH, selector)
-                    followers_text = followers_element.text
-                    if 'k' in followers_text.lower():
-                        followers = float(followers_text.lower().replace('k', '')) * 1000
-                    elif 'm' in followers_text.lower():
-                        followers = float(followers_text.lower().replace('m', '')) * 1000000
-                    else:
-                        followers = int(''.join(filter(str.isdigit, followers_text)))
-                    metrics['followers'] = int(followers)
-                    break
-                except (NoSuchElementException, ValueError):
-                    continue
-
-            if 'followers' not in metrics:
-                metrics['followers'] = 0
-                logger.warning(f"Could not extract follower count for @{username}")
-
-            # Check account type (creator/business account)
-            try:
-                category_element = self.driver.find_element(
-                    By.XPATH, "//div[contains(@class, '_aa_c')]//div[contains(@class, '_ab8w')]")
-                metrics['category'] = category_element.text
-                metrics['is_creator_account'] = True
-            except NoSuchElementException:
-                metrics['category'] = ""
-                metrics['is_creator_account'] = False
-
-            # Get recent posts (works for both grid view and list view)
-            post_urls = []
-            try:
-                post_elements = self.wait.until(EC.presence_of_all_elements_located(
-                    (By.XPATH, "//article//a[contains(@href, '/p/')]")))
-
-                for element in post_elements[:9]:  # Get the most recent 9 posts
-                    try:
-                        url = element.get_attribute('href')
-                        if url and url not in post_urls:
-                            post_urls.append(url)
-                    except Exception as e:
-                        logger.error(f"Error getting post URL: {e}")
-
-                logger.info(f"Found {len(post_urls)} recent posts for @{username}")
-            except TimeoutException:
-                logger.warning(f"No posts found for @{username}")
-
-            # Analyze recent posts to determine engagement trends
-            post_data = []
-            for url in post_urls[:5]:  # Analyze top 5 most recent posts
-                data = self.extract_post_data(url)
+            metrics, post_urls, refreshed = header
+
+            # Analyze recent posts to determine engagement trends - only those new since the last grid read
+            post_data = cached.get('recent_posts', [])
+            recent_urls, history = self._grid_delta(username, post_urls) if post_urls is not None else ([], {})
+            extracted = {}
+            for index, url in enumerate(recent_urls):
+                known = self._known_post(url)
+                data = known or self._fetch_post(url)
                 if data:
-                    post_data.append(data)
-                time.sleep(random.uniform(2, 4))
-
-            # Calculate engagement metrics
-            if post_data:
-                # Overall engagement metrics
-                video_posts = [p for p in post_data if p['is_video']]
-                image_posts = [p for p in post_data if not p['is_video']]
-
-                # Average engagement calculation
-                total_eng_rates = sum(p['engagement_rate'] for p in post_data)
-                avg_engagement_rate = total_eng_rates / len(post_data) if post_data else 0
-
-                # Calculate if on a hot streak (most recent post exceeds avg by 15%+)
-                most_recent_eng = post_data[0]['engagement_rate'] if post_data else 0
-                on_hot_streak = most_recent_eng >= avg_engagement_rate * 1.15
-
-                # Check for any viral content (1M+ views)
-                has_viral_video = any(p['has_million_views'] for p in post_data)
-
-                # Return comprehensive creator profile
-                return {
-                    'username': username,
-                    'name': metrics.get('name', ''),
-                    'bio': metrics.get('bio', ''),
-                    'category': metrics.get('category', ''),
-                    'is_creator_account': metrics.get('is_creator_account', False),
-                    'followers': metrics.get('followers', 0),
-                    'posts_analyzed': len(post_data),
-                    'avg_engagement_rate': avg_engagement_rate,
-                    'latest_post_engagement': most_recent_eng,
-                    'on_hot_streak': on_hot_streak,
-                    'has_viral_video': has_viral_video,
-                    'video_post_count': len(video_posts),
-                    'image_post_count': len(image_posts),
-                    'recent_posts': post_data
-                }
-            else:
-                logger.warning(f"Could not analyze any posts for @{username}")
-                return {
-                    'username': username,
-                    'name': metrics.get('name', ''),
-                    'bio': metrics.get('bio', ''),
-                    'category': metrics.get('category', ''),
-                    'is_creator_account': metrics.get('is_creator_account', False),
-                    'followers': metrics.get('followers', 0),
-                    'posts_analyzed': 0,
-                    'avg_engagement_rate': 0,
-                    'latest_post_engagement': 0,
-                    'on_hot_streak': False,
-                    'has_viral_video': False,
-                    'video_post_count': 0,
-                    'image_post_count': 0,
-                    'recent_posts': []
-                }
+                    extracted[shortcode_from_url(url) or url] = data
+
+                # A viral video settles qualification, so the remaining posts aren't needed
+                remaining = len(recent_urls) - index - 1
+                if thresholds and remaining and data and data['is_video'] and data['views'] >= thresholds.viral_views:
+                    logger.info(f"Viral video found for @{username}, skipping {remaining} remaining posts")
+                    self.early_exits.record('viral_video', remaining)
+                    # An incomplete post list isn't a snapshot worth caching
+                    refreshed.discard('posts')
+                    break
+                if not known:
+                    self.pacing.pause(2, 4, "between_posts")
+            if post_urls is not None:
+                post_data = self._merge_grid(username, post_urls, history, extracted)
+
+            profile_data = self._build_profile(username, metrics, post_data)
+            if self.creator_cache is not None and refreshed:
+                self.creator_cache.update(username, profile_data, refreshed)
+            return profile_data
         except Exception as e:
             logger.error(f"Error analyzing profile: {str(e)}")
             self.driver.save_screenshot(f"profile_error_{username}.png")
             return None
 
+    def _cached_profile(self, username):
+        """Return (snapshot, stale tiers) from the creator cache; without one every tier is stale"""
+        if self.creator_cache is None:
+            return {}, set(CACHE_TIERS)
+        return self.creator_cache.lookup(username)
+
+    def _read_profile(self, username, thresholds=None, cached=None, stale=None):
+        """Read the profile open in the current window
+
+        Returns (metrics, recent post URLs, refreshed cache tiers), or None if the profile is unavailable.
+        Only the header tiers in stale are extracted, the rest come from cached; post URLs are None
+        when the cached posts are still fresh.
+        """
+        cached = cached or {}
+        stale = set(CACHE_TIERS) if stale is None else stale
+
+        # Check if account exists and is public
+        if self.driver.find_elements(By.XPATH, PROFILE_UNAVAILABLE_XPATH):
+            logger.warning(f"Account @{username} doesn't exist or is private")
+            return None
+
+        # Extract account metrics - embedded JSON and meta tags first, XPath chains for anything missing
+        metrics = {key: value for key, value in cached.items() if key != 'recent_posts'}
+        refreshed = set()
+        if stale & set(HEADER_TIERS):
+            with self.latency.measure("extract", "profile"):
+                read, tier = profile_from_embedded(read_embedded_data(self.driver), username)
+                if tier is None:
+                    # Only the selectors for stale metrics the embedded data didn't supply run,
+                    # e.g. just followers when name, bio and category are fresh
+                    missing = [key for cache_tier in HEADER_TIERS if cache_tier in stale
+                               for key in CACHE_TIERS[cache_tier] if key not in read]
+                    fields = fields_for(PROFILE_FIELDS, PROFILE_FIELD_SOURCES, missing)
+                    matches = {}
+                    raw = run_extraction(self.driver, fields)
+                    found_followers = 'followers' in read
+                    for key, value in build_profile_metrics(raw, username, matches).items():
+                        read.setdefault(key, value)
+                    # A follower count no selector could parse isn't worth caching
+                    if 'followers' in fields and not found_followers and not any(matches.get('followers', [])):
+                        read.pop('followers', None)
+                    self._record_matches(fields, raw, matches)
+                    tier = 'xpath'
+            self._record_tier("profile", tier)
+            metrics.update(read)
+            refreshed = {cache_tier for cache_tier in HEADER_TIERS if all(key in read for key in CACHE_TIERS[cache_tier])}
+
+        # Recent posts are still fresh in the cache
+        if 'posts' not in stale:
+            return metrics, None, refreshed
+
+        # Get recent posts (works for both grid view and list view)
+        post_urls = []
+        followers = metrics.get('followers', 0)
+        if thresholds and followers < thresholds.min_followers:
+            logger.info(f"Skipping posts for @{username}: {followers:,} followers is below {thresholds.min_followers:,}")
+            self.early_exits.record('followers', POSTS_PER_PROFILE)
+            return metrics, post_urls, refreshed
+
+        try:
+            self.wait.until(EC.presence_of_element_located((By.XPATH, GRID_POST_XPATH)))
+
+            # Get the most recent 9 posts
+            for url in run_extraction(self.driver, GRID_FIELDS)['post_urls']:
+                if url and url not in post_urls:
+                    post_urls.append(url)
+
+            logger.info(f"Found {len(post_urls)} recent posts for @{username}")
+            refreshed.add('posts')
+        except TimeoutException:
+            logger.warning(f"No posts found for @{username}")
+
+        if not post_urls:
+            logger.warning(f"Could not analyze any posts for @{username}")
+        return metrics, post_urls, refreshed
+
+    def _grid_delta(self, username, post_urls):
+        """Split a grid's recent posts into (URLs to extract, {shortcode: post data} from the creator's history)
+
+        Without the creator cache every recent post is extracted.
+        """
+        recent_urls = post_urls[:POSTS_PER_PROFILE]
+        if self.creator_cache is None or not recent_urls:
+            return recent_urls, {}
+        shortcodes = [shortcode_from_url(url) or url for url in recent_urls]
+        new, history = self.creator_cache.delta(username, shortcodes)
+        if not new:
+            logger.info(f"No new posts for @{username} since the last snapshot")
+        elif history:
+            logger.info(f"{len(new)} new posts for @{username}, reusing {len(history)} from the last snapshot")
+        new = set(new)
+        return [url for url, shortcode in zip(recent_urls, shortcodes) if shortcode in new], history
+
+    def _merge_grid(self, username, post_urls, history, extracted):
+        """Merge newly extracted posts into the creator's history and return the recent posts in grid order"""
+        shortcodes = [shortcode_from_url(url) or url for url in post_urls[:POSTS_PER_PROFILE]]
+        if self.creator_cache is not None:
+            self.creator_cache.merge_posts(username, shortcodes, extracted)
+        posts = dict(history, **extracted)
+        return [posts[shortcode] for shortcode in shortcodes if shortcode in posts]
+
+    def _build_profile(self, username, metrics, post_data):
+        """Combine header metrics and analyzed posts into the profile dict"""
+        # Engagement aggregates, hot streak and viral flags
+        profile_data = {
+            'username': username,
+            'name': metrics.get('name', ''),
+            'bio': metrics.get('bio', ''),
+            'category': metrics.get('category', ''),
+            'is_creator_account': metrics.get('is_creator_account', False),
+            'followers': metrics.get('followers', 0)
+        }
+        profile_data.update(score_profile(post_data, self.thresholds))
+        profile_data['recent_posts'] = post_data
+        return profile_data
+
     def find_suggested_accounts(self, seed_account):
         """Use Instagram's suggestion algorithm to find similar creators"""
+        return list(self.iter_suggested_accounts(seed_account))
+
+    def iter_suggested_accounts(self, seed_account):
+        """Yield usernames similar to seed_account; all are read and the dialog closed before the first is yielded"""
+        suggested_accounts = []
         try:
             logger.info(f"Finding accounts similar to: {seed_account}")
-            self.driver.get(f"https://www.instagram.com/{seed_account}/")
-            time.sleep(3)
+            self._open(f"https://www.instagram.com/{seed_account}/", "//a[contains(@href, 'followers')]",
+                       "suggested")
 
             # Click on followers to open the list
             followers_link = self.wait.until(EC.element_to_be_clickable(
                 (By.XPATH, "//a[contains(@href, 'followers')]")))
             followers_link.click()
-            time.sleep(3)
 
             # Get accounts from the followers list
-            suggested_accounts = []
             try:
-                account_elements = self.wait.until(EC.presence_of_all_elements_located(
+                self.wait.until(EC.presence_of_element_located(
                     (By.XPATH, "//div[@role='dialog']//a[contains(@class, 'notranslate')]")))
 
-                for element in account_elements[:20]:  # Get up to 20 suggested accounts
-                    try:
-                        username = element.text
-                        if username and username != seed_account and username not in suggested_accounts:
-                            suggested_accounts.append(username)
-                    except Exception as e:
-                        logger.error(f"Error getting suggested account: {e}")
+                # Get up to 20 suggested accounts in one round-trip
+                for username in run_extraction(self.driver, SUGGESTED_FIELDS)['usernames']:
+                    if username and username != seed_account and username not in suggested_accounts:
+                        suggested_accounts.append(username)
 
                 logger.info(f"Found {len(suggested_accounts)} accounts similar to @{seed_account}")
             except TimeoutException:
                 logger.warning(f"Could not find suggested accounts for @{seed_account}")
-
-            # Close the dialog
-            try:
-                close_button = self.driver.find_element(By.XPATH,
-                                                        "//div[@role='dialog']//button[contains(@aria-label, 'Close')]")
-                close_button.click()
-                time.sleep(1)
-            except NoSuchElementException:
-                pass
-
-            return suggested_accounts
+            finally:
+                # Close the dialog
+                try:
+                    close_button = self.driver.find_element(By.XPATH,
+                                                            "//div[@role='dialog']//button[contains(@aria-label, 'Close')]")
+                    close_button.click()
+                    self.pacing.pause(1, 1, "dialog_close")
+                except NoSuchElementException:
+                    pass
         except Exception as e:
             logger.error(f"Error finding suggested accounts: {str(e)}")
-            return []
-
-    def find_viral_creators(self, industry_tags=None, min_followers=1000, min_engagement=5.0):
-        """Find creators with viral potential using multiple discovery methods"""
+        yield from suggested_accounts
+
+    def find_viral_creators(self, industry_tags=None, min_followers=1000, min_engagement=5.0,
+                            workers=1, max_concurrency=None, journal_path="run_journal.jsonl", resume=False,
+                            max_seconds=None, max_pages=None, tabs=1, recycle_after=50):
+        """Find creators with viral potential using multiple discovery methods
+
+        With workers > 1 the profile analysis is spread over a pool of Chrome sessions
+        sharing this session's login cookies. Each discovery step and analyzed profile is
+        journaled to journal_path as it completes; resume=True skips work already journaled.
+        Profiles are analyzed most promising first within each phase (creators from posts, then
+        those from account discovery); max_seconds / max_pages stop the analysis once that much
+        time or that many page loads have been spent on it. The account discovery between the two
+        phases does not count towards either budget. With tabs > 1 (and a
+        single worker) profiles and their posts load concurrently in that many tabs of this
+        session, each replaced after recycle_after page loads.
+        """
+        for _ in self.iter_viral_creators(industry_tags, min_followers, min_engagement, workers, max_concurrency,
+                                          journal_path, resume, max_seconds, max_pages, tabs=tabs,
+                                          recycle_after=recycle_after):
+            pass
+        return self.creators_data
+
+    def iter_viral_creators(self, industry_tags=None, min_followers=1000, min_engagement=5.0,
+                            workers=1, max_concurrency=None, journal_path="run_journal.jsonl", resume=False,
+                            max_seconds=None, max_pages=None, keep_results=True, tabs=1, recycle_after=50):
+        """Yield each qualified creator profile as soon as it is analyzed (see find_viral_creators)
+
+        Creators surfaced by hashtag and explore posts are analyzed, and yielded, before keyword and
+        similar-account discovery run. With keep_results=False qualified creators are not added to
+        creators_data, so memory stays flat for consumers that handle each profile themselves.
+        """
         if industry_tags is None:
             industry_tags = ["viral", "trending", "creator", "contentcreator"]
 
-        all_creators = set()
-        viral_creators = []
-
-        # Method 1: Search popular hashtags in the industry
-        logger.info("DISCOVERY METHOD 1: Hashtag search")
-        for tag in industry_tags:
-            posts = self.search_hashtag(tag)
-            for post_url in posts:
-                try:
-                    post_data = self.extract_post_data(post_url)
-                    if post_data and post_data['username'] not in all_creators:
-                        all_creators.add(post_data['username'])
-                        # Quick filter: only analyze profiles with high engagement or viral indicators
-                        if post_data['has_million_views'] or post_data['engagement_rate'] > min_engagement:
-                            logger.info(f"Found potential creator @{post_data['username']} from hashtag #{tag}")
-                except Exception as e:
-                    logger.error(f"Error processing post {post_url}: {str(e)}")
-                time.sleep(random.uniform(1, 2))
-
-        # Method 2: Explore page for trending content
-        logger.info("DISCOVERY METHOD 2: Explore page")
-        trending_posts = self.explore_page()
-        for post_url in trending_posts:
-            try:
-                post_data = self.extract_post_data(post_url)
-                if post_data and post_data['username'] not in all_creators:
-                    all_creators.add(post_data['username'])
-                    if post_data['has_million_views'] or post_data['engagement_rate'] > min_engagement:
-                        logger.info(f"Found potential creator @{post_data['username']} from explore page")
-            except Exception as e:
-                logger.error(f"Error processing explore post {post_url}: {str(e)}")
-            time.sleep(random.uniform(1, 2))
-
-        # Method 3: Search for industry keywords to find creator accounts
-        logger.info("DISCOVERY METHOD 3: Keyword search")
-        keywords = ["content creator", "viral creator", "trending"]
-        for keyword in keywords:
-            accounts = self.search_keyword(keyword)
-            for username in accounts:
-                if username not in all_creators:
-                    all_creators.add(username)
-                    logger.info(f"Found potential creator @{username} from keyword '{keyword}'")
-            time.sleep(random.uniform(2, 3))
-
-        # Method 4: Use seed accounts to find similar creators
-        logger.info("DISCOVERY METHOD 4: Similar account discovery")
-        seed_accounts = list(all_creators)[:3] if all_creators else ["instagram"]
-        for seed in seed_accounts:
-            similar_accounts = self.find_suggested_accounts(seed)
-            for username in similar_accounts:
-                if username not in all_creators:
-                    all_creators.add(username)
-                    logger.info(f"Found potential creator @{username} similar to @{seed}")
-            time.sleep(random.uniform(2, 3))
-
-        # Analyze each discovered creator in depth
-        logger.info(f"Found {len(all_creators)} potential creators. Analyzing profiles...")
-        for username in all_creators:
-            profile_data = self.analyze_creator_profile(username)
-
-            if profile_data and profile_data['followers'] >= min_followers:
+        journal = RunJournal(journal_path, resume=resume) if journal_path else None
+
+        # Insertion-ordered so seed accounts are the same when a run is resumed
+        all_creators = {}
+        # A new store per run, so the store an earlier find_viral_creators call returned is left intact
+        self.store = CreatorStore()
+        self.known_posts = {}
+        self.thresholds = Thresholds(min_followers=min_followers, min_engagement=min_engagement)
+        self.early_exits = EarlyExitReport()
+        self.latency.reset()
+        if self.creator_cache is not None:
+            self.creator_cache.reset_stats()
+
+        # Discovery signals decide the order profiles are analyzed in
+        scheduler = CreatorScheduler(max_seconds, max_pages, page_counter=self._pages_loaded)
+
+        # Post URLs from every post-based method, deduplicated by shortcode: shortcode -> (post_url, method, source)
+        discovered_posts = {}
+
+        def add_posts(post_urls, method, source):
+            for post_url in post_urls:
+                shortcode = shortcode_from_url(post_url)
+                if shortcode and shortcode not in discovered_posts:
+                    discovered_posts[shortcode] = (canonical_post_url(post_url), method, source)
+
+        def fetch_post(post_url):
+            known = self._known_post(post_url)
+            if known:
+                return known
+            post_data = self._fetch_post(post_url)
+            self.pacing.pause(1, 2, "between_posts")
+            return post_data
+
+        qualified = 0
+        analyzed = set()
+
+        def analyze_queued():
+            # Analyze each queued creator in depth, highest discovery priority first
+            nonlocal qualified
+            usernames = [username for username in scheduler.drain() if username not in analyzed]
+            analyzed.update(usernames)
+            for username, profile_data in self._analyze_profiles(usernames, workers, max_concurrency, journal,
+                                                                 budget=scheduler, tabs=tabs,
+                                                                 recycle_after=recycle_after):
                 # Check for viral indicators:
                 # 1. Has a video with 1M+ views
                 # 2. Currently on a hot streak (15%+ above average engagement)
                 # 3. Consistently high engagement rate
-                if (profile_data['has_viral_video'] or
-                        profile_data['on_hot_streak'] or
-                        profile_data['avg_engagement_rate'] > min_engagement):
-                    viral_creators.append(profile_data)
+                if profile_data and qualifies(profile_data, self.thresholds):
+                    qualified += 1
+                    if keep_results:
+                        self.store.add_profile(profile_data)
                     logger.info(f"✅ Qualified viral creator: @{username}")
                     logger.info(f"   Followers: {profile_data['followers']:,}")
                     logger.info(f"   Viral video: {'Yes' if profile_data['has_viral_video'] else 'No'}")
                     logger.info(f"   Hot streak: {'Yes' if profile_data['on_hot_streak'] else 'No'}")
                     logger.info(f"   Avg engagement: {profile_data['avg_engagement_rate']:.2f}%")
+                    yield profile_data
 
-            time.sleep(random.uniform(3, 5))
+        try:
+            # Method 1: Search popular hashtags in the industry
+            logger.info("DISCOVERY METHOD 1: Hashtag search")
+            for tag in industry_tags:
+                posts = self._journaled(journal, "hashtag", tag, lambda: self.search_hashtag(tag))
+                add_posts(posts, "hashtag", f"hashtag #{tag}")
+
+            # Method 2: Explore page for trending content
+            logger.info("DISCOVERY METHOD 2: Explore page")
+            trending_posts = self._journaled(journal, "explore", "explore", self.explore_page)
+            add_posts(trending_posts, "explore", "explore page")
+
+            # Each post surfaced by methods 1 and 2 is fetched once; profile analysis reuses the records
+            logger.info(f"Fetching {len(discovered_posts)} unique posts from hashtag and explore discovery")
+            for shortcode, (post_url, method, source) in discovered_posts.items():
+                try:
+                    post_data = self._journaled(journal, "post", post_url, lambda: fetch_post(post_url))
+                    if post_data:
+                        self.known_posts.setdefault(shortcode, post_data)
+                        scheduler.add(post_data['username'], method, post_data)
+                    if post_data and post_data['username'] not in all_creators:
+                        all_creators[post_data['username']] = True
+                        # Quick filter: only analyze profiles with high engagement or viral indicators
+                        if post_data['has_million_views'] or post_data['engagement_rate'] > min_engagement:
+                            logger.info(f"Found potential creator @{post_data['username']} from {source}")
+                except Exception as e:
+                    logger.error(f"Error processing post {post_url}: {str(e)}")
+
+            # Creators from post discovery are analyzed before the slower account-based methods run
+            logger.info(f"Found {len(all_creators)} potential creators from posts. Analyzing profiles...")
+            scheduler.start()
+            yield from analyze_queued()
+            # The budgets cover profile analysis only, not the account discovery below
+            scheduler.pause()
+
+            # Method 3: Search for industry keywords to find creator accounts
+            logger.info("DISCOVERY METHOD 3: Keyword search")
+            keywords = ["content creator", "viral creator", "trending"]
+            for keyword in keywords:
+                accounts = self._journaled(journal, "keyword", keyword, lambda: self.search_keyword(keyword))
+                for username in accounts:
+                    scheduler.add(username, "keyword")
+                    if username not in all_creators:
+                        all_creators[username] = True
+                        logger.info(f"Found potential creator @{username} from keyword '{keyword}'")
+
+            # Method 4: Use seed accounts to find similar creators
+            logger.info("DISCOVERY METHOD 4: Similar account discovery")
+            seed_accounts = list(all_creators)[:3] if all_creators else ["instagram"]
+            for seed in seed_accounts:
+                similar_accounts = self._journaled(journal, "suggested", seed, lambda: self.find_suggested_accounts(seed))
+                for username in similar_accounts:
+                    scheduler.add(username, "suggested")
+                    if username not in all_creators:
+                        all_creators[username] = True
+                        logger.info(f"Found potential creator @{username} similar to @{seed}")
+
+            logger.info(f"Found {len(all_creators)} potential creators in total. Analyzing new profiles...")
+            scheduler.resume()
+            yield from analyze_queued()
+        finally:
+            # Runs when the consumer stops early too
+            if journal:
+                journal.close()
+            logger.info(f"Found {qualified} qualified viral creators")
+            if self.post_cache is not None:
+                logger.info(f"Post cache: {self.post_cache.stats()}")
+            if self.creator_cache is not None:
+                logger.info(f"Creator cache: {self.creator_cache.stats()}")
+            self._log_tiers()
+            self.early_exits.log(self.latency)
+            self.selectors.save()
+            self.latency.log()
+            if self.fetch:
+                self.fetch.log()
+
+    def _log_tiers(self):
+        """Log how often each extraction tier completed post and profile pages"""
+        summary = self.selectors.summary()
+        for page_type in ("post", "profile"):
+            hits = {tier: summary.get(f"{page_type}_tier", {}).get(tier, {}).get('hits', 0) for tier in EXTRACTION_TIERS}
+            logger.info(f"Extraction tier hits ({page_type}, all runs): {hits}")
+
+    def _journaled(self, journal, method, key, func):
+        """Return a discovery step's journaled output, or run func and journal what it returns
+
+        Empty or failed results are not journaled so a resumed run retries them.
+        """
+        if journal is None:
+            return func()
+        if journal.has_step(method, key):
+            logger.info(f"Skipping {method} '{key}' - already journaled")
+            return journal.step(method, key)
+
+        result = func()
+        if result:
+            journal.record_step(method, key, result)
+        return result
+
+    def _pages_loaded(self):
+        """Return how many profile and post pages have been navigated to so far"""
+        return self.latency.count("ready", "profile.navigate") + self.latency.count("ready", "post.navigate")
+
+    def _analyze_profiles(self, usernames, workers=1, max_concurrency=None, journal=None, budget=None,
+                          tabs=1, recycle_after=50):
+        """Yield (username, profile_data) for each username, in parallel when workers > 1
+
+        With a single worker and tabs > 1 the pages load concurrently in tabs of this session instead.
+        Once budget (a CreatorScheduler) is exhausted the remaining usernames are skipped.
+        """
+        skipped = []
+
+        def analyze(finder, username):
+            if budget is not None and budget.exhausted():
+                skipped.append(username)
+                return None
+            profile_data = finder.analyze_creator_profile(username, self.thresholds)
+            if journal and profile_data:
+                journal.record_profile(username, profile_data)
+            finder.pacing.pause(3, 5, "between_profiles")
+            return profile_data
+
+        if journal:
+            done = [username for username in usernames if journal.has_profile(username)]
+            if done:
+                logger.info(f"Skipping {len(done)} profiles already journaled")
+            for username in done:
+                yield username, journal.profile(username)
+            usernames = [username for username in usernames if not journal.has_profile(username)]
+
+        if workers <= 1 and tabs > 1:
+            yield from self._analyze_profiles_in_tabs(usernames, tabs, recycle_after, journal, budget, skipped)
+        elif workers <= 1:
+            for username in usernames:
+                yield username, analyze(self, username)
+        else:
+            with DriverPool(workers, headless=self.headless, max_concurrency=max_concurrency,
+                            performance_log=self.fetch is not None) as pool:
+                pool.share_session(self.driver.get_cookies())
+                start = time.time()
+                analyzed = 0
+                for username, profile_data in pool.iter_run(list(usernames),
+                                                            lambda driver, username: analyze(self._worker(driver), username)):
+                    analyzed += 1
+                    yield username, profile_data
+                logger.info(f"Analyzed {analyzed} profiles with {workers} sessions in {time.time() - start:.1f}s")
+
+        if skipped:
+            logger.info(f"Analysis budget used up, skipped {len(skipped)} lower-priority profiles")
+
+    def _analyze_profiles_in_tabs(self, usernames, tabs, recycle_after, journal=None, budget=None, skipped=None):
+        """Yield (username, profile_data) with pages loading concurrently in a pool of tabs
+
+        Usernames are handled in batches: the batch's profile pages load across the tabs, then the
+        recent posts not already known, then the profiles are assembled. The budget is checked
+        between batches.
+        """
+        batch_size = tabs * 4
+        start = time.time()
+        analyzed = 0
+        with TabPool(self.driver, tabs, recycle_after=recycle_after, report=self.latency) as pool:
+            for offset in range(0, len(usernames), batch_size):
+                batch = usernames[offset:offset + batch_size]
+                if budget is not None and budget.exhausted():
+                    if skipped is not None:
+                        skipped.extend(usernames[offset:])
+                    break
+
+                # Profile pages (unless the cached snapshot is fresh): header metrics and recent post URLs
+                snapshots = {username: self._cached_profile(username) for username in batch}
+                headers = dict(pool.map(
+                    (username, f"https://www.instagram.com/{username}/", f"//header | {PROFILE_UNAVAILABLE_XPATH}",
+                     "profile",
+                     lambda username=username: self._read_profile(username, self.thresholds, *snapshots[username]))
+                    for username in batch if snapshots[username][1]))
+
+                # Post pages new since the creator's last grid read and not already analyzed this run or cached
+                post_urls = []
+                deltas = {}
+                for username in batch:
+                    grid = (headers.get(username) or (None, None))[1]
+                    if grid is None:
+                        continue
+                    deltas[username] = self._grid_delta(username, grid)
+                    for url in deltas[username][0]:
+                        if url not in post_urls and not self._known_post(url):
+                            post_urls.append(url)
+                logger.info(f"Loading {len(post_urls)} posts for {len(batch)} profiles in {tabs} tabs")
+                for _ in pool.map((url, url, POST_USERNAME_XPATH, "post", lambda url=url: self._read_post(url))
+                                  for url in post_urls):
+                    pass
 
-        self.creators_data = viral_creators
-        logger.info(f"Found {len(viral_creators)} qualified viral creators")
-        return viral_creators
+                for username in batch:
+                    cached, stale = snapshots[username]
+                    header = headers.get(username) if stale else (cached, None, set())
+                    profile_data = None
+                    if header:
+                        metrics, urls, refreshed = header
+                        if urls is None:
+                            post_data = cached.get('recent_posts', [])
+                        else:
+                            new_urls, history = deltas[username]
+                            extracted = {shortcode_from_url(url) or url: self.known_posts.get(shortcode_from_url(url))
+                                         for url in new_urls}
+                            post_data = self._merge_grid(username, urls, history,
+                                                         {key: data for key, data in extracted.items() if data})
+                        profile_data = self._build_profile(username, metrics, post_data)
+                        if self.creator_cache is not None and refreshed:
+                            self.creator_cache.update(username, profile_data, refreshed)
+                        if journal:
+                            journal.record_profile(username, profile_data)
+                    analyzed += 1
+                    yield username, profile_data
+
+                self.pacing.pause(3, 5, "between_profiles")
+            pool.log()
+        logger.info(f"Analyzed {analyzed} profiles with {tabs} tabs in {time.time() - start:.1f}s")
 
     def send_message(self, username, message_template):
         """Send a DM to a creator with improved reliability"""
         try:
             logger.info(f"Attempting to message: {username}")
-            self.driver.get(f"https://www.instagram.com/{username}/")
-            time.sleep(random.uniform(2, 4))
+            self._open(f"https://www.instagram.com/{username}/", "//header", "message_profile")
 
             # Try multiple selectors for the message button
             message_selectors = [
@@ -1361,20 +996,23 @@ class EnhancedInstagramFinder:
             ]
 
             clicked = False
-            for selector in message_selectors:
+            for selector in self.selectors.ordered("message_button", message_selectors):
+                start = time.time()
                 try:
                     message_btn = self.wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
+                    self.selectors.record("message_button", selector, True, time.time() - start)
                     message_btn.click()
                     clicked = True
                     break
                 except TimeoutException:
+                    self.selectors.record("message_button", selector, False, time.time() - start)
                     continue
 
             if not clicked:
                 logger.error(f"Could not find message button for @{username}")
                 return False
 
-            time.sleep(random.uniform(2, 4))
+            self.pacing.pause(2, 4, "message_open")
 
             # Type message - try multiple selectors for the input field
             input_selectors = [
@@ -1384,5 +1022,56 @@ class EnhancedInstagramFinder:
             ]
 
             typed = False
->>>>>>> 74e0a59b183e241dba29b30c41bc7f2f58c5a7d8
-            for selector in input_selectors:
\ No newline at end of file
+            for selector in self.selectors.ordered("message_input", input_selectors):
+                start = time.time()
+                try:
+                    message_input = self.wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
+                    self.selectors.record("message_input", selector, True, time.time() - start)
+                    message_input.click()
+                    self._type_like_human(message_input, message_template)
+                    typed = True
+                    break
+                except TimeoutException:
+                    self.selectors.record("message_input", selector, False, time.time() - start)
+                    continue
+
+            if not typed:
+                logger.error(f"Could not find message input for @{username}")
+                return False
+
+            self.pacing.pause(1, 1, "message_typed")
+
+            # Send message
+            send_btn = self.wait.until(EC.element_to_be_clickable(
+                (By.XPATH, "//button[text()='Send'] | //div[@role='button' and text()='Send']")))
+            send_btn.click()
+
+            logger.info(f"Message sent to {username}")
+            self.pacing.pause(5, 10, "between_messages")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to send message to {username}: {str(e)}")
+            return False
+
+    def export_results(self, archive_dir="creator_results", filename="creator_outreach_results.csv",
+                       posts_filename="creator_outreach_posts.csv"):
+        """Append this run's creators and posts to the Parquet archive (CSV when pyarrow isn't installed)"""
+        if not self.creators_data:
+            return
+        if results_archive.available():
+            paths = results_archive.write_run(self.store, archive_dir)
+            logger.info(f"Results appended to {', '.join(paths)}")
+        else:
+            logger.warning("pyarrow is not installed, exporting CSV instead of Parquet")
+            self.store.export_csv(filename, posts_filename)
+            logger.info(f"Results exported to {filename}" + (f" and {posts_filename}" if posts_filename else ""))
+
+    def close(self):
+        """Close the browser"""
+        self.selectors.save()
+        self.driver.quit()
+        if self.post_cache is not None:
+            self.post_cache.close()
+        if self.creator_cache is not None:
+            self.creator_cache.close()
+        logger.info("Browser closed")
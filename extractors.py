@@ -0,0 +1,279 @@
+import logging
+
+from counts import parse_count
+
+logger = logging.getLogger(__name__)
+
+POST_USERNAME_XPATH = "//a[contains(@class, 'x1i10hfl') and not(contains(@href, 'tagged'))]"
+GRID_POST_XPATH = "//article//a[contains(@href, '/p/')]"
+
+# Field specs evaluated in the page by EXTRACT_SCRIPT. Each field lists its XPaths in fallback order.
+#   attr  - read this attribute/property instead of the rendered text
+#   each  - return the first match of every XPath so Python can fall through values that don't parse,
+#           with per-XPath evaluation time (ms) under result['_timings'][field]
+#   count - return the number of nodes matched by the first XPath
+#   limit - return the attribute/text of up to `limit` nodes matched by the first XPath
+POST_FIELDS = {
+    'username': {'xpaths': [POST_USERNAME_XPATH], 'attr': 'href'},
+    'views': {'xpaths': ["//span[contains(text(), 'views') or contains(text(), 'Views')]/.."]},
+    'likes': {'xpaths': [
+        "//section//span/span[contains(@class, 'x193iq5w')]",
+        "//section//a[contains(@href, 'liked_by')]/span",
+        "//span[contains(@class, '_aap6')]",
+        "//article//span[contains(@class, 'x193iq5w')]"
+    ], 'each': True},
+    'comments': {'xpaths': ["//span[contains(text(), 'comment') or contains(text(), 'Comment')]"]},
+    'comment_items': {'xpaths': ["//ul//li[contains(@class, 'gLFyf')]"], 'count': True},
+    'timestamp': {'xpaths': ["//time"], 'attr': 'datetime'},
+    'caption': {'xpaths': ["//div[contains(@class, '_a9zs')]/span"]}
+}
+
+PROFILE_FIELDS = {
+    'name': {'xpaths': ["//h1"]},
+    'bio': {'xpaths': ["//div[contains(@class, '_aa_c')]"]},
+    'followers': {'xpaths': [
+        "//a[contains(@href, 'followers')]/span",
+        "//a[contains(@href, 'followers')]//span[contains(@class, '_ac2a')]",
+        "//div[contains(@class, '_aa_i')]//span",
+        "//div[contains(@class, '_ab8w')]//span[contains(@class, '_ac2a')]"
+    ], 'each': True},
+    'category': {'xpaths': ["//div[contains(@class, '_aa_c')]//div[contains(@class, '_ab8w')]"]}
+}
+
+# The POST_FIELDS / PROFILE_FIELDS entries that supply each post field and profile metric
+POST_FIELD_SOURCES = {
+    'username': ['username'],
+    'is_video': ['views'],
+    'views': ['views'],
+    'likes': ['likes'],
+    'comments': ['comments', 'comment_items'],
+    'timestamp': ['timestamp'],
+    'caption': ['caption']
+}
+PROFILE_FIELD_SOURCES = {
+    'name': ['name'],
+    'bio': ['bio'],
+    'followers': ['followers'],
+    'category': ['category'],
+    'is_creator_account': ['category']
+}
+
+GRID_FIELDS = {
+    'post_urls': {'xpaths': [GRID_POST_XPATH], 'attr': 'href', 'limit': 9}
+}
+
+# Discovery pages, read in one round-trip before any value is handed to a caller
+EXPLORE_FIELDS = {
+    'post_urls': {'xpaths': ["//a[contains(@href, '/p/')]"], 'attr': 'href', 'limit': 30}
+}
+HASHTAG_FIELDS = {
+    'post_urls': {'xpaths': [GRID_POST_XPATH], 'attr': 'href', 'limit': 20}
+}
+KEYWORD_FIELDS = {
+    'account_urls': {'xpaths': ["//div[@role='none']//a[contains(@href, '/')]"], 'attr': 'href', 'limit': 10}
+}
+SUGGESTED_FIELDS = {
+    'usernames': {'xpaths': ["//div[@role='dialog']//a[contains(@class, 'notranslate')]"], 'limit': 20}
+}
+
+# Evaluates a field spec against the live DOM in one round-trip and returns a plain JSON object.
+# Text is read with innerText to match what WebElement.text reports; attributes prefer the DOM
+# property (resolved absolute href, dateTime) like WebElement.get_attribute does.
+EXTRACT_SCRIPT = """
+var spec = arguments[0];
+var result = {};
+var timings = {};
+function nodes(xpath) {
+    return document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+}
+function read(node, attr) {
+    if (!node) { return null; }
+    if (attr) {
+        var prop = attr === 'datetime' ? 'dateTime' : attr;
+        if (node[prop] !== undefined && node[prop] !== null && node[prop] !== '') { return String(node[prop]); }
+        return node.getAttribute(attr);
+    }
+    return (node.innerText !== undefined ? node.innerText : node.textContent).trim();
+}
+for (var name in spec) {
+    var field = spec[name];
+    if (field.count) {
+        result[name] = nodes(field.xpaths[0]).snapshotLength;
+    } else if (field.limit) {
+        var matches = nodes(field.xpaths[0]);
+        var values = [];
+        for (var i = 0; i < matches.snapshotLength && values.length < field.limit; i++) {
+            values.push(read(matches.snapshotItem(i), field.attr));
+        }
+        result[name] = values;
+    } else if (field.each) {
+        var times = [];
+        result[name] = field.xpaths.map(function (xpath) {
+            var start = performance.now();
+            var value = read(nodes(xpath).snapshotItem(0), field.attr);
+            times.push(performance.now() - start);
+            return value;
+        });
+        timings[name] = times;
+    } else {
+        result[name] = null;
+        for (var j = 0; j < field.xpaths.length; j++) {
+            var value = read(nodes(field.xpaths[j]).snapshotItem(0), field.attr);
+            if (value !== null) { result[name] = value; break; }
+        }
+    }
+}
+result._timings = timings;
+return result;
+"""
+
+
+# Probes a list of XPaths in one round-trip and returns [index, element] for the first one with a
+# visible, enabled match (in list order), or null when none match yet.
+FIRST_VISIBLE_SCRIPT = """
+var xpaths = arguments[0];
+for (var i = 0; i < xpaths.length; i++) {
+    var matches = document.evaluate(xpaths[i], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var j = 0; j < matches.snapshotLength; j++) {
+        var node = matches.snapshotItem(j);
+        var box = node.getBoundingClientRect();
+        if (box.width > 0 && box.height > 0 && !node.disabled) { return [i, node]; }
+    }
+}
+return null;
+"""
+
+
+def fields_for(spec, sources, keys):
+    """Return the part of a field spec needed to supply keys (see POST_FIELD_SOURCES)"""
+    names = {name for key in keys for name in sources[key]}
+    return {name: field for name, field in spec.items() if name in names}
+
+
+def run_extraction(driver, fields):
+    """Evaluate every field of a spec in the page with a single execute_script call"""
+    return driver.execute_script(EXTRACT_SCRIPT, fields)
+
+
+def first_visible(driver, xpaths):
+    """Return (index, element) of the first XPath with a visible match, or None"""
+    match = driver.execute_script(FIRST_VISIBLE_SCRIPT, xpaths)
+    return tuple(match) if match else None
+
+
+def _parse_each(texts):
+    """Parse the value of every selector in an `each` chain
+
+    Returns (the first count that parses, in declared order, or None; whether each selector's text parsed).
+    """
+    value = None
+    parsed = []
+    for text in texts:
+        try:
+            count = parse_count(text)
+        except ValueError:
+            parsed.append(False)
+            continue
+        parsed.append(True)
+        if value is None:
+            value = count
+    return value, parsed
+
+
+def post_fields_from_dom(raw, matches=None):
+    """Turn raw field values from POST_FIELDS into post fields
+
+    Only the fields whose POST_FIELDS entries are in raw are returned, so a partial spec can be
+    extracted. If matches is a dict, whether each selector of a multi-selector field parsed is
+    stored in it, as a list in the field's declared selector order.
+    """
+    fields = {}
+    if 'username' in raw:
+        fields['username'] = raw['username'].split('/')[-2]
+
+    # Check if it's a video by looking for view count
+    if 'views' in raw:
+        fields['is_video'] = False
+        fields['views'] = 0
+        if raw['views'] is not None:
+            # Parse counts from text like "1,234,567 views" or "1.2M views"
+            fields['views'] = parse_count(raw['views'])
+            fields['is_video'] = True
+
+    # Extract likes - the first selector (in declared order) whose text parses wins
+    if 'likes' in raw:
+        likes, parsed = _parse_each(raw['likes'])
+        fields['likes'] = likes if likes is not None else 0
+        if matches is not None:
+            matches['likes'] = parsed
+
+    # Extract comments count, falling back to counting comment elements
+    if 'comments' in raw:
+        fields['comments'] = raw.get('comment_items', 0)
+        if raw['comments'] is not None:
+            try:
+                fields['comments'] = parse_count(raw['comments'])
+            except ValueError:
+                pass
+
+    if 'timestamp' in raw:
+        fields['timestamp'] = raw['timestamp'] or ""
+    if 'caption' in raw:
+        fields['caption'] = raw['caption'] or ""
+    return fields
+
+
+def finish_post_record(fields, post_url):
+    """Build the post data dict from extracted post fields, adding the engagement metrics"""
+    is_video = fields['is_video']
+    views = fields['views']
+    likes = fields['likes']
+    comments = fields['comments']
+    if is_video:
+        logger.info(f"Post has {views} views")
+    logger.info(f"Post has {likes} likes")
+
+    # Calculate engagement - if video use views, otherwise use estimated follower count
+    engagement_denominator = views if is_video and views > 0 else 1
+    engagement_rate = (likes + comments) / engagement_denominator * 100 if engagement_denominator > 1 else 0
+
+    return {
+        'username': fields['username'],
+        'post_url': post_url,
+        'is_video': is_video,
+        'views': views,
+        'likes': likes,
+        'comments': comments,
+        'has_million_views': is_video and views >= 1000000,
+        'engagement_rate': engagement_rate,
+        'timestamp': fields['timestamp'],
+        'caption': fields['caption']
+    }
+
+
+def build_profile_metrics(raw, username, matches=None):
+    """Turn raw field values from PROFILE_FIELDS into the profile metrics dict
+
+    Only the metrics whose fields are in raw are returned, so a partial spec can be extracted.
+    If matches is a dict, whether each follower selector parsed is stored in it (declared order).
+    """
+    metrics = {}
+    if 'name' in raw:
+        metrics['name'] = raw['name'] if raw['name'] is not None else username
+    if 'bio' in raw:
+        metrics['bio'] = raw['bio'] or ""
+
+    # Follower count - the first selector (in declared order) whose text parses wins
+    if 'followers' in raw:
+        followers, parsed = _parse_each(raw['followers'])
+        if matches is not None:
+            matches['followers'] = parsed
+        metrics['followers'] = followers if followers is not None else 0
+        if followers is None:
+            logger.warning(f"Could not extract follower count for @{username}")
+
+    # Check account type (creator/business account)
+    if 'category' in raw:
+        metrics['category'] = raw['category'] or ""
+        metrics['is_creator_account'] = raw['category'] is not None
+    return metrics
@@ -0,0 +1,112 @@
+import json
+import logging
+import threading
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+# URL patterns (Network.setBlockedURLs wildcards) for each resource type the extractors never read.
+# Instagram CDN URLs carry query strings, hence the trailing wildcards.
+RESOURCE_PATTERNS = {
+    'image': ["*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.heic*", "*.ico*"],
+    'media': ["*.mp4*", "*.m4v*", "*.m4a*", "*.webm*", "*.m3u8*", "*.mpd*"],
+    'font': ["*.woff*", "*.ttf*", "*.otf*", "*.eot*"],
+    'tracking': ["*/logging_client_events*", "*/ajax/bz*", "*/falco*", "*facebook.com/tr*"]
+}
+
+# Resource types each page type still needs. Page types not listed here (login, search,
+# messaging) are loaded untouched.
+DEFAULT_ALLOWLIST = {
+    'post': set(),
+    'profile': set(),
+    'hashtag': set(),
+    'explore': set(),
+    'suggested': {'image'}
+}
+
+
+class LeanFetch:
+    """Blocks non-essential resources per page type through CDP and measures bytes/load time per page
+
+    Blocking uses Network.setBlockedURLs with the patterns for every resource type not allowlisted for
+    the page type being opened. Byte counts come from the Chrome performance log (Network.loadingFinished
+    encodedDataLength), so the driver must be started with performance logging enabled.
+    """
+
+    def __init__(self, block=True, allowlist=None):
+        self.block = block
+        self.allowlist = DEFAULT_ALLOWLIST if allowlist is None else allowlist
+        self.lock = threading.Lock()
+        self.drivers = {}
+        self.pages = defaultdict(lambda: {'pages': 0, 'bytes': 0, 'requests': 0, 'blocked': 0, 'seconds': 0.0})
+
+    def _state(self, driver):
+        key = id(driver)
+        if key not in self.drivers:
+            driver.execute_cdp_cmd("Network.enable", {})
+            self.drivers[key] = {'blocked': None, 'page_type': None}
+        return self.drivers[key]
+
+    def blocked_patterns(self, page_type):
+        """Return the URL patterns to block for a page type"""
+        if not self.block or page_type not in self.allowlist:
+            return []
+        allowed = self.allowlist[page_type]
+        return [pattern for resource_type, patterns in RESOURCE_PATTERNS.items()
+                if resource_type not in allowed for pattern in patterns]
+
+    def _drain(self, driver):
+        """Sum transferred bytes, finished requests and blocked requests from the performance log"""
+        transferred, requests, blocked = 0, 0, 0
+        for entry in driver.get_log("performance"):
+            message = json.loads(entry['message'])['message']
+            if message['method'] == 'Network.loadingFinished':
+                transferred += message['params'].get('encodedDataLength', 0)
+                requests += 1
+            elif message['method'] == 'Network.loadingFailed' and message['params'].get('blockedReason'):
+                blocked += 1
+        return transferred, requests, blocked
+
+    def _add(self, page_type, transferred, requests, blocked, seconds=0.0, page=False):
+        with self.lock:
+            entry = self.pages[page_type]
+            entry['pages'] += 1 if page else 0
+            entry['bytes'] += transferred
+            entry['requests'] += requests
+            entry['blocked'] += blocked
+            entry['seconds'] += seconds
+
+    def before_load(self, driver, page_type):
+        """Apply the block list for page_type; traffic since the last page (scrolling etc.) is credited to it"""
+        with self.lock:
+            state = self._state(driver)
+        previous = state['page_type']
+        if previous:
+            self._add(previous, *self._drain(driver))
+
+        patterns = self.blocked_patterns(page_type)
+        if patterns != state['blocked']:
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {'urls': patterns})
+            state['blocked'] = patterns
+        state['page_type'] = page_type
+
+    def after_load(self, driver, page_type, seconds):
+        """Record the bytes and time it took for a page to become ready"""
+        self._add(page_type, *self._drain(driver), seconds=seconds, page=True)
+
+    def summary(self):
+        """Return per page type totals with per-page averages"""
+        with self.lock:
+            return {
+                page_type: dict(entry,
+                                kb_per_page=round(entry['bytes'] / 1024 / max(entry['pages'], 1), 1),
+                                seconds_per_page=round(entry['seconds'] / max(entry['pages'], 1), 2))
+                for page_type, entry in self.pages.items()
+            }
+
+    def log(self):
+        """Log per page type bytes and load time"""
+        mode = "lean" if self.block else "full"
+        for page_type, entry in self.summary().items():
+            logger.info(f"Fetch ({mode}) {page_type}: {entry['pages']} pages, {entry['kb_per_page']} KB/page, "
+                        f"{entry['seconds_per_page']}s/page, {entry['blocked']} requests blocked")
@@ -0,0 +1,209 @@
+import json
+import re
+from datetime import datetime, timezone
+
+from counts import parse_count
+
+try:
+    import orjson
+    load_json = orjson.loads
+except ImportError:
+    load_json = json.loads
+
+POST_KEYS = ('username', 'is_video', 'views', 'likes', 'comments', 'timestamp', 'caption')
+PROFILE_KEYS = ('name', 'bio', 'followers', 'category', 'is_creator_account')
+
+# Collects embedded JSON blobs and meta tags in one round-trip; the DOM is not queried beyond this
+EMBEDDED_DATA_SCRIPT = """
+var data = {json: [], meta: {}};
+var scripts = document.querySelectorAll('script[type="application/json"], script[type="application/ld+json"]');
+for (var i = 0; i < scripts.length; i++) { data.json.push(scripts[i].textContent); }
+var metas = document.querySelectorAll('meta[property], meta[name]');
+for (var j = 0; j < metas.length; j++) {
+    data.meta[metas[j].getAttribute('property') || metas[j].getAttribute('name')] = metas[j].getAttribute('content');
+}
+return data;
+"""
+
+# og:description formats, e.g.
+#   post:    '1,234 likes, 56 comments - someuser on January 1, 2024: "caption"'
+#   profile: '12.5K Followers, 300 Following, 42 Posts - See Instagram photos and videos from Name (@someuser)'
+POST_META_PATTERN = re.compile(
+    r"^(?P<likes>[\d.,]+\s*[KMB]?)\s+likes?,\s*(?P<comments>[\d.,]+\s*[KMB]?)\s+comments?\s+-\s+"
+    r"(?P<username>[\w.]+)\s+on\s+[^:]+:\s*(?P<caption>.*)$", re.IGNORECASE | re.DOTALL)
+PROFILE_META_PATTERN = re.compile(
+    r"^(?P<followers>[\d.,]+\s*[KMB]?)\s+Followers.*?from\s+(?P<name>.*?)\s+\(@(?P<username>[\w.]+)\)",
+    re.IGNORECASE | re.DOTALL)
+
+
+def read_embedded_data(driver):
+    """Return {'json': [blob text, ...], 'meta': {property: content}} for the current page"""
+    return driver.execute_script(EMBEDDED_DATA_SCRIPT)
+
+
+def _walk(value):
+    """Yield every dict nested anywhere inside a parsed JSON value"""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            yield item
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+
+
+def _find_node(blobs, needle, match):
+    """Parse only the blobs that mention needle and return the first dict satisfying match"""
+    for blob in blobs:
+        if not blob or needle not in blob:
+            continue
+        try:
+            parsed = load_json(blob)
+        except ValueError:
+            continue
+        for node in _walk(parsed):
+            if match(node):
+                return node
+    return None
+
+
+def _count(node, *paths):
+    """Return the first integer found at any of the dotted paths in node"""
+    for path in paths:
+        value = node
+        for key in path.split('.'):
+            value = value.get(key) if isinstance(value, dict) else None
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return int(value)
+    return None
+
+
+def _iso_timestamp(seconds):
+    """Format a Unix timestamp the way Instagram's <time datetime> attribute does"""
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def _post_from_json(node):
+    fields = {}
+    owner = node.get('owner') or node.get('user') or {}
+    if owner.get('username'):
+        fields['username'] = owner['username']
+
+    likes = _count(node, 'edge_media_preview_like.count', 'edge_liked_by.count', 'like_count')
+    if likes is not None:
+        fields['likes'] = likes
+    comments = _count(node, 'edge_media_to_parent_comment.count', 'edge_media_to_comment.count', 'comment_count')
+    if comments is not None:
+        fields['comments'] = comments
+
+    is_video = node.get('is_video')
+    if is_video is None and 'media_type' in node:
+        is_video = node['media_type'] == 2
+    if is_video is not None:
+        fields['is_video'] = bool(is_video)
+        views = _count(node, 'video_view_count', 'play_count', 'view_count', 'video_play_count')
+        if is_video and views is not None:
+            fields['views'] = views
+        elif not is_video:
+            fields['views'] = 0
+
+    taken_at = _count(node, 'taken_at_timestamp', 'taken_at')
+    if taken_at is not None:
+        fields['timestamp'] = _iso_timestamp(taken_at)
+
+    caption = node.get('caption')
+    if isinstance(caption, dict):
+        fields['caption'] = caption.get('text') or ""
+    else:
+        edges = (node.get('edge_media_to_caption') or {}).get('edges') or []
+        if edges:
+            fields['caption'] = edges[0].get('node', {}).get('text') or ""
+        elif 'edge_media_to_caption' in node or 'caption' in node:
+            fields['caption'] = ""
+    return fields
+
+
+def _post_from_meta(meta):
+    match = POST_META_PATTERN.match(meta.get('og:description') or meta.get('description') or "")
+    if not match:
+        return {}
+    try:
+        return {
+            'likes': parse_count(match.group('likes')),
+            'comments': parse_count(match.group('comments')),
+            'username': match.group('username'),
+            'caption': match.group('caption').strip().strip('"')
+        }
+    except ValueError:
+        return {}
+
+
+def post_from_embedded(data, shortcode):
+    """Return (fields, tier) for a post from embedded JSON and meta tags
+
+    tier is 'json' when the JSON blobs alone supplied every field, 'meta' when meta tags filled the
+    gaps, or None when fields are still missing and the XPath tier has to run.
+    """
+    fields = {}
+    if shortcode:
+        node = _find_node(data.get('json') or [], shortcode,
+                          lambda n: (n.get('shortcode') or n.get('code')) == shortcode)
+        if node:
+            fields = _post_from_json(node)
+    if _post_complete(fields):
+        return fields, 'json'
+
+    for key, value in _post_from_meta(data.get('meta') or {}).items():
+        fields.setdefault(key, value)
+    return fields, 'meta' if _post_complete(fields) else None
+
+
+def _post_complete(fields):
+    return all(key in fields for key in POST_KEYS)
+
+
+def _profile_from_json(node):
+    fields = {}
+    if node.get('full_name') is not None:
+        fields['name'] = node['full_name']
+    if node.get('biography') is not None:
+        fields['bio'] = node['biography']
+    followers = _count(node, 'edge_followed_by.count', 'follower_count')
+    if followers is not None:
+        fields['followers'] = followers
+    if 'category_name' in node or 'business_category_name' in node:
+        category = node.get('category_name') or node.get('business_category_name') or ""
+        fields['category'] = category
+        fields['is_creator_account'] = bool(category or node.get('is_business_account')
+                                            or node.get('is_professional_account'))
+    return fields
+
+
+def _profile_from_meta(meta, username):
+    match = PROFILE_META_PATTERN.match(meta.get('og:description') or meta.get('description') or "")
+    if not match or match.group('username').lower() != username.lower():
+        return {}
+    try:
+        return {'followers': parse_count(match.group('followers')), 'name': match.group('name')}
+    except ValueError:
+        return {}
+
+
+def profile_from_embedded(data, username):
+    """Return (metrics, tier) for a profile header from embedded JSON and meta tags, like post_from_embedded"""
+    metrics = {}
+    node = _find_node(data.get('json') or [], f'"{username}"',
+                      lambda n: n.get('username') == username and ('edge_followed_by' in n or 'follower_count' in n))
+    if node:
+        metrics = _profile_from_json(node)
+    if _profile_complete(metrics):
+        return metrics, 'json'
+
+    for key, value in _profile_from_meta(data.get('meta') or {}, username).items():
+        metrics.setdefault(key, value)
+    return metrics, 'meta' if _profile_complete(metrics) else None
+
+
+def _profile_complete(metrics):
+    return all(key in metrics for key in PROFILE_KEYS)
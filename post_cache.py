@@ -0,0 +1,98 @@
+import json
+import logging
+import re
+import time
+
+from sqlite_store import LockedSQLite
+
+logger = logging.getLogger(__name__)
+
+SHORTCODE_PATTERN = re.compile(r"/(?:p|reel|reels|tv)/([A-Za-z0-9_-]+)")
+
+
+def shortcode_from_url(post_url):
+    """Return the shortcode of an Instagram post URL, or None if it is not a post URL"""
+    if not post_url:
+        return None
+    match = SHORTCODE_PATTERN.search(post_url)
+    return match.group(1) if match else None
+
+
+def canonical_post_url(post_url):
+    """Return the canonical https://www.instagram.com/p/<shortcode>/ form of a post URL, or the URL unchanged"""
+    shortcode = shortcode_from_url(post_url)
+    return f"https://www.instagram.com/p/{shortcode}/" if shortcode else post_url
+
+
+class PostCache(LockedSQLite):
+    """SQLite-backed cache of extracted post data with per-entry TTL and LRU eviction"""
+
+    def __init__(self, path="post_cache.sqlite", ttl=6 * 3600, max_entries=5000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        super().__init__(path, [
+            "CREATE TABLE IF NOT EXISTS posts ("
+            " shortcode TEXT PRIMARY KEY,"
+            " data TEXT NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " last_access REAL NOT NULL)",
+            "CREATE INDEX IF NOT EXISTS posts_last_access ON posts (last_access)"])
+
+    def get(self, shortcode):
+        """Return the cached post data for a shortcode, or None if missing or expired"""
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT data, expires_at FROM posts WHERE shortcode = ?", (shortcode,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            data, expires_at = row
+            if expires_at <= now:
+                self.conn.execute("DELETE FROM posts WHERE shortcode = ?", (shortcode,))
+                self.misses += 1
+                return None
+
+            self.conn.execute("UPDATE posts SET last_access = ? WHERE shortcode = ?", (now, shortcode))
+            self.hits += 1
+        return json.loads(data)
+
+    def set(self, shortcode, data, ttl=None):
+        """Store post data for a shortcode and evict least recently used entries over the size limit"""
+        now = time.time()
+        ttl = self.ttl if ttl is None else ttl
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO posts (shortcode, data, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                (shortcode, json.dumps(data), now + ttl, now))
+            self._evict()
+
+    def _evict(self):
+        """Drop the least recently used entries beyond max_entries"""
+        self.conn.execute(
+            "DELETE FROM posts WHERE shortcode IN ("
+            " SELECT shortcode FROM posts ORDER BY last_access ASC"
+            " LIMIT max((SELECT COUNT(*) FROM posts) - ?, 0))",
+            (self.max_entries,))
+
+    def purge_expired(self):
+        """Remove every expired entry"""
+        with self.lock:
+            self.conn.execute("DELETE FROM posts WHERE expires_at <= ?", (time.time(),))
+
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+    def stats(self):
+        """Return hit/miss counters for this session"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self)
+        }
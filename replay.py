@@ -0,0 +1,140 @@
+import json
+import logging
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+INSTAGRAM_ORIGIN = "https://www.instagram.com"
+RECORDED_PAGE_TYPES = ("post", "profile", "hashtag", "explore")
+
+# Executable scripts are dropped so replayed pages stay exactly as rendered; JSON data blocks are kept
+SCRIPT_PATTERN = re.compile(r"<script\b(?![^>]*type=\"application/(?:ld\+)?json\")[^>]*>.*?</script>",
+                            re.IGNORECASE | re.DOTALL)
+# Served pages may only load from the stand-in itself, so a replay never touches the network
+OFFLINE_POLICY = ("<meta http-equiv=\"Content-Security-Policy\" "
+                  "content=\"default-src 'self' 'unsafe-inline' data:\">")
+
+
+def page_key(url):
+    """Normalize a URL to the path used to look up a recorded page"""
+    path = urlsplit(url).path or "/"
+    return path if path.endswith("/") else path + "/"
+
+
+class PageRecorder:
+    """Saves rendered Instagram pages and a manifest so they can be replayed offline"""
+
+    def __init__(self, corpus_dir, page_types=RECORDED_PAGE_TYPES):
+        self.corpus_dir = corpus_dir
+        self.page_types = page_types
+        self.manifest_path = os.path.join(corpus_dir, "manifest.json")
+        self.lock = threading.Lock()
+        os.makedirs(corpus_dir, exist_ok=True)
+        self.manifest = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding="utf-8") as f:
+                self.manifest = json.load(f)
+
+    def record(self, driver, page_type, url):
+        """Save the current page's rendered HTML under page_type"""
+        if page_type not in self.page_types:
+            return None
+        key = page_key(url)
+        name = re.sub(r"[^A-Za-z0-9_-]+", "_", key.strip("/")) or "root"
+        filename = os.path.join(page_type, f"{name}.html")
+        os.makedirs(os.path.join(self.corpus_dir, page_type), exist_ok=True)
+
+        html = driver.execute_script("return document.documentElement.outerHTML")
+        html = SCRIPT_PATTERN.sub("", html)
+        with self.lock:
+            with open(os.path.join(self.corpus_dir, filename), "w", encoding="utf-8") as f:
+                f.write("<!DOCTYPE html>\n" + html)
+
+            self.manifest[key] = {'file': filename, 'page_type': page_type, 'url': url}
+            with open(self.manifest_path, "w", encoding="utf-8") as f:
+                json.dump(self.manifest, f, indent=2)
+        logger.info(f"Recorded {page_type} page {url}")
+        return filename
+
+
+class ReplayServer:
+    """Local HTTP stand-in that serves a recorded corpus by URL path"""
+
+    def __init__(self, corpus_dir, host="127.0.0.1", port=0):
+        self.corpus_dir = corpus_dir
+        with open(os.path.join(corpus_dir, "manifest.json"), encoding="utf-8") as f:
+            self.manifest = json.load(f)
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                entry = server.manifest.get(page_key(self.path))
+                if entry is None:
+                    self.send_error(404, "Page not recorded")
+                    return
+                with open(os.path.join(server.corpus_dir, entry['file']), encoding="utf-8") as f:
+                    html = f.read()
+                html = re.sub(r"<head([^>]*)>", lambda m: f"<head{m.group(1)}>{OFFLINE_POLICY}", html, count=1)
+                body = html.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.origin = f"http://{host}:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def pages(self, page_type):
+        """Return the original URLs recorded for a page type"""
+        return [entry['url'] for entry in self.manifest.values() if entry['page_type'] == page_type]
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class ReplayDriver:
+    """Drop-in for webdriver.Chrome that serves Instagram URLs from a ReplayServer
+
+    get() rewrites instagram.com URLs to the stand-in; find_element, find_elements,
+    execute_script and everything else are delegated to the wrapped browser.
+    """
+
+    def __init__(self, driver, server):
+        self._driver = driver
+        self.server = server
+
+    def get(self, url):
+        if url.startswith(INSTAGRAM_ORIGIN):
+            url = self.server.origin + url[len(INSTAGRAM_ORIGIN):]
+        return self._driver.get(url)
+
+    def find_element(self, by, value):
+        return self._driver.find_element(by, value)
+
+    def find_elements(self, by, value):
+        return self._driver.find_elements(by, value)
+
+    def execute_script(self, script, *args):
+        return self._driver.execute_script(script, *args)
+
+    def quit(self):
+        self._driver.quit()
+        self.server.close()
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
@@ -0,0 +1,85 @@
+import logging
+import os
+import time
+import uuid
+from datetime import date
+
+import numpy as np
+
+from creator_store import DTYPES
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+TABLES = ('creators', 'posts')
+
+
+def available():
+    """Return True when pyarrow is installed"""
+    return pa is not None
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("pyarrow is required for the Parquet results archive (pip install pyarrow)")
+
+
+def _arrow_table(table, run_id):
+    """Convert a ColumnTable to an Arrow table; numeric columns are wrapped without copying"""
+    arrays, names = [], []
+    for name, typecode in table.schema:
+        column = table.columns[name]
+        if typecode is None:
+            arrays.append(pa.array(column, type=pa.string()))
+        else:
+            arrays.append(pa.array(np.frombuffer(column, dtype=DTYPES[typecode])))
+        names.append(name)
+    arrays.append(pa.array([run_id] * len(table), type=pa.string()).dictionary_encode())
+    names.append('run_id')
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+def write_run(store, root="creator_results", run_date=None, run_id=None):
+    """Append a CreatorStore's tables to the archive as new files under <table>/run_date=YYYY-MM-DD/
+
+    Earlier runs are never rewritten. Returns the paths written.
+    """
+    _require_pyarrow()
+    run_date = (run_date or date.today()).isoformat()
+    run_id = run_id or f"{time.strftime('%H%M%S')}-{uuid.uuid4().hex[:8]}"
+    paths = []
+    with store.lock:
+        for name in TABLES:
+            directory = os.path.join(root, name, f"run_date={run_date}")
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"{run_id}.parquet")
+            pq.write_table(_arrow_table(getattr(store, name), run_id), path, compression="zstd")
+            paths.append(path)
+    return paths
+
+
+def load_results(root="creator_results", table="creators", columns=None, since=None, until=None):
+    """Load one archived table as a DataFrame, reading only the requested columns and run dates
+
+    since/until are dates (inclusive); run_date is available as a column and can be requested like any other.
+    """
+    _require_pyarrow()
+    path = os.path.join(root, table)
+    if not os.path.isdir(path):
+        logger.warning(f"No archived {table} under {root}")
+        return None
+    dataset = ds.dataset(path, format="parquet",
+                         partitioning=ds.partitioning(pa.schema([('run_date', pa.string())]), flavor="hive"))
+    condition = None
+    if since:
+        condition = ds.field('run_date') >= since.isoformat()
+    if until:
+        upper = ds.field('run_date') <= until.isoformat()
+        condition = upper if condition is None else condition & upper
+    return dataset.to_table(columns=columns, filter=condition).to_pandas()
@@ -0,0 +1,80 @@
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RunJournal:
+    """Append-only JSONL journal of discovery output and analyzed profiles for resumable runs
+
+    Every completed discovery step (hashtag search, explore page, keyword search, similar accounts,
+    single post extraction) and every analyzed profile is written as one line as soon as it finishes.
+    Opening the journal with resume=True replays those lines so the run can skip work already done;
+    otherwise the journal is started fresh.
+    """
+
+    def __init__(self, path="run_journal.jsonl", resume=False):
+        self.path = path
+        self.lock = threading.Lock()
+        self.steps = {}
+        self.profiles = {}
+
+        if resume and os.path.exists(path):
+            self._load()
+            logger.info(f"Resuming from {path}: {len(self.steps)} discovery steps, "
+                        f"{len(self.profiles)} profiles already journaled")
+            self.file = open(path, "a", encoding="utf-8")
+        else:
+            self.file = open(path, "w", encoding="utf-8")
+
+    def _load(self):
+        """Replay the journal, ignoring a partially written final line from a crash"""
+        with open(self.path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.warning(f"Skipping unreadable journal line {line_number}")
+                    continue
+                if entry['kind'] == 'step':
+                    self.steps[(entry['method'], entry['key'])] = entry['data']
+                elif entry['kind'] == 'profile':
+                    self.profiles[entry['username']] = entry['data']
+
+    def _append(self, entry):
+        entry['ts'] = time.time()
+        line = json.dumps(entry, ensure_ascii=False)
+        with self.lock:
+            self.file.write(line + "\n")
+            self.file.flush()
+            os.fsync(self.file.fileno())
+
+    def has_step(self, method, key):
+        return (method, key) in self.steps
+
+    def step(self, method, key):
+        """Return the journaled output of a discovery step"""
+        return self.steps[(method, key)]
+
+    def record_step(self, method, key, data):
+        """Journal the output of a discovery step"""
+        self.steps[(method, key)] = data
+        self._append({'kind': 'step', 'method': method, 'key': key, 'data': data})
+
+    def has_profile(self, username):
+        return username in self.profiles
+
+    def profile(self, username):
+        """Return the journaled profile analysis for a username"""
+        return self.profiles[username]
+
+    def record_profile(self, username, profile_data):
+        """Journal a completed profile analysis"""
+        self.profiles[username] = profile_data
+        self._append({'kind': 'profile', 'username': username, 'data': profile_data})
+
+    def close(self):
+        self.file.close()
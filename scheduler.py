@@ -0,0 +1,117 @@
+import heapq
+import itertools
+import logging
+import math
+import time
+
+logger = logging.getLogger(__name__)
+
+# How much being surfaced by each discovery method says about a creator
+SOURCE_WEIGHTS = {
+    'hashtag': 3.0,
+    'explore': 3.0,
+    'suggested': 1.5,
+    'keyword': 1.0
+}
+
+
+class CreatorScheduler:
+    """Priority queue of creators awaiting profile analysis, ordered by discovery signals
+
+    A creator's priority grows with the best post views and engagement seen during discovery,
+    a bonus for a 1M+ view post, the weight of each discovery method that surfaced them and the
+    number of distinct methods. Optional budgets (seconds since start(), page loads) let a run stop
+    with the most promising creators already analyzed.
+    """
+
+    def __init__(self, max_seconds=None, max_pages=None, page_counter=None):
+        self.max_seconds = max_seconds
+        self.max_pages = max_pages
+        self.page_counter = page_counter
+        self.heap = []
+        self.signals = {}
+        self.counter = itertools.count()
+        self.started = None
+        self.start_pages = 0
+        self.paused = None
+
+    def add(self, username, source, post_data=None):
+        """Record that a discovery method surfaced username, optionally via one of their posts"""
+        signal = self.signals.setdefault(username, {'sources': set(), 'views': 0, 'engagement': 0.0,
+                                                    'viral': False, 'queued': False})
+        signal['sources'].add(source)
+        if post_data:
+            signal['views'] = max(signal['views'], post_data.get('views', 0))
+            signal['engagement'] = max(signal['engagement'], post_data.get('engagement_rate', 0.0))
+            signal['viral'] = signal['viral'] or post_data.get('has_million_views', False)
+        signal['queued'] = True
+        # Stale entries for the same username are skipped on pop
+        heapq.heappush(self.heap, (-self.priority(username), next(self.counter), username))
+
+    def priority(self, username):
+        """Return a creator's current priority (higher is analyzed first)"""
+        signal = self.signals[username]
+        return (sum(SOURCE_WEIGHTS.get(source, 1.0) for source in signal['sources'])
+                + 2.0 * (len(signal['sources']) - 1)
+                + math.log10(signal['views'] + 1)
+                + min(signal['engagement'], 50.0) / 10
+                + (5.0 if signal['viral'] else 0.0))
+
+    def __len__(self):
+        return sum(1 for signal in self.signals.values() if signal['queued'])
+
+    def pop(self):
+        """Return the highest-priority creator not yet popped, or None when the queue is empty"""
+        while self.heap:
+            negative_priority, _, username = heapq.heappop(self.heap)
+            signal = self.signals[username]
+            if signal['queued'] and -negative_priority == self.priority(username):
+                signal['queued'] = False
+                return username
+        return None
+
+    def drain(self):
+        """Pop every queued creator, highest priority first"""
+        usernames = []
+        username = self.pop()
+        while username is not None:
+            usernames.append(username)
+            username = self.pop()
+        return usernames
+
+    def start(self):
+        """Start the analysis budgets"""
+        self.started = time.time()
+        self.start_pages = self.page_counter() if self.page_counter else 0
+
+    def pause(self):
+        """Stop the budgets counting, e.g. while more creators are discovered between analysis phases"""
+        if self.started is not None and self.paused is None:
+            self.paused = (time.time(), self.page_counter() if self.page_counter else 0)
+
+    def resume(self):
+        """Start counting again, leaving out the time and pages spent while paused"""
+        if self.paused is None:
+            return
+        paused_at, paused_pages = self.paused
+        self.started += time.time() - paused_at
+        self.start_pages += (self.page_counter() if self.page_counter else 0) - paused_pages
+        self.paused = None
+
+    def seconds_used(self):
+        if self.started is None:
+            return 0.0
+        return (self.paused[0] if self.paused else time.time()) - self.started
+
+    def pages_used(self):
+        if not self.page_counter:
+            return 0
+        return (self.paused[1] if self.paused else self.page_counter()) - self.start_pages
+
+    def exhausted(self):
+        """Return True once the time or page budget is used up"""
+        if self.started is None:
+            return False
+        if self.max_seconds is not None and self.seconds_used() >= self.max_seconds:
+            return True
+        return self.max_pages is not None and self.pages_used() >= self.max_pages
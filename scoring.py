@@ -0,0 +1,157 @@
+import logging
+import threading
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class Thresholds:
+    """Qualification thresholds and viral score weights
+
+    A creator qualifies with at least min_followers and any of: a video with viral_views or more,
+    a hot streak (latest post engagement at least hot_streak_ratio times the average), or an average
+    engagement rate above min_engagement. The viral score (0-100) weights those three signals, with
+    the engagement part saturating at twice min_engagement.
+    """
+
+    def __init__(self, min_followers=1000, min_engagement=5.0, hot_streak_ratio=1.15, viral_views=1000000,
+                 viral_weight=50.0, streak_weight=20.0, engagement_weight=30.0):
+        self.min_followers = min_followers
+        self.min_engagement = min_engagement
+        self.hot_streak_ratio = hot_streak_ratio
+        self.viral_views = viral_views
+        self.viral_weight = viral_weight
+        self.streak_weight = streak_weight
+        self.engagement_weight = engagement_weight
+
+    def engagement_score(self, avg_engagement_rate):
+        """Scale average engagement to 0-1, reaching 1 at twice min_engagement"""
+        if self.min_engagement <= 0:
+            return (np.asarray(avg_engagement_rate) > 0) * 1.0
+        return np.clip(avg_engagement_rate / (2 * self.min_engagement), 0, 1)
+
+
+def score_profile(post_data, thresholds=None):
+    """Engagement aggregates, streak/viral flags and viral score for one creator's analyzed posts
+
+    post_data is newest first, as analyze_creator_profile collects it.
+    """
+    thresholds = thresholds or Thresholds()
+    rates = [p['engagement_rate'] for p in post_data]
+    avg_engagement_rate = sum(rates) / len(rates) if rates else 0
+    latest_post_engagement = rates[0] if rates else 0
+
+    # Hot streak: the most recent post beats the average by the configured ratio (15%+ by default)
+    on_hot_streak = avg_engagement_rate > 0 and latest_post_engagement >= avg_engagement_rate * thresholds.hot_streak_ratio
+    has_viral_video = any(p['is_video'] and p['views'] >= thresholds.viral_views for p in post_data)
+    video_post_count = sum(1 for p in post_data if p['is_video'])
+
+    return {
+        'posts_analyzed': len(post_data),
+        'avg_engagement_rate': avg_engagement_rate,
+        'latest_post_engagement': latest_post_engagement,
+        'on_hot_streak': on_hot_streak,
+        'has_viral_video': has_viral_video,
+        'video_post_count': video_post_count,
+        'image_post_count': len(post_data) - video_post_count,
+        'viral_score': float(thresholds.viral_weight * has_viral_video + thresholds.streak_weight * on_hot_streak
+                             + thresholds.engagement_weight * thresholds.engagement_score(avg_engagement_rate))
+    }
+
+
+def qualifies(profile_data, thresholds=None):
+    """Return True when a scored profile meets the follower threshold and shows a viral indicator"""
+    thresholds = thresholds or Thresholds()
+    return (profile_data['followers'] >= thresholds.min_followers and
+            (profile_data['has_viral_video'] or
+             profile_data['on_hot_streak'] or
+             profile_data['avg_engagement_rate'] > thresholds.min_engagement))
+
+
+def score_posts(posts, followers=None, thresholds=None):
+    """Score every creator in a posts table at once
+
+    posts needs username, post_rank, engagement_rate, is_video and views columns (the CreatorStore /
+    results archive posts table). followers is an optional Series of follower counts indexed by
+    username; creators listed there without posts get zero aggregates. Returns one row per username
+    with the score_profile columns plus followers and qualified, sorted by viral_score.
+    """
+    thresholds = thresholds or Thresholds()
+    posts = posts.sort_values(['username', 'post_rank'], kind='stable')
+    is_video = posts['is_video'].astype(bool)
+    scores = posts.assign(
+        is_video=is_video,
+        viral=is_video & (posts['views'] >= thresholds.viral_views)
+    ).groupby('username', sort=False).agg(
+        posts_analyzed=('engagement_rate', 'size'),
+        avg_engagement_rate=('engagement_rate', 'mean'),
+        latest_post_engagement=('engagement_rate', 'first'),
+        has_viral_video=('viral', 'any'),
+        video_post_count=('is_video', 'sum')
+    )
+
+    # Creators without analyzed posts still get a row
+    if followers is not None:
+        scores = scores.reindex(scores.index.union(followers.index, sort=False)).fillna(
+            {'posts_analyzed': 0, 'avg_engagement_rate': 0.0, 'latest_post_engagement': 0.0,
+             'has_viral_video': False, 'video_post_count': 0})
+        scores = scores.astype({'posts_analyzed': np.int64, 'has_viral_video': bool, 'video_post_count': np.int64})
+
+    avg = scores['avg_engagement_rate'].to_numpy()
+    scores['on_hot_streak'] = (avg > 0) & (scores['latest_post_engagement'].to_numpy() >= avg * thresholds.hot_streak_ratio)
+    scores['image_post_count'] = scores['posts_analyzed'] - scores['video_post_count']
+    scores['viral_score'] = (thresholds.viral_weight * scores['has_viral_video'].to_numpy()
+                             + thresholds.streak_weight * scores['on_hot_streak'].to_numpy()
+                             + thresholds.engagement_weight * thresholds.engagement_score(avg))
+
+    if followers is None:
+        scores['followers'] = 0
+    else:
+        scores['followers'] = followers.reindex(scores.index).fillna(0).astype(np.int64).to_numpy()
+    scores['qualified'] = ((scores['followers'] >= thresholds.min_followers) &
+                           (scores['has_viral_video'] | scores['on_hot_streak'] |
+                            (scores['avg_engagement_rate'] > thresholds.min_engagement)))
+    return scores.sort_values('viral_score', ascending=False, kind='stable')
+
+
+def score_store(store, thresholds=None):
+    """Re-score every creator in a CreatorStore under new thresholds, without re-scraping"""
+    creators, posts = store.to_frames(['username', 'followers'],
+                                      ['username', 'post_rank', 'engagement_rate', 'is_video', 'views'])
+    return score_posts(posts, creators.set_index('username')['followers'], thresholds)
+
+
+class EarlyExitReport:
+    """Counts profiles whose post analysis was cut short once qualification was decided
+
+    Seconds saved are estimated from the run's own average cost of a post (navigation, readiness,
+    settle delay, extraction and the pause between posts) as recorded in a LatencyReport.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.profiles = {}
+        self.posts = {}
+
+    def record(self, reason, posts_skipped):
+        """Record one profile that stopped early for reason, skipping posts_skipped post loads"""
+        with self.lock:
+            self.profiles[reason] = self.profiles.get(reason, 0) + 1
+            self.posts[reason] = self.posts.get(reason, 0) + posts_skipped
+
+    def seconds_saved(self, latency):
+        """Estimate the seconds the skipped post loads would have taken"""
+        per_post = (latency.mean('ready', 'post.navigate') + latency.mean('ready', 'post') +
+                    latency.mean('sleep', 'post') + latency.mean('extract', 'post') +
+                    latency.mean('sleep', 'between_posts'))
+        with self.lock:
+            return sum(self.posts.values()) * per_post
+
+    def log(self, latency):
+        """Log skip counts per reason and the estimated time saved"""
+        with self.lock:
+            reasons = {reason: (self.profiles[reason], self.posts[reason]) for reason in self.profiles}
+        for reason, (profiles, posts) in reasons.items():
+            logger.info(f"Early exit ({reason}): {profiles} profiles, {posts} post loads skipped")
+        logger.info(f"Early exits saved an estimated {self.seconds_saved(latency):.1f}s")
@@ -0,0 +1,93 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class SelectorRegistry:
+    """Hit/miss counts and latency per selector, persisted across runs
+
+    Chains tried one selector at a time, where each miss costs a wait timeout (the message button
+    and input), ask the registry for their selectors in order; selectors that have historically
+    matched are tried first, and the chain's declared order breaks ties so untried selectors keep
+    their original priority. Chains evaluated in a single page call (likes, followers, dialog
+    buttons) keep their declared order and only record their hit rates.
+    """
+
+    def __init__(self, path="selector_stats.json"):
+        self.path = path
+        self.lock = threading.Lock()
+        self.stats = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self.stats = json.load(f)
+            except ValueError:
+                logger.warning(f"Ignoring unreadable selector stats in {path}")
+
+    def _entry(self, chain, selector):
+        return self.stats.setdefault(chain, {}).setdefault(selector, {'hits': 0, 'misses': 0, 'seconds': 0.0})
+
+    def hit_rate(self, chain, selector):
+        """Smoothed hit rate, 0.5 for a selector with no history"""
+        entry = self.stats.get(chain, {}).get(selector)
+        if not entry:
+            return 0.5
+        return (entry['hits'] + 1) / (entry['hits'] + entry['misses'] + 2)
+
+    def ordered(self, chain, selectors):
+        """Return selectors with the historically winning ones first"""
+        with self.lock:
+            ranked = sorted(enumerate(selectors), key=lambda item: (-self.hit_rate(chain, item[1]), item[0]))
+        return [selector for _, selector in ranked]
+
+    def record(self, chain, selector, hit, seconds=0.0):
+        """Record one attempt of a selector"""
+        with self.lock:
+            entry = self._entry(chain, selector)
+            entry['hits' if hit else 'misses'] += 1
+            entry['seconds'] += seconds
+
+    def record_chain(self, chain, selectors, winner, seconds=None):
+        """Record a fallback chain that was tried in order: misses up to the winner, a hit for the winner
+
+        winner is the index of the matching selector, or None when every selector missed.
+        """
+        tried = len(selectors) if winner is None else winner + 1
+        for index in range(tried):
+            self.record(chain, selectors[index], index == winner, seconds[index] if seconds else 0.0)
+
+    def record_each(self, chain, selectors, hits, seconds=None):
+        """Record a chain whose selectors were all evaluated: a hit or a miss for every selector"""
+        for index, selector in enumerate(selectors):
+            self.record(chain, selector, hits[index], seconds[index] if seconds else 0.0)
+
+    def summary(self):
+        """Return per-chain hit rate and mean latency for each selector"""
+        with self.lock:
+            return {
+                chain: {
+                    selector: {
+                        'hits': entry['hits'],
+                        'misses': entry['misses'],
+                        'mean_ms': round(entry['seconds'] / max(entry['hits'] + entry['misses'], 1) * 1000, 2)
+                    }
+                    for selector, entry in selectors.items()
+                }
+                for chain, selectors in self.stats.items()
+            }
+
+    def save(self):
+        """Persist the stats so later runs start with the winning order"""
+        if not self.path:
+            return
+        with self.lock:
+            # A temp file of this writer's own, so processes saving the same stats file don't clobber each other
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)),
+                                            prefix=os.path.basename(self.path) + ".", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.stats, f, indent=2)
+            os.replace(tmp_path, self.path)
@@ -0,0 +1,62 @@
+import json
+import logging
+import os
+import tempfile
+import time
+
+logger = logging.getLogger(__name__)
+
+SESSION_COOKIE = "sessionid"
+
+
+def install_cookies(driver, cookies, base_url="https://www.instagram.com/"):
+    """Replace the driver's cookies with the given ones (the domain must be open before cookies can be added)"""
+    driver.get(base_url)
+    driver.delete_all_cookies()
+    for cookie in cookies:
+        # Selenium rejects the sameSite values Chrome reports for some cookies
+        cookie = {k: v for k, v in cookie.items() if k != 'sameSite'}
+        try:
+            driver.add_cookie(cookie)
+        except Exception as e:
+            logger.error(f"Error installing cookie {cookie.get('name')}: {e}")
+
+
+class SessionStore:
+    """Cookie jar that lets a later run reuse an authenticated Instagram session"""
+
+    def __init__(self, path="instagram_session.json"):
+        self.path = path
+
+    def save(self, driver):
+        """Write the driver's cookies to disk, readable only by the current user"""
+        cookies = driver.get_cookies()
+        # mkstemp creates the temp file readable only by us, with a name no other process is writing to
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)),
+                                        prefix=os.path.basename(self.path) + ".", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({'saved_at': time.time(), 'cookies': cookies}, f)
+        os.replace(tmp_path, self.path)
+        logger.info(f"Saved session cookies to {self.path}")
+
+    def load(self):
+        """Return saved cookies if the session cookie is present and unexpired, otherwise None"""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                cookies = json.load(f)['cookies']
+        except (ValueError, KeyError):
+            logger.warning(f"Ignoring unreadable session file {self.path}")
+            return None
+
+        session = next((c for c in cookies if c.get('name') == SESSION_COOKIE), None)
+        if session is None or session.get('expiry', float('inf')) <= time.time():
+            logger.info("Saved session has expired")
+            return None
+        return cookies
+
+    def clear(self):
+        """Forget the saved session"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,379 @@
+"""Sharded creator sweeps: worker processes on one box sharing a SQLite work queue and results database
+
+The queue and results rely on SQLite's file locking, which is unreliable on network filesystems, so
+every worker of a sweep must run on the box that holds the databases. Spreading a sweep over several
+boxes is not supported.
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import sqlite3
+import time
+
+from creator_store import CreatorStore
+from post_cache import canonical_post_url, shortcode_from_url
+from scoring import Thresholds, qualifies
+
+logger = logging.getLogger(__name__)
+
+# Work kinds, claimed latest stage first so discovered work is finished before more is discovered
+STAGES = ['hashtag', 'explore', 'post', 'profile']
+
+
+def _connect(path, timeout):
+    """Open a SQLite database shared between the worker processes of one box
+
+    SQLite's file locking is unreliable on network filesystems, so the queue and results are not meant
+    to be shared between boxes.
+    """
+    conn = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+    conn.execute(f"PRAGMA busy_timeout = {int(timeout * 1000)}")
+    return conn
+
+
+class WorkQueue:
+    """SQLite-backed queue of hashtags, posts and usernames shared by sweep worker processes
+
+    Every item is keyed by (kind, key), so a post or username surfaced by several workers is queued
+    once. Workers claim shards of up to shard_size items of one kind under a lease; items whose lease
+    runs out (a crashed worker) are claimed again, up to max_attempts times.
+    """
+
+    def __init__(self, path="sweep_queue.sqlite", timeout=30, max_attempts=3):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.conn = _connect(path, timeout)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS items ("
+            " kind TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " status TEXT NOT NULL DEFAULT 'pending',"
+            " worker TEXT,"
+            " lease_until REAL NOT NULL DEFAULT 0,"
+            " attempts INTEGER NOT NULL DEFAULT 0,"
+            " PRIMARY KEY (kind, key))")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS items_status ON items (kind, status)")
+
+    def add(self, kind, keys):
+        """Queue keys of a kind, ignoring any already queued; returns how many were new"""
+        before = self.conn.total_changes
+        self.conn.executemany("INSERT OR IGNORE INTO items (kind, key) VALUES (?, ?)",
+                              [(kind, key) for key in keys])
+        return self.conn.total_changes - before
+
+    def claim(self, worker, shard_size=5, lease=900):
+        """Claim a shard of up to shard_size items of one kind, returning (kind, keys) or (None, [])"""
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            for kind in reversed(STAGES):
+                keys = [row[0] for row in self.conn.execute(
+                    "SELECT key FROM items WHERE kind = ? AND attempts < ?"
+                    " AND (status = 'pending' OR (status = 'claimed' AND lease_until < ?))"
+                    " ORDER BY rowid LIMIT ?", (kind, self.max_attempts, now, shard_size))]
+                if keys:
+                    self.conn.executemany(
+                        "UPDATE items SET status = 'claimed', worker = ?, lease_until = ?, attempts = attempts + 1"
+                        " WHERE kind = ? AND key = ?", [(worker, now + lease, kind, key) for key in keys])
+                    self.conn.execute("COMMIT")
+                    return kind, keys
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return None, []
+
+    def done(self, kind, keys):
+        """Mark claimed items finished"""
+        self.conn.executemany("UPDATE items SET status = 'done' WHERE kind = ? AND key = ?",
+                              [(kind, key) for key in keys])
+
+    def release(self, kind, keys):
+        """Return claimed items to the queue after a failure; they are retried up to max_attempts times"""
+        self.conn.executemany(
+            "UPDATE items SET status = CASE WHEN attempts < ? THEN 'pending' ELSE 'failed' END, lease_until = 0"
+            " WHERE kind = ? AND key = ?", [(self.max_attempts, kind, key) for key in keys])
+
+    def active(self):
+        """Return how many items are still pending or claimed (and not out of attempts)"""
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM items WHERE status IN ('pending', 'claimed') AND attempts < ?"
+            " OR status = 'claimed' AND lease_until >= ?", (self.max_attempts, time.time())).fetchone()[0]
+
+    def counts(self):
+        """Return item counts per kind and status"""
+        counts = {}
+        for kind, status, count in self.conn.execute("SELECT kind, status, COUNT(*) FROM items GROUP BY kind, status"):
+            counts.setdefault(kind, {})[status] = count
+        return counts
+
+    def close(self):
+        self.conn.close()
+
+
+class SweepResults:
+    """SQLite store of the posts and profiles a sweep produced, deduplicated by shortcode and username"""
+
+    def __init__(self, path="sweep_results.sqlite", timeout=30):
+        self.path = path
+        self.conn = _connect(path, timeout)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS posts ("
+            " shortcode TEXT PRIMARY KEY,"
+            " username TEXT NOT NULL,"
+            " data TEXT NOT NULL)")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS profiles ("
+            " username TEXT PRIMARY KEY,"
+            " qualified INTEGER NOT NULL,"
+            " data TEXT NOT NULL,"
+            " analyzed_at REAL NOT NULL)")
+
+    def has_post(self, shortcode):
+        return self.conn.execute("SELECT 1 FROM posts WHERE shortcode = ?", (shortcode,)).fetchone() is not None
+
+    def post(self, shortcode):
+        """Return the stored post data for a shortcode, or None"""
+        row = self.conn.execute("SELECT data FROM posts WHERE shortcode = ?", (shortcode,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def add_post(self, post_data):
+        """Store a post unless its shortcode is already stored; returns True if it was new"""
+        shortcode = shortcode_from_url(post_data['post_url']) or post_data['post_url']
+        cursor = self.conn.execute("INSERT OR IGNORE INTO posts (shortcode, username, data) VALUES (?, ?, ?)",
+                                   (shortcode, post_data['username'], json.dumps(post_data)))
+        return cursor.rowcount > 0
+
+    def add_profile(self, profile_data, qualified):
+        """Store (or replace) a creator's profile analysis"""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO profiles (username, qualified, data, analyzed_at) VALUES (?, ?, ?, ?)",
+            (profile_data['username'], int(qualified), json.dumps(profile_data), time.time()))
+
+    def profiles(self, qualified_only=True):
+        """Yield stored profile dicts, optionally only the qualified ones"""
+        query = "SELECT data FROM profiles" + (" WHERE qualified = 1" if qualified_only else "") + " ORDER BY username"
+        for (data,) in self.conn.execute(query):
+            yield json.loads(data)
+
+    def to_store(self, qualified_only=True):
+        """Load the stored profiles into a CreatorStore for export_results / the results archive"""
+        store = CreatorStore()
+        for profile_data in self.profiles(qualified_only):
+            store.add_profile(profile_data)
+        return store
+
+    def counts(self):
+        posts = self.conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+        profiles, qualified = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(qualified), 0) FROM profiles").fetchone()
+        return {'posts': posts, 'profiles': profiles, 'qualified': qualified}
+
+    def close(self):
+        self.conn.close()
+
+
+def seed(queue_path, industry_tags, explore=True):
+    """Queue a sweep's hashtags (and the explore page); returns how many items were new"""
+    queue = WorkQueue(queue_path)
+    try:
+        added = queue.add('hashtag', industry_tags)
+        if explore:
+            added += queue.add('explore', ['explore'])
+        logger.info(f"Queued {added} discovery items in {queue_path}")
+        return added
+    finally:
+        queue.close()
+
+
+def _process_shard(finder, queue, results, kind, keys):
+    """Run one claimed shard, queueing the posts and usernames it surfaces"""
+    if kind in ('hashtag', 'explore'):
+        for key in keys:
+            post_urls = finder.search_hashtag(key) if kind == 'hashtag' else finder.explore_page()
+            added = queue.add('post', [canonical_post_url(url) for url in post_urls])
+            logger.info(f"Queued {added} new posts from {kind} '{key}'")
+            finder.pacing.pause(1, 2, "between_searches")
+
+    elif kind == 'post':
+        for post_url in keys:
+            # Another worker may have stored this post with a profile analysis
+            post_data = results.post(shortcode_from_url(post_url))
+            if post_data is None:
+                post_data = finder.extract_post_data(post_url)
+                if post_data:
+                    results.add_post(post_data)
+                finder.pacing.pause(1, 2, "between_posts")
+            if post_data and post_data['username']:
+                queue.add('profile', [post_data['username']])
+
+    elif kind == 'profile':
+        for username in keys:
+            profile_data = finder.analyze_creator_profile(username, finder.thresholds)
+            if profile_data:
+                for post_data in profile_data['recent_posts']:
+                    results.add_post(dict(post_data, username=username))
+                qualified = qualifies(profile_data, finder.thresholds)
+                results.add_profile(profile_data, qualified)
+                if qualified:
+                    logger.info(f"✅ Qualified viral creator: @{username}")
+            finder.pacing.pause(3, 5, "between_profiles")
+
+
+def check_finder_kwargs(finder_kwargs):
+    """Raise ValueError for finder options the sweep workers can't share
+
+    Chrome refuses to open a user_data_dir profile that another worker already has open, so workers
+    share the saved session file instead.
+    """
+    if finder_kwargs.get('user_data_dir'):
+        raise ValueError("Sweep workers can't share a Chrome profile (user_data_dir); "
+                         "they reuse the session file saved by login_once instead")
+
+
+def login_once(finder_kwargs):
+    """Log in with a finder in this process so the session file is saved before any worker starts
+
+    Workers only read that session file (see run_worker), so they never race to write it.
+    Returns True if the session is logged in.
+    """
+    # Imported here so the coordinator doesn't need selenium to seed or report on a sweep
+    from experimental_file import EnhancedInstagramFinder
+
+    check_finder_kwargs(finder_kwargs)
+    finder = EnhancedInstagramFinder(**finder_kwargs)
+    try:
+        return finder.login()
+    finally:
+        finder.close()
+
+
+def run_worker(queue_path, results_path, finder_kwargs, worker_id=None, shard_size=5, lease=900,
+               min_followers=1000, min_engagement=5.0, poll_seconds=5):
+    """Restore the session saved by login_once in a finder of this process's own and work through the
+    queue until it is empty
+
+    Returns how many shards were completed.
+    """
+    # Imported here so the coordinator doesn't need selenium to seed or report on a sweep
+    from experimental_file import EnhancedInstagramFinder
+
+    check_finder_kwargs(finder_kwargs)
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    queue = WorkQueue(queue_path)
+    results = SweepResults(results_path)
+    finder = EnhancedInstagramFinder(**finder_kwargs)
+    finder.thresholds = Thresholds(min_followers=min_followers, min_engagement=min_engagement)
+    completed = 0
+    try:
+        if not finder.restore_session():
+            logger.error(f"Worker {worker_id} could not restore the saved session")
+            return completed
+
+        while True:
+            kind, keys = queue.claim(worker_id, shard_size, lease)
+            if not keys:
+                # Shards claimed by other workers may still queue more work
+                if not queue.active():
+                    break
+                time.sleep(poll_seconds)
+                continue
+
+            logger.info(f"Worker {worker_id} claimed {len(keys)} {kind} items")
+            try:
+                _process_shard(finder, queue, results, kind, keys)
+                queue.done(kind, keys)
+                completed += 1
+            except Exception as e:
+                logger.error(f"Worker {worker_id} failed a {kind} shard: {str(e)}")
+                queue.release(kind, keys)
+
+        logger.info(f"Worker {worker_id} finished after {completed} shards")
+        return completed
+    finally:
+        finder.close()
+        queue.close()
+        results.close()
+
+
+def sweep(industry_tags, finder_kwargs, processes=4, queue_path="sweep_queue.sqlite",
+          results_path="sweep_results.sqlite", explore=True, **worker_kwargs):
+    """Run a sharded sweep with worker processes on this box and return the qualified creators
+
+    finder_kwargs are passed to each worker's EnhancedInstagramFinder (username, password, headless, ...)
+    and may not include user_data_dir (see check_finder_kwargs).
+    This process logs in once first; the workers share its saved session file read-only.
+    """
+    check_finder_kwargs(finder_kwargs)
+    seed(queue_path, industry_tags, explore)
+    if not login_once(finder_kwargs):
+        logger.error("Could not log in, not starting the sweep workers")
+        return CreatorStore()
+
+    # Each worker owns a Chrome session, so start them fresh rather than forking this process
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=run_worker, args=(queue_path, results_path, finder_kwargs),
+                               kwargs=worker_kwargs, name=f"sweep-worker-{index}")
+               for index in range(processes)]
+    start = time.time()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    queue = WorkQueue(queue_path)
+    results = SweepResults(results_path)
+    try:
+        logger.info(f"Sweep finished in {time.time() - start:.1f}s with {processes} workers: "
+                    f"queue {queue.counts()}, results {results.counts()}")
+        return results.to_store()
+    finally:
+        queue.close()
+        results.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed, work on or report on a sharded creator sweep. Every "
+                                                 "worker must run on the box holding the queue and results "
+                                                 "databases; SQLite over a network filesystem is not supported.")
+    parser.add_argument("command", choices=["seed", "work", "report"])
+    parser.add_argument("--queue", default="sweep_queue.sqlite", help="work queue database")
+    parser.add_argument("--results", default="sweep_results.sqlite", help="results database")
+    parser.add_argument("--tags", nargs="*", default=["viral", "trending", "creator", "contentcreator"])
+    parser.add_argument("--no-explore", action="store_true", help="don't queue the explore page")
+    parser.add_argument("--processes", type=int, default=1, help="worker processes to start (work)")
+    parser.add_argument("--shard-size", type=int, default=5)
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--username", default=os.environ.get("INSTAGRAM_USERNAME"))
+    args = parser.parse_args()
+
+    if args.command == "seed":
+        seed(args.queue, args.tags, not args.no_explore)
+    elif args.command == "work":
+        finder_kwargs = {'username': args.username, 'password': os.environ.get("INSTAGRAM_PASSWORD"),
+                         'headless': args.headless}
+        if not login_once(finder_kwargs):
+            logger.error("Could not log in, not starting the sweep workers")
+            return 1
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=run_worker, args=(args.queue, args.results, finder_kwargs),
+                                   kwargs={'shard_size': args.shard_size})
+                   for _ in range(args.processes)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    else:
+        queue = WorkQueue(args.queue)
+        results = SweepResults(args.results)
+        print(json.dumps({'queue': queue.counts(), 'results': results.counts()}, indent=2))
+        queue.close()
+        results.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,21 @@
+import sqlite3
+import threading
+
+
+class LockedSQLite:
+    """Base for the SQLite caches: one connection shared by every thread, used under self.lock
+
+    Pooled drivers and tabs share a cache, so subclasses run each query (and any counter updates
+    that go with it) inside `with self.lock`. schema is the list of CREATE statements to run.
+    """
+
+    def __init__(self, path, schema):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        for statement in schema:
+            self.conn.execute(statement)
+
+    def close(self):
+        """Close the underlying database"""
+        self.conn.close()
@@ -0,0 +1,177 @@
+import logging
+import time
+from collections import deque
+
+from selenium.common.exceptions import WebDriverException
+
+from waits import READY
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+# True once the document marked stale before navigating has been replaced and the XPath matches
+READY_SCRIPT = """
+if (window.__finderStale) { return false; }
+return document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;
+"""
+
+
+class TabPool:
+    """Several tabs (window handles) in one Chrome session that load pages concurrently
+
+    The driver only talks to one tab at a time, but Page.navigate returns as soon as a navigation
+    starts, so every idle tab is sent to its next page before the busy ones are polled for readiness.
+    A tab is replaced by a fresh one after recycle_after navigations to cap renderer memory growth.
+    """
+
+    def __init__(self, driver, size, recycle_after=50, timeout=15, poll_frequency=0.1, report=None):
+        self.driver = driver
+        self.size = size
+        self.recycle_after = recycle_after
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.report = report
+        self.handles = []
+        self.navigations = {}
+        self.recycled = 0
+
+    def open(self):
+        """Open tabs next to the driver's current window until the pool has size tabs"""
+        self.handles = [self.driver.current_window_handle]
+        for _ in range(self.size - 1):
+            self.driver.switch_to.new_window('tab')
+            self.handles.append(self.driver.current_window_handle)
+        self.navigations = {handle: 0 for handle in self.handles}
+        logger.info(f"Opened a pool of {self.size} tabs")
+        return self
+
+    def _recycle(self, handle):
+        """Replace a tab that has served recycle_after navigations, returning the handle to use"""
+        if self.navigations[handle] < self.recycle_after:
+            return handle
+        self.driver.switch_to.new_window('tab')
+        fresh = self.driver.current_window_handle
+        self.driver.switch_to.window(handle)
+        self.driver.close()
+        self.driver.switch_to.window(fresh)
+        self.handles[self.handles.index(handle)] = fresh
+        del self.navigations[handle]
+        self.navigations[fresh] = 0
+        self.recycled += 1
+        return fresh
+
+    def _navigate(self, handle, url, label):
+        start = time.time()
+        self.driver.switch_to.window(handle)
+        self.driver.execute_script("window.__finderStale = true;")
+        self.driver.execute_cdp_cmd("Page.navigate", {'url': url})
+        self.navigations[handle] += 1
+        if self.report:
+            self.report.add(READY, f"{label}.navigate", time.time() - start)
+
+    def map(self, jobs):
+        """Load pages across the tabs and yield (key, result) as each one becomes ready
+
+        jobs are (key, url, ready_xpath, label, handler) tuples. handler() runs with the driver
+        switched to the job's tab once ready_xpath matches; its return value is the result. Jobs
+        that time out or whose handler raises get a None result.
+        """
+        pending = deque(jobs)
+        idle = list(self.handles)
+        busy = {}
+        try:
+            while pending or busy:
+                while pending and idle:
+                    handle = self._recycle(idle.pop())
+                    job = pending.popleft()
+                    try:
+                        self._navigate(handle, job[1], job[3])
+                    except WebDriverException as e:
+                        logger.error(f"Error opening {job[1]} in tab: {str(e)}")
+                        idle.append(handle)
+                        yield job[0], None
+                        continue
+                    busy[handle] = (job, time.time())
+
+                for handle in list(busy):
+                    (key, url, ready_xpath, label, handler), started = busy[handle]
+                    self.driver.switch_to.window(handle)
+                    try:
+                        ready = self.driver.execute_script(READY_SCRIPT, ready_xpath)
+                    except WebDriverException:
+                        # The page is mid-navigation
+                        ready = False
+                    if not ready and time.time() - started < self.timeout:
+                        continue
+
+                    del busy[handle]
+                    idle.append(handle)
+                    if self.report:
+                        self.report.add(READY, label, time.time() - started)
+                    result = None
+                    if not ready:
+                        logger.warning(f"Timed out waiting for {label} to become ready: {url}")
+                    else:
+                        try:
+                            result = handler()
+                        except Exception as e:
+                            logger.error(f"Error processing {url} in tab: {str(e)}")
+                    yield key, result
+
+                if busy:
+                    time.sleep(self.poll_frequency)
+        finally:
+            self.driver.switch_to.window(self.handles[0])
+
+    def memory(self):
+        """Return JS heap per tab and (with psutil) renderer RSS, in MB
+
+        Chrome doesn't expose which renderer process serves which tab, so RSS is the total over the
+        browser's renderer processes and its average per tab.
+        """
+        tabs = {}
+        for index, handle in enumerate(self.handles):
+            self.driver.switch_to.window(handle)
+            self.driver.execute_cdp_cmd("Performance.enable", {})
+            metrics = {m['name']: m['value'] for m in self.driver.execute_cdp_cmd("Performance.getMetrics", {})['metrics']}
+            tabs[index] = round(metrics.get('JSHeapUsedSize', 0) / 2 ** 20, 1)
+        self.driver.switch_to.window(self.handles[0])
+
+        usage = {'js_heap_mb': tabs}
+        if psutil:
+            try:
+                processes = psutil.Process(self.driver.service.process.pid).children(recursive=True)
+                rss = sum(p.memory_info().rss for p in processes if '--type=renderer' in ' '.join(p.cmdline()))
+                usage['renderer_rss_mb'] = round(rss / 2 ** 20, 1)
+                usage['rss_per_tab_mb'] = round(rss / 2 ** 20 / max(len(self.handles), 1), 1)
+            except (psutil.Error, AttributeError) as e:
+                logger.warning(f"Could not read renderer memory: {e}")
+        return usage
+
+    def log(self):
+        """Log memory per tab and how many tabs were recycled"""
+        usage = self.memory()
+        logger.info(f"Tab pool: {len(self.handles)} tabs, {self.recycled} recycled, JS heap MB per tab {usage['js_heap_mb']}")
+        if 'renderer_rss_mb' in usage:
+            logger.info(f"Tab pool renderer RSS {usage['renderer_rss_mb']} MB ({usage['rss_per_tab_mb']} MB per tab)")
+
+    def close(self):
+        """Close every tab but the first, leaving the driver on it"""
+        for handle in self.handles[1:]:
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except WebDriverException as e:
+                logger.error(f"Error closing tab: {e}")
+        self.driver.switch_to.window(self.handles[0])
+        self.handles = self.handles[:1]
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
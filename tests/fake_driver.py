@@ -0,0 +1,75 @@
+from experimental_file import HASHTAG_MISSING_XPATH, PROFILE_UNAVAILABLE_XPATH, EnhancedInstagramFinder
+from extractors import EXTRACT_SCRIPT
+from page_json import EMBEDDED_DATA_SCRIPT
+from waits import PacingPolicy
+
+PROFILE_DOM = {
+    'name': 'Page Name',
+    'bio': 'page bio',
+    'category': 'Artist',
+    'followers': [None, '5.6K', None, None],
+    'post_urls': ['https://www.instagram.com/p/A/', 'https://www.instagram.com/p/B/']
+}
+POST_DOM = {
+    'username': 'https://www.instagram.com/alice/',
+    'views': '2.5M views',
+    'likes': [None, '12,300', None, None],
+    'comments': '45 comments',
+    'comment_items': 3,
+    'timestamp': '2024-03-01T10:00:00.000Z',
+    'caption': 'page caption'
+}
+
+
+class FakeElement:
+    """A visible, enabled element that accepts clicks and keystrokes"""
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def click(self):
+        pass
+
+    def send_keys(self, *keys):
+        pass
+
+
+class FakeDriver:
+    """Answers the extraction scripts from canned values and records which fields were requested"""
+
+    def __init__(self, dom=None, embedded=None):
+        self.dom = dict(PROFILE_DOM, **POST_DOM, **(dom or {}))
+        self.embedded = embedded or {'json': [], 'meta': {}}
+        self.requested = []
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def find_elements(self, by, xpath):
+        # Every page renders, every profile is available and every hashtag exists
+        return [] if xpath in (PROFILE_UNAVAILABLE_XPATH, HASHTAG_MISSING_XPATH) else [FakeElement()]
+
+    def find_element(self, by, xpath):
+        return FakeElement()
+
+    def execute_script(self, script, *args):
+        if script == EMBEDDED_DATA_SCRIPT:
+            return self.embedded
+        if script == EXTRACT_SCRIPT:
+            spec = args[0]
+            self.requested.append(set(spec))
+            return dict({name: self.dom[name] for name in spec}, _timings={})
+        if script.startswith("window.scroll"):
+            return None
+        raise AssertionError("unexpected script")
+
+
+def make_finder(driver, **kwargs):
+    options = dict(cache_path=None, selector_stats_path=None, session_path=None, creator_cache_path=None,
+                   pacing=PacingPolicy(scale=0))
+    options.update(kwargs)
+    return EnhancedInstagramFinder(None, None, driver=driver, **options)
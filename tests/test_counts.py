@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from counts import check_corpus, generate_corpus, parse_count, parse_counts
+
+
+@pytest.mark.parametrize("text, locale, expected", [
+    ("1,234", None, 1234),
+    ("12.5K", None, 12500),
+    ("1.2M views", None, 1200000),
+    ("3B", None, 3000000000),
+    ("1,2 Mio.", "de", 1200000),
+    ("1.234", "de", 1234),
+    ("1.234", None, 1234),
+    ("1,234K", "de", 1234),
+    ("1 234 567", "fr", 1234567),
+    ("View all 45 comments", None, 45),
+    ("Liked by user99 and 1,024 others", None, 1024),
+    ("  7  ", None, 7),
+])
+def test_parse_count(text, locale, expected):
+    assert parse_count(text, locale) == expected
+
+
+@pytest.mark.parametrize("text", [None, "", "no count here", "user99"])
+def test_text_without_a_count_raises(text):
+    with pytest.raises(ValueError):
+        parse_count(text)
+
+
+def test_generated_corpus_parses():
+    assert check_corpus(generate_corpus(2000, seed=1)) == []
+
+
+def test_parse_counts_keeps_the_series_index():
+    series = pd.Series(["1K", None, "n/a", "1K", "2,000"], index=list("abcde"))
+    result = parse_counts(series)
+    assert list(result.index) == list("abcde")
+    assert result.dtype == "float64"
+    np.testing.assert_array_equal(result.to_numpy(), [1000, np.nan, np.nan, 1000, 2000])
+
+
+def test_parse_counts_returns_an_array_for_lists():
+    result = parse_counts(["1,2 Mio.", "3 Tsd."], locale="de")
+    assert isinstance(result, np.ndarray)
+    np.testing.assert_array_equal(result, [1200000, 3000])
@@ -0,0 +1,126 @@
+import time
+
+import pytest
+
+from creator_cache import TIERS, CreatorCache
+
+PROFILE = {'name': 'Alice', 'bio': 'bio', 'category': 'Artist', 'is_creator_account': True, 'followers': 900,
+           'recent_posts': [{'post_url': 'https://www.instagram.com/p/A/'}]}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = CreatorCache(str(tmp_path / "creator_cache.sqlite"), slow_ttl=100, fast_ttl=10, history_limit=3)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def finder(tmp_path):
+    pytest.importorskip("selenium")
+    from fake_driver import FakeDriver, make_finder
+
+    finder = make_finder(FakeDriver(), creator_cache_path=str(tmp_path / "creator_cache.sqlite"))
+    yield finder
+    finder.creator_cache.close()
+
+
+def age(cache, username, tier, seconds):
+    """Backdate one tier of a snapshot"""
+    cache.conn.execute("UPDATE snapshots SET refreshed_at = ? WHERE username = ? AND tier = ?",
+                       (time.time() - seconds, username, tier))
+
+
+def test_unknown_creator_is_stale_in_every_tier(cache):
+    assert cache.lookup("alice") == ({}, set(TIERS))
+    assert cache.stats()['profiles'] == {'fresh': 0, 'partial': 0, 'miss': 1}
+
+
+def test_each_tier_expires_on_its_own_ttl(cache):
+    cache.update("alice", PROFILE, set(TIERS))
+    assert cache.lookup("alice") == (PROFILE, set())
+
+    age(cache, "alice", 'followers', 20)
+    age(cache, "alice", 'slow', 20)
+    snapshot, stale = cache.lookup("alice")
+    assert stale == {'followers'}
+    assert snapshot == PROFILE
+
+    stats = cache.stats()
+    assert stats['profiles'] == {'fresh': 1, 'partial': 1, 'miss': 0}
+    assert stats['tiers']['followers'] == {'hits': 1, 'misses': 1, 'hit_rate': 0.5}
+
+
+def test_update_only_touches_the_given_tiers(cache):
+    cache.update("alice", PROFILE, set(TIERS))
+    age(cache, "alice", 'posts', 20)
+    cache.update("alice", dict(PROFILE, followers=1000, name='Renamed'), {'followers'})
+
+    snapshot, stale = cache.lookup("alice")
+    assert (snapshot['followers'], snapshot['name']) == (1000, 'Alice')
+    assert stale == {'posts'}
+
+
+def test_delta_splits_new_and_known_posts(cache):
+    assert cache.delta("alice", ['B', 'A']) == (['B', 'A'], {})
+    cache.merge_posts("alice", ['B', 'A'], {'B': {'likes': 2}, 'A': {'likes': 1}})
+
+    assert cache.delta("alice", ['C', 'B', 'A']) == (['C'], {'B': {'likes': 2}, 'A': {'likes': 1}})
+    assert cache.delta("alice", ['B', 'A']) == ([], {'B': {'likes': 2}, 'A': {'likes': 1}})
+    assert cache.newest_shortcode("alice") == 'B'
+    assert cache.stats()['grids'] == {'unchanged': 1, 'changed': 1, 'new': 1}
+    assert cache.stats()['posts'] == {'new': 3, 'reused': 4}
+
+
+def test_history_keeps_the_most_recent_posts(cache):
+    cache.merge_posts("alice", ['C', 'B', 'A'], {'C': {}, 'B': {}, 'A': {}})
+    cache.merge_posts("alice", ['E', 'D', 'C', 'B', 'A'], {'E': {}, 'D': {}})
+    assert sorted(cache.history("alice")) == ['C', 'D', 'E']
+    assert cache.newest_shortcode("alice") == 'E'
+
+
+def test_forget_drops_everything_for_a_creator(cache):
+    cache.update("alice", PROFILE, set(TIERS))
+    cache.update("bob", PROFILE, set(TIERS))
+    cache.merge_posts("alice", ['A'], {'A': {}})
+    cache.forget("alice")
+
+    assert cache.lookup("alice") == ({}, set(TIERS))
+    assert cache.history("alice") == {}
+    assert cache.newest_shortcode("alice") is None
+    assert len(cache) == 1
+
+
+def test_snapshots_survive_reopening(tmp_path):
+    path = str(tmp_path / "creator_cache.sqlite")
+    cache = CreatorCache(path)
+    cache.update("alice", PROFILE, set(TIERS))
+    cache.close()
+
+    cache = CreatorCache(path)
+    assert cache.lookup("alice") == (PROFILE, set())
+    cache.close()
+
+
+def test_first_analysis_fills_an_empty_cache(finder):
+    profile = finder.analyze_creator_profile("alice")
+    assert len(finder.creator_cache) == 1
+
+    snapshot, stale = finder.creator_cache.lookup("alice")
+    assert stale == set()
+    assert snapshot['followers'] == profile['followers'] == 5600
+    assert snapshot['name'] == 'Page Name'
+
+
+def test_fresh_snapshot_skips_the_profile_page(finder):
+    first = finder.analyze_creator_profile("alice")
+    visited = len(finder.driver.visited)
+
+    assert finder.analyze_creator_profile("alice")['followers'] == first['followers']
+    assert len(finder.driver.visited) == visited
+
+
+def test_first_analysis_records_the_grid(finder):
+    finder.analyze_creator_profile("alice")
+    assert finder.creator_cache.newest_shortcode("alice") == 'A'
+    assert sorted(finder.creator_cache.history("alice")) == ['A', 'B']
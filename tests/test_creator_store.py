@@ -0,0 +1,92 @@
+import pytest
+
+pytest.importorskip("pandas")
+
+from creator_store import CreatorStore
+from scoring import Thresholds, score_profile, score_store
+
+
+def post(shortcode, username, views=0, likes=100, comments=10, is_video=False):
+    return {
+        'username': username, 'post_url': f"https://www.instagram.com/p/{shortcode}/", 'is_video': is_video,
+        'views': views, 'likes': likes, 'comments': comments, 'has_million_views': is_video and views >= 1000000,
+        'engagement_rate': (likes + comments) / views * 100 if is_video and views > 1 else 0,
+        'timestamp': "", 'caption': ""
+    }
+
+
+def profile(username, posts, followers=5000):
+    profile_data = {'username': username, 'name': username.title(), 'bio': "", 'category': "",
+                    'is_creator_account': False, 'followers': followers}
+    profile_data.update(score_profile(posts))
+    profile_data['recent_posts'] = posts
+    return profile_data
+
+
+def test_profile_round_trip():
+    store = CreatorStore()
+    alice = profile('alice', [post('A1', 'alice', views=2000000, likes=90000, is_video=True), post('A2', 'alice')])
+    store.add_profile(alice)
+    assert len(store) == 1
+    assert 'alice' in store
+    assert store.profile('alice') == alice
+    assert list(store) == [alice]
+
+
+def test_readding_a_profile_overwrites_its_row():
+    store = CreatorStore()
+    store.add_profile(profile('alice', [post('A1', 'alice')], followers=10))
+    store.add_profile(profile('alice', [post('A1', 'alice')], followers=20))
+    assert len(store) == 1
+    assert store.profile('alice')['followers'] == 20
+
+
+def test_collab_post_is_kept_per_creator():
+    store = CreatorStore()
+    collab = post('COLLAB', 'alice', views=3000000, likes=200000, is_video=True)
+    alice = profile('alice', [collab, post('A2', 'alice')])
+    bob = profile('bob', [dict(collab, username='bob')])
+    store.add_profile(alice)
+    store.add_profile(bob)
+
+    assert [p['username'] for p in store.profile('alice')['recent_posts']] == ['alice', 'alice']
+    assert [p['username'] for p in store.profile('bob')['recent_posts']] == ['bob']
+
+    scores = score_store(store, Thresholds())
+    for profile_data in (alice, bob):
+        row = scores.loc[profile_data['username']]
+        assert row['posts_analyzed'] == profile_data['posts_analyzed']
+        assert row['has_viral_video'] == profile_data['has_viral_video']
+        assert row['viral_score'] == pytest.approx(profile_data['viral_score'])
+
+
+def test_to_frames_and_clear():
+    store = CreatorStore()
+    store.add_profile(profile('alice', [post('A1', 'alice'), post('A2', 'alice')]))
+    creators, posts = store.to_frames(['username', 'followers'], ['username', 'shortcode', 'post_rank'])
+    assert creators.to_dict('records') == [{'username': 'alice', 'followers': 5000}]
+    assert posts.to_dict('records') == [{'username': 'alice', 'shortcode': 'A1', 'post_rank': 0},
+                                        {'username': 'alice', 'shortcode': 'A2', 'post_rank': 1}]
+    store.clear()
+    assert len(store) == 0
+
+
+def test_export_csv(tmp_path):
+    store = CreatorStore()
+    store.add_profile(profile('alice', [post('A1', 'alice')]))
+    store.export_csv(tmp_path / "creators.csv", tmp_path / "posts.csv")
+    assert (tmp_path / "creators.csv").read_text().splitlines()[1].startswith("alice,Alice,")
+    assert "A1,alice,0," in (tmp_path / "posts.csv").read_text()
+
+
+def test_each_run_returns_its_own_store():
+    pytest.importorskip("selenium")
+    from fake_driver import FakeDriver, make_finder
+
+    finder = make_finder(FakeDriver())
+    finder.creators_data = [profile('alice', [post('A1', 'alice')])]
+    first = finder.creators_data
+    second = finder.find_viral_creators(industry_tags=[], journal_path=None)
+
+    assert second is not first
+    assert len(first) == 1 and first[0]['followers'] == 5000
@@ -0,0 +1,42 @@
+import pytest
+
+pytest.importorskip("selenium")
+
+from extractors import EXPLORE_FIELDS, KEYWORD_FIELDS
+from fake_driver import FakeDriver, make_finder
+
+EXPLORE_URLS = ['https://www.instagram.com/p/A/', 'https://www.instagram.com/p/A/', None,
+                'https://www.instagram.com/reel/R/', 'https://www.instagram.com/p/B/']
+ACCOUNT_URLS = ['https://www.instagram.com/alice/', 'https://www.instagram.com/bob/',
+                'https://www.instagram.com/alice/', '']
+
+
+def test_explore_posts_are_read_before_the_first_yield():
+    driver = FakeDriver(dom={'post_urls': EXPLORE_URLS})
+    posts = make_finder(driver).iter_explore_posts()
+
+    first = next(posts)
+    assert driver.requested == [set(EXPLORE_FIELDS)]
+
+    # The consumer navigating away must not affect what is still to be yielded
+    driver.get("https://www.instagram.com/elsewhere/")
+    assert [first] + list(posts) == ['https://www.instagram.com/p/A/', 'https://www.instagram.com/p/B/']
+    assert driver.requested == [set(EXPLORE_FIELDS)]
+
+
+def test_hashtag_posts_are_deduplicated():
+    driver = FakeDriver(dom={'post_urls': EXPLORE_URLS})
+    assert make_finder(driver).search_hashtag("cats") == ['https://www.instagram.com/p/A/',
+                                                          'https://www.instagram.com/reel/R/',
+                                                          'https://www.instagram.com/p/B/']
+
+
+def test_keyword_accounts_are_read_in_one_extraction():
+    driver = FakeDriver(dom={'account_urls': ACCOUNT_URLS})
+    assert make_finder(driver).search_keyword("creator") == ['alice', 'bob']
+    assert driver.requested == [set(KEYWORD_FIELDS)]
+
+
+def test_suggested_accounts_skip_the_seed():
+    driver = FakeDriver(dom={'usernames': ['seed', 'carol', 'dave', 'carol', '']})
+    assert make_finder(driver).find_suggested_accounts("seed") == ['carol', 'dave']
@@ -0,0 +1,44 @@
+import itertools
+
+import pytest
+
+pytest.importorskip("selenium")
+
+import driver_pool
+from driver_pool import DriverPool
+
+
+class Session:
+    def __init__(self, launched):
+        self.quit_called = False
+        launched.append(self)
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_only_the_concurrency_cap_is_launched(monkeypatch):
+    launched = []
+    monkeypatch.setattr(driver_pool, "create_driver", lambda headless, **options: Session(launched))
+    with DriverPool(4, max_concurrency=1) as pool:
+        assert len(pool.drivers) == 1
+        assert sorted(pool.run([1, 2, 3], lambda driver, item: item * 2)) == [(1, 2), (2, 4), (3, 6)]
+    assert len(launched) == 1 and launched[0].quit_called
+
+
+def test_started_sessions_are_quit_when_a_launch_fails(monkeypatch):
+    launched = []
+    calls = itertools.count(1)
+
+    def create_driver(headless, **options):
+        if next(calls) == 3:
+            raise RuntimeError("chrome crashed")
+        return Session(launched)
+
+    monkeypatch.setattr(driver_pool, "create_driver", create_driver)
+    pool = DriverPool(4)
+    with pytest.raises(RuntimeError):
+        pool.start()
+    assert len(launched) == 3
+    assert all(session.quit_called for session in launched)
+    assert pool.drivers == []
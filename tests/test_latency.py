@@ -0,0 +1,27 @@
+import pytest
+
+pytest.importorskip("selenium")
+
+from fake_driver import FakeDriver, make_finder
+from waits import LatencyReport
+
+
+def test_reset_drops_totals_and_restarts_the_clock():
+    latency = LatencyReport()
+    latency.add('sleep', 'scroll', 2.0)
+    latency.started -= 100
+    latency.reset()
+    assert latency.total('sleep') == 0.0
+    assert latency.count('sleep', 'scroll') == 0
+    assert latency.summary()['wall_seconds'] < 100
+
+
+def test_each_run_reports_only_its_own_latency():
+    finder = make_finder(FakeDriver())
+    finder.latency.add('sleep', 'earlier_run', 5.0)
+    finder.latency.started -= 100
+    list(finder.iter_viral_creators(industry_tags=[], journal_path=None))
+
+    summary = finder.latency.summary()
+    assert 'sleep.earlier_run' not in summary['by_label']
+    assert summary['wall_seconds'] < 100
@@ -0,0 +1,55 @@
+import time
+
+import pytest
+
+from post_cache import PostCache, canonical_post_url, shortcode_from_url
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = PostCache(str(tmp_path / "post_cache.sqlite"), ttl=60, max_entries=2)
+    yield cache
+    cache.close()
+
+
+def test_round_trip_and_counters(cache):
+    assert cache.get("A") is None
+    cache.set("A", {'likes': 1})
+    assert cache.get("A") == {'likes': 1}
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5, 'entries': 1}
+
+
+def test_expired_entries_are_misses(cache):
+    cache.set("A", {'likes': 1}, ttl=-1)
+    cache.set("B", {'likes': 2})
+    assert cache.get("A") is None
+    assert len(cache) == 1
+
+    cache.set("C", {'likes': 3}, ttl=-1)
+    cache.purge_expired()
+    assert len(cache) == 1
+
+
+def test_least_recently_used_entry_is_evicted(cache):
+    cache.set("A", {})
+    time.sleep(0.01)
+    cache.set("B", {})
+    time.sleep(0.01)
+    cache.get("A")
+    time.sleep(0.01)
+    cache.set("C", {})
+
+    assert cache.get("B") is None
+    assert cache.get("A") == {} and cache.get("C") == {}
+
+
+@pytest.mark.parametrize("url", ["https://www.instagram.com/p/Abc_1-/", "https://www.instagram.com/reel/Abc_1-/?igsh=x",
+                                 "https://www.instagram.com/alice/p/Abc_1-/"])
+def test_post_urls_share_a_shortcode(url):
+    assert shortcode_from_url(url) == "Abc_1-"
+    assert canonical_post_url(url) == "https://www.instagram.com/p/Abc_1-/"
+
+
+def test_non_post_urls_are_left_alone():
+    assert shortcode_from_url("https://www.instagram.com/alice/") is None
+    assert canonical_post_url("https://www.instagram.com/alice/") == "https://www.instagram.com/alice/"
@@ -0,0 +1,79 @@
+import pytest
+
+pytest.importorskip("selenium")
+
+from extractors import EXTRACT_SCRIPT, POST_FIELDS
+from fake_driver import FakeDriver, make_finder
+
+POST_URL = "https://www.instagram.com/p/ABC123/"
+
+
+def test_read_post_without_embedded_data_runs_every_chain():
+    driver = FakeDriver()
+    post_data = make_finder(driver)._read_post(POST_URL)
+    assert driver.requested == [{'username', 'views', 'likes', 'comments', 'comment_items', 'timestamp', 'caption'}]
+    assert post_data['username'] == 'alice'
+    assert post_data['views'] == 2500000
+    assert post_data['is_video'] is True
+    assert post_data['likes'] == 12300
+    assert post_data['comments'] == 45
+    assert post_data['has_million_views'] is True
+
+
+def test_read_post_runs_xpath_only_for_fields_meta_tags_missed():
+    meta = {'og:description': '1,234 likes, 56 comments - bob on March 1, 2024: "meta caption"'}
+    driver = FakeDriver(embedded={'json': [], 'meta': meta})
+    post_data = make_finder(driver)._read_post(POST_URL)
+    assert driver.requested == [{'views', 'timestamp'}]
+    assert post_data['username'] == 'bob'
+    assert post_data['likes'] == 1234
+    assert post_data['comments'] == 56
+    assert post_data['caption'] == 'meta caption'
+    assert post_data['views'] == 2500000
+    assert post_data['timestamp'] == '2024-03-01T10:00:00.000Z'
+
+
+def test_post_cache_is_consulted_once_per_post(tmp_path):
+    driver = FakeDriver()
+    finder = make_finder(driver, cache_path=str(tmp_path / "posts.sqlite"))
+    profile_data = finder.analyze_creator_profile("alice")
+    assert profile_data['posts_analyzed'] == 2
+    assert finder.post_cache.misses == 2
+
+    # The second analysis is answered from this run's posts without touching the cache or the pages
+    driver.visited = []
+    finder.analyze_creator_profile("alice")
+    assert driver.visited == ["https://www.instagram.com/alice/"]
+    assert finder.post_cache.misses == 2
+    finder.post_cache.close()
+
+
+class LikesByXPath(FakeDriver):
+    """Answers each likes selector from its own canned text, in whatever order the spec lists them"""
+
+    def __init__(self, likes_by_xpath):
+        super().__init__()
+        self.likes_by_xpath = likes_by_xpath
+
+    def execute_script(self, script, *args):
+        result = super().execute_script(script, *args)
+        if script == EXTRACT_SCRIPT and 'likes' in args[0]:
+            result['likes'] = [self.likes_by_xpath.get(xpath) for xpath in args[0]['likes']['xpaths']]
+        return result
+
+
+def test_likes_keep_the_declared_selector_order():
+    specific, *_, broad = POST_FIELDS['likes']['xpaths']
+    finder = make_finder(LikesByXPath({}))
+    # The broad fallback matched on posts where the specific selector missed
+    for _ in range(2):
+        finder.driver.likes_by_xpath = {broad: '7 likes'}
+        finder._read_post(POST_URL)
+    for _ in range(8):
+        finder.driver.likes_by_xpath = {specific: '12,300', broad: '7 likes'}
+        assert finder._read_post(POST_URL)['likes'] == 12300
+
+    stats = finder.selectors.stats['likes']
+    assert (stats[specific]['hits'], stats[specific]['misses']) == (8, 2)
+    assert (stats[broad]['hits'], stats[broad]['misses']) == (10, 0)
+    assert all(entry['hits'] + entry['misses'] == 10 for entry in stats.values())
@@ -0,0 +1,69 @@
+import itertools
+
+import pytest
+
+pytest.importorskip("selenium")
+
+from creator_cache import TIERS
+from extractors import GRID_FIELDS
+from fake_driver import PROFILE_DOM as DOM, FakeDriver, make_finder
+
+CACHED = {
+    'name': 'Cached Name', 'bio': 'cached bio', 'category': 'Cached', 'is_creator_account': True,
+    'followers': 1234, 'recent_posts': [{'post_url': 'https://www.instagram.com/p/OLD/'}]
+}
+STALE_COMBINATIONS = [set(combo) for size in range(len(TIERS) + 1) for combo in itertools.combinations(TIERS, size)]
+
+
+@pytest.mark.parametrize("stale", STALE_COMBINATIONS, ids=lambda stale: "+".join(sorted(stale)) or "none")
+def test_read_profile_extracts_only_stale_tiers(stale):
+    driver = FakeDriver()
+    metrics, post_urls, refreshed = make_finder(driver)._read_profile("someone", None, dict(CACHED), set(stale))
+
+    header_fields = set()
+    if 'slow' in stale:
+        header_fields |= {'name', 'bio', 'category'}
+    if 'followers' in stale:
+        header_fields |= {'followers'}
+    requested = [fields for fields in driver.requested if fields != set(GRID_FIELDS)]
+    assert requested == ([header_fields] if header_fields else [])
+
+    assert refreshed == stale
+    if 'slow' in stale:
+        assert (metrics['name'], metrics['bio'], metrics['category']) == ('Page Name', 'page bio', 'Artist')
+        assert metrics['is_creator_account'] is True
+    else:
+        assert (metrics['name'], metrics['bio'], metrics['category']) == ('Cached Name', 'cached bio', 'Cached')
+    assert metrics['followers'] == (5600 if 'followers' in stale else 1234)
+    assert 'recent_posts' not in metrics
+
+    if 'posts' in stale:
+        assert post_urls == DOM['post_urls']
+    else:
+        assert post_urls is None
+
+
+def test_read_profile_without_cache_reads_everything():
+    metrics, post_urls, refreshed = make_finder(FakeDriver())._read_profile("someone")
+    assert metrics == {'name': 'Page Name', 'bio': 'page bio', 'category': 'Artist', 'is_creator_account': True,
+                       'followers': 5600}
+    assert post_urls == DOM['post_urls']
+    assert refreshed == set(TIERS)
+
+
+def test_unparsed_follower_count_is_not_refreshed():
+    driver = FakeDriver(dom={'followers': [None, 'n/a', None, None]})
+    metrics, _, refreshed = make_finder(driver)._read_profile("someone", None, dict(CACHED), {'followers'})
+    assert metrics['followers'] == 1234
+    assert refreshed == set()
+
+
+def test_embedded_json_skips_xpath():
+    blob = ('{"user": {"username": "someone", "full_name": "Json Name", "biography": "json bio",'
+            ' "category_name": "Chef", "edge_followed_by": {"count": 42}}}')
+    driver = FakeDriver(embedded={'json': [blob], 'meta': {}})
+    metrics, _, refreshed = make_finder(driver)._read_profile("someone", None, dict(CACHED), {'slow', 'followers'})
+    assert driver.requested == []
+    assert metrics['followers'] == 42
+    assert metrics['name'] == 'Json Name'
+    assert refreshed == {'slow', 'followers'}
@@ -0,0 +1,33 @@
+import time
+
+from scheduler import CreatorScheduler
+
+
+def test_paused_time_and_pages_do_not_count():
+    pages = [0]
+    scheduler = CreatorScheduler(max_seconds=0.2, max_pages=3, page_counter=lambda: pages[0])
+    assert not scheduler.exhausted()
+
+    scheduler.start()
+    pages[0] = 2
+    scheduler.pause()
+    time.sleep(0.25)
+    pages[0] = 10
+    assert not scheduler.exhausted()
+
+    scheduler.resume()
+    assert scheduler.pages_used() == 2
+    assert scheduler.seconds_used() < 0.2
+    assert not scheduler.exhausted()
+    pages[0] = 11
+    assert scheduler.exhausted()
+
+
+def test_creators_from_several_sources_are_analyzed_first():
+    scheduler = CreatorScheduler()
+    scheduler.add("keyword_only", "keyword")
+    scheduler.add("both", "keyword")
+    scheduler.add("both", "hashtag", {'views': 100, 'engagement_rate': 2.0, 'has_million_views': False})
+    scheduler.add("viral", "suggested", {'views': 2000000, 'engagement_rate': 1.0, 'has_million_views': True})
+    assert scheduler.drain() == ["viral", "both", "keyword_only"]
+    assert len(scheduler) == 0
@@ -0,0 +1,98 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from creator_store import CreatorStore
+from scoring import EarlyExitReport, Thresholds, qualifies, score_posts, score_profile, score_store
+from waits import LatencyReport
+
+
+def post(rate, is_video=False, views=0):
+    return {'engagement_rate': rate, 'is_video': is_video, 'views': views}
+
+
+def test_score_profile_flags_and_weights():
+    scores = score_profile([post(12.0), post(6.0, is_video=True, views=1500000), post(0.0)])
+    assert scores['avg_engagement_rate'] == 6.0
+    assert scores['latest_post_engagement'] == 12.0
+    assert scores['on_hot_streak'] and scores['has_viral_video']
+    assert (scores['video_post_count'], scores['image_post_count']) == (1, 2)
+    # 50 viral + 20 streak + 30 * 6 / (2 * 5)
+    assert scores['viral_score'] == pytest.approx(88.0)
+
+
+def test_score_profile_without_posts():
+    scores = score_profile([])
+    assert scores['posts_analyzed'] == 0
+    assert not scores['on_hot_streak'] and not scores['has_viral_video']
+    assert scores['viral_score'] == 0.0
+
+
+def test_thresholds_change_the_score():
+    posts = [post(4.0, is_video=True, views=500000), post(4.0)]
+    assert score_profile(posts)['viral_score'] == pytest.approx(12.0)
+    assert score_profile(posts, Thresholds(viral_views=100000, min_engagement=2.0))['viral_score'] == pytest.approx(80.0)
+    assert Thresholds(min_engagement=0).engagement_score(0.5) == 1.0
+
+
+@pytest.mark.parametrize("followers, scores, expected", [
+    (500, {'has_viral_video': True, 'on_hot_streak': True, 'avg_engagement_rate': 50.0}, False),
+    (5000, {'has_viral_video': True, 'on_hot_streak': False, 'avg_engagement_rate': 0.0}, True),
+    (5000, {'has_viral_video': False, 'on_hot_streak': True, 'avg_engagement_rate': 0.0}, True),
+    (5000, {'has_viral_video': False, 'on_hot_streak': False, 'avg_engagement_rate': 5.5}, True),
+    (5000, {'has_viral_video': False, 'on_hot_streak': False, 'avg_engagement_rate': 5.0}, False),
+])
+def test_qualifies(followers, scores, expected):
+    assert qualifies(dict(scores, followers=followers)) is expected
+
+
+def test_score_posts_matches_score_profile():
+    creators = {
+        'alice': [post(12.0), post(6.0, is_video=True, views=1500000), post(0.0)],
+        'bob': [post(1.0), post(3.0)],
+        'carol': [post(7.0, is_video=True, views=20000)]
+    }
+    posts = pd.DataFrame([dict(p, username=username, post_rank=rank)
+                          for username, items in creators.items() for rank, p in enumerate(items)])
+    # Row order must not matter, only post_rank
+    posts = posts.iloc[::-1]
+    followers = pd.Series({'alice': 5000, 'bob': 100, 'carol': 2000, 'dave': 9000})
+    scores = score_posts(posts, followers)
+
+    assert list(scores.index[:1]) == ['alice']
+    for username, items in creators.items():
+        expected = score_profile(items)
+        row = scores.loc[username]
+        for column, value in expected.items():
+            assert row[column] == pytest.approx(value), (username, column)
+        assert row['qualified'] == qualifies(dict(expected, followers=followers[username]))
+
+    dave = scores.loc['dave']
+    assert (dave['posts_analyzed'], dave['viral_score'], dave['qualified']) == (0, 0.0, False)
+
+
+def test_score_store_rescores_under_new_thresholds():
+    store = CreatorStore()
+    recent_posts = [{'username': 'alice', 'post_url': 'https://www.instagram.com/p/A/', 'is_video': True,
+                     'views': 200000, 'likes': 9000, 'comments': 0, 'has_million_views': False,
+                     'engagement_rate': 4.5, 'timestamp': "", 'caption': ""}]
+    profile = {'username': 'alice', 'name': 'Alice', 'bio': "", 'category': "", 'is_creator_account': False,
+               'followers': 5000, 'recent_posts': recent_posts}
+    profile.update(score_profile(recent_posts))
+    store.add_profile(profile)
+
+    assert not score_store(store).loc['alice', 'qualified']
+    assert score_store(store, Thresholds(viral_views=100000)).loc['alice', 'qualified']
+
+
+def test_early_exit_report_estimates_seconds_saved():
+    latency = LatencyReport()
+    latency.add('ready', 'post.navigate', 1.0)
+    latency.add('sleep', 'between_posts', 0.5)
+    report = EarlyExitReport()
+    report.record('viral', 4)
+    report.record('viral', 2)
+    report.record('hopeless', 1)
+
+    assert report.profiles == {'viral': 2, 'hopeless': 1}
+    assert report.seconds_saved(latency) == pytest.approx(7 * 1.5)
@@ -0,0 +1,41 @@
+import json
+import os
+import threading
+
+from selector_registry import SelectorRegistry
+
+
+def test_concurrent_saves_leave_a_complete_file(tmp_path):
+    path = str(tmp_path / "selector_stats.json")
+    registries = [SelectorRegistry(path) for _ in range(8)]
+    for index, registry in enumerate(registries):
+        registry.record("likes", f"//span[{index}]", True)
+
+    errors = []
+
+    def save_repeatedly(registry):
+        try:
+            for _ in range(20):
+                registry.save()
+        except OSError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=save_repeatedly, args=(registry,)) for registry in registries]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+    with open(path, encoding="utf-8") as f:
+        assert len(json.load(f)['likes']) == 1
+    assert os.listdir(tmp_path) == ["selector_stats.json"]
+
+
+def test_saved_order_is_reloaded(tmp_path):
+    path = str(tmp_path / "selector_stats.json")
+    registry = SelectorRegistry(path)
+    registry.record_chain("likes", ["//a", "//b"], 1)
+    registry.save()
+    assert SelectorRegistry(path).ordered("likes", ["//a", "//b"]) == ["//b", "//a"]
@@ -0,0 +1,29 @@
+import pytest
+
+from sharding import WorkQueue, run_worker, sweep
+
+
+def test_sweep_rejects_a_shared_chrome_profile(tmp_path):
+    queue_path = tmp_path / "queue.sqlite"
+    with pytest.raises(ValueError):
+        sweep(["viral"], {'user_data_dir': str(tmp_path / "profile")}, processes=2, queue_path=str(queue_path),
+              results_path=str(tmp_path / "results.sqlite"))
+    assert not queue_path.exists()
+
+    with pytest.raises(ValueError):
+        run_worker(str(queue_path), str(tmp_path / "results.sqlite"), {'user_data_dir': str(tmp_path / "profile")})
+
+
+def test_claimed_items_are_not_claimed_twice(tmp_path):
+    queue = WorkQueue(str(tmp_path / "queue.sqlite"))
+    assert queue.add('post', ['a', 'b', 'c']) == 3
+    assert queue.add('post', ['a']) == 0
+
+    assert queue.claim("w1", shard_size=2) == ('post', ['a', 'b'])
+    assert queue.claim("w2", shard_size=2) == ('post', ['c'])
+    assert queue.claim("w3") == (None, [])
+
+    queue.done('post', ['a', 'b'])
+    queue.release('post', ['c'])
+    assert queue.claim("w3") == ('post', ['c'])
+    queue.close()
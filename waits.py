@@ -0,0 +1,180 @@
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+SLEEP = 'sleep'
+READY = 'ready'
+
+
+class LatencyReport:
+    """Accumulates how long a run spent in pacing sleeps versus waiting on page readiness"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Drop everything recorded so far and restart the wall clock, e.g. at the start of a run
+
+        The report is reset in place because the pacing policy, waiter and pooled finders hold it.
+        """
+        with self.lock:
+            self.started = time.time()
+            self.totals = defaultdict(float)
+            self.counts = defaultdict(int)
+
+    def add(self, category, label, seconds):
+        """Record seconds spent in a category ('sleep' or 'ready') under a label"""
+        with self.lock:
+            self.totals[(category, label)] += seconds
+            self.counts[(category, label)] += 1
+
+    @contextmanager
+    def measure(self, category, label):
+        """Time the enclosed block into the report"""
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.add(category, label, time.time() - start)
+
+    def total(self, category):
+        """Return total seconds recorded for a category"""
+        with self.lock:
+            return sum(seconds for (cat, _), seconds in self.totals.items() if cat == category)
+
+    def count(self, category, label):
+        """Return how many calls were recorded under a category and label"""
+        with self.lock:
+            return self.counts.get((category, label), 0)
+
+    def mean(self, category, label):
+        """Return the average seconds per call recorded under a category and label (0 if none)"""
+        with self.lock:
+            count = self.counts.get((category, label), 0)
+            return self.totals[(category, label)] / count if count else 0.0
+
+    def summary(self):
+        """Return totals per category and label along with the run's wall-clock time"""
+        with self.lock:
+            by_label = {
+                f"{category}.{label}": {'seconds': round(seconds, 2), 'count': self.counts[(category, label)]}
+                for (category, label), seconds in sorted(self.totals.items())
+            }
+        return {
+            'wall_seconds': round(time.time() - self.started, 2),
+            'sleep_seconds': round(self.total(SLEEP), 2),
+            'ready_seconds': round(self.total(READY), 2),
+            'by_label': by_label
+        }
+
+    def log(self):
+        """Log the summary at INFO level"""
+        summary = self.summary()
+        wall = summary['wall_seconds'] or 1
+        logger.info(f"Run time {summary['wall_seconds']}s: "
+                    f"sleeping {summary['sleep_seconds']}s ({summary['sleep_seconds'] / wall:.0%}), "
+                    f"waiting on page readiness {summary['ready_seconds']}s ({summary['ready_seconds'] / wall:.0%})")
+        for label, entry in summary['by_label'].items():
+            logger.info(f"   {label}: {entry['seconds']}s over {entry['count']} calls")
+
+
+class PacingPolicy:
+    """Human-like delays between actions, applied separately from page readiness
+
+    Every delay is scaled by `scale`, so pacing can be tuned down (or switched off with 0)
+    without touching the readiness waits.
+    """
+
+    def __init__(self, scale=1.0, after_load=(0.5, 1.5), report=None):
+        self.scale = scale
+        self.after_load = after_load
+        self.report = report
+
+    def pause(self, low, high, label="pacing"):
+        """Sleep for a random duration between low and high seconds, scaled by the policy"""
+        seconds = random.uniform(low, high) * self.scale
+        if seconds <= 0:
+            return 0
+        time.sleep(seconds)
+        if self.report:
+            self.report.add(SLEEP, label, seconds)
+        return seconds
+
+    def settle(self, label):
+        """Apply the post-navigation delay"""
+        return self.pause(*self.after_load, label=label)
+
+
+class PageWaiter:
+    """Navigates and returns as soon as the page is usable instead of sleeping a fixed time"""
+
+    def __init__(self, driver, timeout=15, poll_frequency=0.1, report=None):
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.report = report
+
+    def _wait(self, timeout):
+        return WebDriverWait(self.driver, timeout or self.timeout, poll_frequency=self.poll_frequency)
+
+    def document_ready(self, label, timeout=None):
+        """Wait for document.readyState to reach 'complete'"""
+        start = time.time()
+        try:
+            self._wait(timeout).until(
+                lambda d: d.execute_script("return document.readyState") == "complete")
+            return True
+        except TimeoutException:
+            logger.warning(f"Timed out waiting for document ready on {label}")
+            return False
+        finally:
+            if self.report:
+                self.report.add(READY, label, time.time() - start)
+
+    def until_present(self, xpath, label, timeout=None):
+        """Wait until an element matching xpath exists and return it, or None on timeout"""
+        start = time.time()
+        try:
+            return self._wait(timeout).until(lambda d: (d.find_elements(By.XPATH, xpath) or [None])[0])
+        except TimeoutException:
+            logger.warning(f"Timed out waiting for {label} to become ready")
+            return None
+        finally:
+            if self.report:
+                self.report.add(READY, label, time.time() - start)
+
+    def until(self, condition, label, timeout=None):
+        """Wait for an arbitrary condition(driver), returning its value or None on timeout"""
+        start = time.time()
+        try:
+            return self._wait(timeout).until(condition)
+        except TimeoutException:
+            logger.warning(f"Timed out waiting for {label}")
+            return None
+        finally:
+            if self.report:
+                self.report.add(READY, label, time.time() - start)
+
+    def load(self, url, ready_xpath=None, label="page", timeout=None):
+        """Open url and wait for ready_xpath (or document.readyState when no xpath is given)
+
+        Returns the first matching element, True for a plain readyState wait, or None on timeout.
+        """
+        start = time.time()
+        self.driver.get(url)
+        if self.report:
+            self.report.add(READY, f"{label}.navigate", time.time() - start)
+
+        if ready_xpath is None:
+            return self.document_ready(label, timeout)
+        return self.until_present(ready_xpath, label, timeout)